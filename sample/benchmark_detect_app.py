@@ -0,0 +1,73 @@
+""" mdkapps App判定ベンチマーク
+
+* 旧 import カスケードと detect_app() の起動時間を比較
+* 毎回新しいPythonプロセスで計測する
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+
+SRC_DIR = os.path.abspath(os.path.dirname(__file__) + '/../src')
+REPEAT = 20
+
+CASCADE_CODE = '''
+import time
+_start = time.perf_counter()
+_app = 'standalone'
+for _name in ('bpy', 'c4d', 'hou', 'pymxs', 'maya.cmds', 'nuke'):
+    try:
+        __import__(_name)
+        _app = _name
+        break
+    except ImportError:
+        pass
+print(time.perf_counter() - _start)
+'''
+
+DETECT_CODE = '''
+import sys
+import time
+sys.path.insert(0, {src!r})
+import mdkapps.detect
+_start = time.perf_counter()
+mdkapps.detect.detect_app()
+print(time.perf_counter() - _start)
+'''
+
+
+def measure(code: str, app: str = None) -> list[float]:
+    _env = dict(os.environ)
+    _env.pop('MDK_APP', None)
+
+    if app:
+        _env['MDK_APP'] = app
+
+    _results = []
+    for _ in range(REPEAT):
+        _output = subprocess.check_output([sys.executable, '-c', code], env=_env, text=True)
+        _results.append(float(_output.strip()))
+
+    return _results
+
+
+if __name__ == '__main__':
+    _cascade = measure(CASCADE_CODE)
+    _detect = measure(DETECT_CODE.format(src=SRC_DIR))
+    _override = measure(DETECT_CODE.format(src=SRC_DIR), app='standalone')
+
+    print(f'MDK | python = {sys.executable}')
+    print(f'MDK | repeat = {REPEAT}')
+    print(f'MDK | cascade    median = {statistics.median(_cascade) * 1000:.3f} ms')
+    print(f'MDK | detect_app median = {statistics.median(_detect) * 1000:.3f} ms')
+    print(f'MDK | MDK_APP    median = {statistics.median(_override) * 1000:.3f} ms')
@@ -0,0 +1,79 @@
+""" mdkapps.filetypes ベンチマーク
+
+* 100万パスで旧正規表現判定と filetypes の判定時間を比較
+* 旧判定は mdk_maya.import_file の is_usd -> is_image -> is_maya の順
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import filetypes
+
+
+COUNT = 1_000_000
+
+FILE_FILTER_USD = re.compile(r'.+\.(usd|usdc|usda)')
+FILE_FILTER_IMAGE = re.compile(r'.+\.(png|jpeg|jpg|tif|tiff|exr|tx|hdr)')
+FILE_FILTER_MAYA = re.compile(r'.+\.(ma|mb|abc|fbx|obj)')
+
+EXTS = ['.usd', '.usda', '.exr', '.jpg', '.tif', '.ma', '.mb', '.abc', '.fbx', '.bgeo.sc', '.vdb', '.txt']
+
+
+def create_paths(count: int) -> list[str]:
+    _random = random.Random(0)
+    _paths = []
+
+    for _index in range(count):
+        _depth = _random.randint(3, 10)
+        _dirs = '/'.join(f'dir_{_random.randint(0, 999):03d}' for _ in range(_depth))
+        _ext = _random.choice(EXTS)
+        _frame = f'.{_random.randint(1001, 1200)}' if _index % 3 == 0 else ''
+        _paths.append(f'/proj/show/{_dirs}/asset_{_index}{_frame}{_ext}')
+
+    return _paths
+
+
+def classify_regex(filepath: str) -> str:
+    if FILE_FILTER_USD.match(filepath):
+        return 'usd'
+    elif FILE_FILTER_IMAGE.match(filepath):
+        return 'image'
+    elif FILE_FILTER_MAYA.match(filepath):
+        return 'maya'
+
+
+def classify_table(filepath: str) -> str:
+    return filetypes.get_type(filepath, ('usd', 'image', 'maya'))
+
+
+def measure(func, paths: list[str]) -> float:
+    _start = time.perf_counter()
+    for _path in paths:
+        func(_path)
+
+    return time.perf_counter() - _start
+
+
+if __name__ == '__main__':
+    _paths = create_paths(COUNT)
+
+    _regex = measure(classify_regex, _paths)
+    _table = measure(classify_table, _paths)
+
+    print(f'MDK | paths = {COUNT}')
+    print(f'MDK | regex     = {_regex:.3f} sec')
+    print(f'MDK | filetypes = {_table:.3f} sec')
+    print(f'MDK | speedup   = x{_regex / _table:.2f}')
@@ -0,0 +1,140 @@
+""" mdk_max キャプチャパイプライン ベンチマーク
+
+* pymxs のスタンドイン (FakeRuntime) で比較
+    * max preview : メインスレッドでキャプチャと PNG 圧縮・書き出しを順番に実行
+    * capture_frames : メインスレッドはキャプチャのみ, PNG 圧縮・書き出しはスレッドプール
+* mdk_max.capture_playblast と同じ playblast.capture_frames / images.write_png を使用
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import types
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import images
+from mdkapps import playblast
+
+
+FRAMERANGE = (1001, 1048)
+SIZE = (1280, 720)
+
+# ビューポートのキャプチャ (GPU からの読み出し) にかかる時間
+GRAB_TIME = 0.004
+
+
+class FakeRuntime:
+    """ pymxs.runtime のスタンドイン """
+    def __init__(self, width: int, height: int):
+        _random = random.Random(0)
+        _row = bytes(_random.randrange(256) if _x % 7 else 0 for _x in range(width * 4))
+
+        self.width = width
+        self.height = height
+        self.sliderTime = 0
+        self._pixels = _row * height
+
+
+    def grab(self) -> bytes:
+        """ ビューポートのキャプチャ (BGRX) """
+        time.sleep(GRAB_TIME)
+        _offset = (self.sliderTime * 4) % len(self._pixels)
+
+        return self._pixels[_offset:] + self._pixels[:_offset]
+
+
+    def execute(self, cmd: str):
+        """ 'max preview' のみ対応 (キャプチャと書き出しを順番に実行) """
+        _args = dict(re.findall(r'(\w+):\s*"?([^"\s]+)"?', cmd))
+
+        for _frame in range(int(_args['start']), int(_args['end']) + 1):
+            self.sliderTime = _frame
+            images.write_png(
+                playblast.get_frame_path(_args['filename'], _frame, 'png'),
+                self.width,
+                self.height,
+                self.grab(),
+                mode='BGRX',
+            )
+
+
+def install_fake_pymxs() -> FakeRuntime:
+    _pymxs = types.ModuleType('pymxs')
+    _pymxs.runtime = FakeRuntime(*SIZE)
+    sys.modules['pymxs'] = _pymxs
+
+    return _pymxs.runtime
+
+
+def run_preview(rt: FakeRuntime, filepath: str):
+    rt.execute(f"""
+        max preview
+        outputAVI:false
+        outputImageSeq:true
+        filename:"{filepath}"
+        imageFormat: #png
+        start: {FRAMERANGE[0]}
+        end: {FRAMERANGE[1]}
+    """)
+
+
+def run_capture(rt: FakeRuntime, filepath: str) -> float:
+    """ capture_frames を実行し、メインスレッドがキャプチャに使った時間を返す """
+    _main_thread = [0.0]
+
+    def _capture(frame: int) -> bytes:
+        _start = time.perf_counter()
+        rt.sliderTime = frame
+        _pixels = rt.grab()
+        _main_thread[0] += time.perf_counter() - _start
+
+        return _pixels
+
+    def _write(frame: int, pixels: bytes) -> str:
+        _path = playblast.get_frame_path(filepath, frame, 'png')
+        images.write_png(_path, rt.width, rt.height, pixels, mode='BGRX')
+
+        return _path
+
+    playblast.capture_frames(range(FRAMERANGE[0], FRAMERANGE[1] + 1), _capture, _write)
+
+    return _main_thread[0]
+
+
+def measure(func, *args):
+    _start = time.perf_counter()
+    _result = func(*args)
+
+    return time.perf_counter() - _start, _result
+
+
+if __name__ == '__main__':
+    _rt = install_fake_pymxs()
+    _count = FRAMERANGE[1] - FRAMERANGE[0] + 1
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _preview_time, _ = measure(run_preview, _rt, f'{_dirpath}/preview')
+        _capture_time, _main_time = measure(run_capture, _rt, f'{_dirpath}/capture')
+
+        _preview_size = sum(os.path.getsize(f'{_dirpath}/{_name}') for _name in os.listdir(_dirpath) if _name.startswith('preview'))
+        _capture_size = sum(os.path.getsize(f'{_dirpath}/{_name}') for _name in os.listdir(_dirpath) if _name.startswith('capture'))
+
+    assert _preview_size == _capture_size
+
+    print(f'MDK | frames = {_count}, size = {SIZE[0]}x{SIZE[1]}, cpu = {os.cpu_count()}')
+    print(f'MDK | max preview    = {_preview_time:.3f} sec ({_preview_time / _count * 1000:.1f} ms/frame)')
+    print(f'MDK | capture_frames = {_capture_time:.3f} sec ({_capture_time / _count * 1000:.1f} ms/frame)')
+    print(f'MDK | main thread    = {_main_time:.3f} sec (capture only)')
+    print(f'MDK | speedup        = x{_preview_time / _capture_time:.2f}')
@@ -0,0 +1,77 @@
+""" mdkapps.preflight ベンチマーク
+
+* 1パスずつの os.path.exists と preflight.stat_files の時間を比較
+* NFS の遅延を再現するため os.stat に LATENCY 秒の待ちを入れる
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import preflight
+
+
+COUNT = 300
+LATENCY = 0.01
+
+_os_stat = os.stat
+
+
+def slow_stat(*args, **kwargs):
+    time.sleep(LATENCY)
+    return _os_stat(*args, **kwargs)
+
+
+def check_serial(paths: list[str]) -> int:
+    return sum(os.path.exists(_path) for _path in paths)
+
+
+def check_preflight(paths: list[str]) -> int:
+    return len(preflight.find_existing_files(paths))
+
+
+def measure(func, paths: list[str]):
+    _start = time.perf_counter()
+    _result = func(paths)
+
+    return time.perf_counter() - _start, _result
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _paths = []
+
+        for _index in range(COUNT):
+            _path = os.path.join(_dirpath, f'prop_{_index:03d}.ma')
+            _paths.append(_path)
+
+            # 1割は存在しないファイル
+            if _index % 10:
+                with open(_path, 'wb'):
+                    pass
+
+        os.stat = slow_stat
+
+        try:
+            _serial_time, _serial = measure(check_serial, _paths)
+            _preflight_time, _preflight = measure(check_preflight, _paths)
+            _cached_time, _cached = measure(check_preflight, _paths)
+
+        finally:
+            os.stat = _os_stat
+
+        print(f'MDK | paths = {COUNT}, latency = {LATENCY * 1000:.0f} ms')
+        print(f'MDK | os.path.exists     = {_serial_time:.3f} sec ({_serial} found)')
+        print(f'MDK | preflight          = {_preflight_time:.3f} sec ({_preflight} found)')
+        print(f'MDK | preflight (cached) = {_cached_time:.3f} sec ({_cached} found)')
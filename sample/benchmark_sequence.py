@@ -0,0 +1,78 @@
+""" mdkapps.sequence ベンチマーク
+
+* 10万ファイルのディレクトリで連番検索の時間を比較
+    * glob : glob + 正規表現 + ファイルごとの os.path.isfile
+    * scan_sequences : os.scandir で1回だけ走査
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import glob
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import sequence
+
+
+SEQUENCE_COUNT = 100
+FRAME_COUNT = 1000
+
+FRAME_PATTERN = re.compile(r'^(?P<head>.*?)(?P<frame>\d+)(?P<tail>\.[^.]+)$')
+
+
+def create_files(dirpath: str):
+    for _index in range(SEQUENCE_COUNT):
+        for _frame in range(1001, 1001 + FRAME_COUNT):
+            # 一部のフレームを抜けにする
+            if _frame % 97 == 0:
+                continue
+
+            with open(os.path.join(dirpath, f'render_{_index:03d}.{_frame:04d}.exr'), 'wb'):
+                pass
+
+
+def scan_glob(dirpath: str) -> dict:
+    _groups = {}
+
+    for _filepath in glob.glob(os.path.join(dirpath, '*')):
+        if not os.path.isfile(_filepath):
+            continue
+
+        _match = FRAME_PATTERN.match(os.path.basename(_filepath))
+        if _match:
+            _key = (_match.group('head'), _match.group('tail'))
+            _groups.setdefault(_key, []).append(int(_match.group('frame')))
+
+    return _groups
+
+
+def measure(func, dirpath: str):
+    _start = time.perf_counter()
+    _result = func(dirpath)
+
+    return time.perf_counter() - _start, _result
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as _dirpath:
+        create_files(_dirpath)
+        _count = len(os.listdir(_dirpath))
+
+        _glob_time, _glob_result = measure(scan_glob, _dirpath)
+        _scan_time, _scan_result = measure(sequence.scan_sequences, _dirpath)
+
+        print(f'MDK | files = {_count}')
+        print(f'MDK | glob           = {_glob_time:.3f} sec ({len(_glob_result)} sequences)')
+        print(f'MDK | scan_sequences = {_scan_time:.3f} sec ({len(_scan_result)} sequences)')
+        print(f'MDK | example = {_scan_result[0]!r}')
@@ -0,0 +1,59 @@
+""" maya.cmds のスタブで mdk_maya を読み込むテスト用モジュール
+
+* sys.modules の maya, maya.cmds, maya.mel をスタブに置き換えて mdk_maya を読み込み直す
+  (mdk_maya は読み込み時の maya.cmds を使うため, テストごとに読み込み直す)
+* monkeypatch で置き換えるため, テスト後は sys.modules, MDK_APP を元に戻す
+
+Examples:
+    >>> def test_maya(monkeypatch):
+    ...     _cmds = FakeCmds()
+    ...     mdk_maya = maya_stub.import_mdk_maya(monkeypatch, _cmds)
+    ...     _app = mdk_maya.AppMain()
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import importlib
+import os
+import sys
+import types
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+import mdkapps
+
+
+def import_mdk_maya(monkeypatch, cmds: types.ModuleType, mel: types.ModuleType = None) -> types.ModuleType:
+    """ maya.cmds のスタブで mdk_maya を読み込み直す
+
+    Args:
+        monkeypatch(pytest.MonkeyPatch): テスト後に元に戻すための monkeypatch
+        cmds(types.ModuleType): maya.cmds のスタブ
+        mel(types.ModuleType, optional): maya.mel のスタブ
+
+    Returns:
+        types.ModuleType: mdkapps.mdk_maya
+    """
+    _maya = types.ModuleType('maya')
+    _maya.__path__ = []
+    _maya.cmds = cmds
+    _maya.mel = mel or types.ModuleType('maya.mel')
+
+    monkeypatch.setitem(sys.modules, 'maya', _maya)
+    monkeypatch.setitem(sys.modules, 'maya.cmds', _maya.cmds)
+    monkeypatch.setitem(sys.modules, 'maya.mel', _maya.mel)
+    monkeypatch.setenv('MDK_APP', 'maya')
+
+    # 読み込み済みの mdk_maya を外す (テスト後は元に戻す, 読み込まれていなければ削除する)
+    # * mdkapps.__getattr__ でバックエンドを読み込まないように vars(mdkapps) を直接置き換える
+    for _dict, _key in ((sys.modules, 'mdkapps.mdk_maya'), (vars(mdkapps), 'mdk_maya')):
+        monkeypatch.setitem(_dict, _key, None)
+        monkeypatch.delitem(_dict, _key)
+
+    return importlib.import_module('mdkapps.mdk_maya')
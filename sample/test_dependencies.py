@@ -0,0 +1,196 @@
+""" mdkapps.dependencies テスト
+
+* 同じファイルを参照する複数ノードを1つにまとめる
+* 連番のフレーム・パターン ('####', '<UDIM>') を1つの FileDependency にまとめる
+* missing (抜けているフレームを含む), empty, stale を判定
+* ノード数の多いシーンを想定したベンチマーク
+* mdk_maya.collect_file_dependencies() : maya.cmds のスタブでシーン全体の走査を確認
+    * file ノードの '<f>' の連番はフレーム番号の桁数を合わせる
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import tempfile
+import time
+import types
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import dependencies
+
+import maya_stub
+
+
+NODE_COUNT = 20000
+
+
+def touch(filepath: str, data: bytes = b'data', mtime: float = None):
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+    with open(filepath, 'wb') as _file:
+        _file.write(data)
+
+    if mtime is not None:
+        os.utime(filepath, (mtime, mtime))
+
+
+class FakeCmds(types.ModuleType):
+    """ maya.cmds のスタブ (ls の回数を記録) """
+    def __init__(self, dirpath: str):
+        super().__init__('maya.cmds')
+        self.ls_count = 0
+        self.nodes = {
+            'file': ['|diffuse_file', '|spec_file', '|plate_file'],
+            'AlembicNode': ['|chara_abc'],
+            'reference': ['|charaRN'],
+        }
+        self.attrs = {
+            '|diffuse_file.uvTilingMode': 3,
+            '|diffuse_file.useFrameExtension': False,
+            '|diffuse_file.fileTextureNamePattern': f'{dirpath}/tex/diffuse.<UDIM>.exr',
+            '|spec_file.uvTilingMode': 0,
+            '|spec_file.useFrameExtension': False,
+            '|spec_file.fileTextureName': f'{dirpath}/tex/spec.exr',
+            '|plate_file.uvTilingMode': 0,
+            '|plate_file.useFrameExtension': True,
+            '|plate_file.fileTextureNamePattern': f'{dirpath}/plate/plate.<f>.exr',
+            '|plate_file.fileTextureName': f'{dirpath}/plate/plate.0001.exr',
+            '|chara_abc.abc_File': f'{dirpath}/cache/chara.abc',
+        }
+        self.references = {'|charaRN': f'{dirpath}/asset/chara.ma'}
+
+    def allNodeTypes(self):
+        return ['file', 'imagePlane', 'AlembicNode', 'reference']
+
+    def file(self, q=True, sceneName=True):
+        return ''
+
+    def getAttr(self, attr):
+        return self.attrs[attr]
+
+    def ls(self, type=None, long=True):
+        self.ls_count += 1
+        return list(self.nodes.get(type, []))
+
+    def referenceQuery(self, node, filename=True, withoutCopyNumber=True):
+        return self.references[node]
+
+
+def write_files(dirpath: str) -> float:
+    """ テスト用のファイルを作成
+
+    Returns:
+        float: シーンの保存時刻 (これより新しいファイルは stale)
+    """
+    _scene_time = time.time() - 100
+    _old = _scene_time - 100
+
+    for _tile in (1001, 1002, 1003):
+        touch(f'{dirpath}/tex/diffuse.{_tile}.exr', mtime=_old)
+
+    for _frame in (1001, 1002, 1004):
+        touch(f'{dirpath}/cache/fx.{_frame:04d}.bgeo.sc', mtime=_old)
+
+    for _frame in (1, 2, 3):
+        touch(f'{dirpath}/plate/plate.{_frame:04d}.exr', mtime=_old)
+
+    touch(f'{dirpath}/cache/chara.abc')
+    touch(f'{dirpath}/cache/empty.abc', data=b'', mtime=_old)
+
+    return _scene_time
+
+
+def test_collect_dependencies(tmp_path):
+    _dirpath = str(tmp_path)
+    _scene_time = write_files(_dirpath)
+
+    _entries = [
+        ('file', 'diffuse1', f'{_dirpath}/tex/diffuse.<UDIM>.exr'),
+        ('file', 'diffuse2', f'{_dirpath}/tex/diffuse.<UDIM>.exr'),
+        ('file', 'missing_tex', f'{_dirpath}/tex/missing.exr'),
+        ('filecache::2.0', 'fx_cache', f'{_dirpath}/cache/fx.####.bgeo.sc'),
+        ('AlembicNode', 'chara_abc', f'{_dirpath}/cache/chara.abc'),
+        ('AlembicNode', 'empty_abc', f'{_dirpath}/cache/empty.abc'),
+        ('imagePlane', 'plate1', f'{_dirpath}/plate/plate.0001.exr'),
+        ('imagePlane', 'plate2', f'{_dirpath}/plate/plate.0002.exr'),
+        ('imagePlane', 'plate3', f'{_dirpath}/plate/plate.0003.exr'),
+        ('file', 'no_path', ''),
+    ]
+
+    _report = dependencies.collect_dependencies(_entries, stale_time=_scene_time)
+    _dict = {os.path.relpath(_dependency.path, _dirpath): _dependency for _dependency in _report}
+
+    for _path, _dependency in _dict.items():
+        print(f'MDK | {_path} = {_dependency.status} {_dependency.nodes}')
+
+    assert list(_dict) == [
+        'tex/diffuse.<UDIM>.exr',
+        'tex/missing.exr',
+        'cache/fx.####.bgeo.sc',
+        'cache/chara.abc',
+        'cache/empty.abc',
+        'plate/plate.####.exr',
+    ], list(_dict)
+
+    assert _dict['tex/diffuse.<UDIM>.exr'].nodes == {'file': ['diffuse1', 'diffuse2']}
+    assert _dict['tex/diffuse.<UDIM>.exr'].status == 'ok'
+    assert _dict['tex/missing.exr'].status == 'missing'
+    assert [os.path.basename(_path) for _path in _dict['cache/fx.####.bgeo.sc'].missing_files] == ['fx.1003.bgeo.sc']
+    assert _dict['cache/chara.abc'].status == 'stale'
+    assert _dict['cache/empty.abc'].status == 'empty'
+    assert _dict['plate/plate.####.exr'].nodes == {'imagePlane': ['plate1', 'plate2', 'plate3']}
+    assert list(_report.by_type()) == ['file', 'filecache::2.0', 'AlembicNode', 'imagePlane']
+
+    _summary = _report.summary()
+    assert (_summary['missing'], _summary['empty'], _summary['stale']) == (2, 1, 1), _summary
+
+    # ノード数の多いシーン (同じテクスチャを多数のノードが参照)
+    _entries = [
+        ('file', f'file{_index}', f'{_dirpath}/tex/diffuse.<UDIM>.exr' if _index % 2 else f'{_dirpath}/cache/chara.abc')
+        for _index in range(NODE_COUNT)
+    ]
+
+    _report = dependencies.collect_dependencies(_entries)
+    assert len(_report) == 2 and _report.ok
+
+    print(f'MDK | {NODE_COUNT} nodes = {_report.summary()}')
+
+
+def test_maya(tmp_path, monkeypatch):
+    _dirpath = str(tmp_path)
+    write_files(_dirpath)
+
+    _cmds = FakeCmds(_dirpath)
+    mdk_maya = maya_stub.import_mdk_maya(monkeypatch, _cmds)
+    _report = mdk_maya.AppMain().collect_file_dependencies()
+
+    assert _cmds.ls_count == 4, _cmds.ls_count
+    assert list(_report.by_type()) == ['file', 'AlembicNode', 'reference']
+    assert [os.path.basename(_dependency.path) for _dependency in _report.missing] == ['spec.exr', 'chara.ma']
+    assert _report.dependencies[0].sequence.frames == [1001, 1002, 1003]
+
+    # '<f>' の連番は桁数を合わせて確認 ('plate.0001.exr')
+    _plate = _report.dependencies[2]
+    assert _plate.sequence.frames == [1, 2, 3] and _plate.status == 'ok', _plate.missing_files
+
+    print(f'MDK | maya = {_report}')
+
+
+if __name__ == '__main__':
+    import pytest
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        test_collect_dependencies(_dirpath)
+
+    with tempfile.TemporaryDirectory() as _dirpath, pytest.MonkeyPatch.context() as _monkeypatch:
+        test_maya(_dirpath, _monkeypatch)
+
+    print('MDK | OK')
@@ -0,0 +1,98 @@
+""" バックエンドの自動判定テスト
+
+* find_spec で見つかっても import できない App API (App 外の Python で PYTHONPATH に hou がある場合) は
+  次の候補, standalone を使う
+* MDK_APP で指定した場合は ImportError
+* 組み込みのバックエンドが見つからない場合はエントリポイントのバックエンドも判定
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+
+SRC_DIRPATH = os.path.abspath(os.path.dirname(__file__)+'/../src')
+
+SCRIPT = """
+import mdkapps
+print(mdkapps.get_backend().name, mdkapps.APP, type(mdkapps.AppMain()).__module__)
+"""
+
+
+def run_python(dirpath: str, env: dict = None) -> subprocess.CompletedProcess:
+    """ import できない 'hou' パッケージを PYTHONPATH に置いて実行 """
+    os.makedirs(f'{dirpath}/hou', exist_ok=True)
+
+    with open(f'{dirpath}/hou/__init__.py', 'w') as _file:
+        _file.write("raise ImportError('hou is only available in Houdini')\n")
+
+    _env = {_key: _value for _key, _value in os.environ.items() if _key != 'MDK_APP'}
+    _env.update(env or {})
+    _env['PYTHONPATH'] = os.pathsep.join([dirpath, SRC_DIRPATH])
+
+    return subprocess.run([sys.executable, '-c', SCRIPT], env=_env, capture_output=True, text=True)
+
+
+def write_entry_point(dirpath: str):
+    """ エントリポイント (mdkapps.backends) の外部バックエンド 'katana' を作成 """
+    os.makedirs(f'{dirpath}/mdk_katana-0.1.dist-info', exist_ok=True)
+
+    with open(f'{dirpath}/mdk_katana-0.1.dist-info/METADATA', 'w') as _file:
+        _file.write('Metadata-Version: 2.1\nName: mdk-katana\nVersion: 0.1\n')
+
+    with open(f'{dirpath}/mdk_katana-0.1.dist-info/entry_points.txt', 'w') as _file:
+        _file.write('[mdkapps.backends]\nkatana = mdk_katana:BACKEND\n')
+
+    with open(f'{dirpath}/Katana.py', 'w') as _file:
+        _file.write('')
+
+    with open(f'{dirpath}/mdk_katana.py', 'w') as _file:
+        _file.write(
+            'from mdkapps import registry\n'
+            'BACKEND = registry.Backend("katana", probe=("Katana",), module="mdk_katana")\n'
+            'class AppMain:\n'
+            '    pass\n'
+        )
+
+
+def test_detect_fallback(tmp_path):
+    _proc = run_python(str(tmp_path))
+
+    assert _proc.returncode == 0, _proc.stderr
+    assert _proc.stdout.splitlines()[-1].split() == ['standalone', 'standalone', 'mdkapps.mdk_standalone'], _proc.stdout
+
+    print(f'MDK | fallback = {_proc.stdout.splitlines()[-1]}')
+
+
+def test_entry_point_backend(tmp_path):
+    write_entry_point(str(tmp_path))
+    _proc = run_python(str(tmp_path))
+
+    assert _proc.returncode == 0, _proc.stderr
+    assert _proc.stdout.splitlines()[-1].split() == ['katana', 'katana', 'mdk_katana'], _proc.stdout
+
+
+def test_forced_app(tmp_path):
+    _proc = run_python(str(tmp_path), env={'MDK_APP': 'houdini'})
+
+    assert _proc.returncode != 0 and 'ImportError' in _proc.stderr, _proc.stderr
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as _dirpath:
+        test_detect_fallback(_dirpath)
+        test_forced_app(_dirpath)
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        test_entry_point_backend(_dirpath)
+
+    print('MDK | OK')
@@ -0,0 +1,291 @@
+""" mdkapps.encode テスト
+
+* 書き出し中の PNG 連番を SequenceEncoder で AVI にエンコード
+* 最後のフレームを待たずにエンコードが始まることと、AVI の構造 (フレーム数, idx1) を確認
+* 同じ連番に上書きする場合に前回のフレームを読み込まないことを確認
+* FrameEncoder : 順不同に書き出すスレッドプール (playblast.capture_frames) から
+  メモリ上のフレームをフレーム順にエンコード (mdk_max.capture_playblast と同じ流れ)
+* FFmpegEncoder : stderr の出力が多くても止まらないこと, cancel() で ffmpeg を終了して途中のファイルを削除することを
+  ffmpeg の代わりのスクリプトで確認
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import random
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import encode
+from mdkapps import playblast
+
+
+FRAMES = range(1001, 1049)
+SIZE = (64, 36)
+INTERVAL = 0.01
+
+
+def create_png(width: int, height: int, value: int) -> bytes:
+    """ 単色の PNG """
+    def _chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+    _row = b'\0' + bytes((value, value, value)) * width
+    _ihdr = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+
+    return (
+        encode.PNG_SIGNATURE
+        + _chunk(b'IHDR', _ihdr)
+        + _chunk(b'IDAT', zlib.compress(_row * height))
+        + _chunk(b'IEND', b'')
+    )
+
+
+class RecordingEncoder(encode.AviEncoder):
+    """ 最初のフレームを書き込んだ時刻とデータを記録 """
+    first_write = None
+    first_data = None
+
+    def write(self, data: bytes):
+        if self.first_write is None:
+            self.first_write = time.perf_counter()
+            self.first_data = data
+
+        super().write(data)
+
+
+def read_avi(filepath: str) -> dict:
+    """ AVI のヘッダーとインデックスを読み込み """
+    with open(filepath, 'rb') as _file:
+        _data = _file.read()
+
+    assert _data[:4] == b'RIFF' and _data[8:12] == b'AVI '
+    assert struct.unpack('<I', _data[4:8])[0] == len(_data) - 8
+
+    _avih = _data.index(b'avih') + 8
+    _strh = _data.index(b'strh') + 8
+    _movi = _data.index(b'movi')
+    _idx1 = _data.index(b'idx1')
+
+    _index = [
+        struct.unpack('<4sIII', _data[_idx1 + 8 + _pos:_idx1 + 24 + _pos])
+        for _pos in range(0, struct.unpack('<I', _data[_idx1 + 4:_idx1 + 8])[0], 16)
+    ]
+
+    for _fourcc, _, _offset, _size in _index:
+        assert _data[_movi + _offset:_movi + _offset + 4] == _fourcc
+        assert _data[_movi + _offset + 8:_movi + _offset + 16] == encode.PNG_SIGNATURE
+
+    return {
+        'frames': struct.unpack('<I', _data[_avih + 16:_avih + 20])[0],
+        'size': struct.unpack('<II', _data[_avih + 32:_avih + 40]),
+        'handler': _data[_strh + 4:_strh + 8],
+        'length': struct.unpack('<I', _data[_strh + 32:_strh + 36])[0],
+        'index': len(_index),
+    }
+
+
+class ListEncoder:
+    """ フレームをリストに記録するエンコーダ """
+    def __init__(self):
+        self.frames = []
+
+    def write(self, data: bytes):
+        self.frames.append(data)
+
+    def close(self) -> str:
+        return 'memory'
+
+
+def test_frame_encoder():
+    _random = random.Random(0)
+    _encoder = ListEncoder()
+    _frame_data = {}
+
+    def _capture(frame: int) -> bytes:
+        return create_png(*SIZE, frame % 256)
+
+    def _write(frame: int, data: bytes) -> str:
+        # 書き出しの完了は順不同
+        time.sleep(_random.random() * INTERVAL)
+        _frame_data[frame] = data
+
+        return os.devnull
+
+    with encode.FrameEncoder(encoder=_encoder, queue_size=4) as _frame_encoder:
+        playblast.capture_frames(
+            FRAMES,
+            _capture,
+            _write,
+            max_workers=4,
+            callback=lambda result: _frame_encoder.put(_frame_data.pop(result.frame)),
+        )
+
+    assert _encoder.frames == [create_png(*SIZE, _frame % 256) for _frame in FRAMES]
+    assert not _frame_data
+
+    print(f'MDK | frame encoder = {len(_encoder.frames)} frames in order')
+
+
+# ffmpeg の代わり (stderr にパイプのバッファより多く出力してから stdin を出力ファイルに書き出す)
+FAKE_FFMPEG = '''#!{python}
+import sys
+import time
+
+sys.stderr.write('warning\\n' * 100000)
+sys.stderr.flush()
+
+with open(sys.argv[-1], 'wb') as _file:
+    for _data in iter(lambda: sys.stdin.buffer.read(65536), b''):
+        _file.write(_data)
+        _file.flush()
+
+if 'fail' in sys.argv[-1]:
+    sys.exit(1)
+'''
+
+
+def write_fake_ffmpeg(dirpath: str) -> str:
+    _filepath = os.path.join(dirpath, 'ffmpeg')
+
+    with open(_filepath, 'w') as _file:
+        _file.write(FAKE_FFMPEG.format(python=sys.executable))
+
+    os.chmod(_filepath, 0o755)
+    return _filepath
+
+
+def run_with_timeout(func, timeout: float = 10.0):
+    """ 別スレッドで実行して、止まった場合はエラー """
+    _result = []
+    _thread = threading.Thread(target=lambda: _result.append(func()), daemon=True)
+    _thread.start()
+    _thread.join(timeout)
+
+    assert not _thread.is_alive(), f'{func} is blocked'
+    return _result[0] if _result else None
+
+
+def test_ffmpeg_encoder(tmp_path):
+    _ffmpeg = write_fake_ffmpeg(str(tmp_path))
+    # ffmpeg の代わりのスクリプトはフレームを確認しないため、パイプのバッファより大きいデータを渡す
+    _frames = [os.urandom(65536) for _ in range(16)]
+
+    def _encode(filepath: str) -> str:
+        with encode.FFmpegEncoder(filepath, ffmpeg=_ffmpeg) as _encoder:
+            for _data in _frames:
+                _encoder.write(_data)
+
+        return _encoder.filepath
+
+    # stderr の出力が多くても止まらない
+    _filepath = run_with_timeout(lambda: _encode(f'{tmp_path}/shot.mp4'))
+
+    with open(_filepath, 'rb') as _file:
+        assert _file.read() == b''.join(_frames)
+
+    try:
+        _encode(f'{tmp_path}/fail.mp4')
+        raise AssertionError('ffmpeg error is not detected')
+
+    except RuntimeError as ex:
+        assert 'warning' in str(ex)
+
+    # cancel() は ffmpeg を終了して途中のファイルを削除 (close() で動画を完成させない)
+    _encoder = encode.FFmpegEncoder(f'{tmp_path}/cancel.mp4', ffmpeg=_ffmpeg)
+    _frame_encoder = encode.FrameEncoder(encoder=_encoder, queue_size=4)
+    _frame_encoder.start()
+
+    for _data in _frames[:8]:
+        _frame_encoder.put(_data)
+
+    run_with_timeout(_frame_encoder.cancel)
+
+    assert _encoder._proc.returncode is not None
+    assert _frame_encoder.output is None
+    assert not os.path.exists(f'{tmp_path}/cancel.mp4')
+
+    print(f'MDK | ffmpeg = {len(_frames)} frames, cancel = ffmpeg returncode {_encoder._proc.returncode}')
+
+
+def write_frames(paths: list[str], offset: int = 0):
+    """ プレイブラストの代わりに一定間隔でフレームを書き出し """
+    for _index, _path in enumerate(paths):
+        with open(_path, 'wb') as _file:
+            _file.write(create_png(*SIZE, (offset + _index * 4) % 256))
+
+        time.sleep(INTERVAL)
+
+
+if __name__ == '__main__':
+    test_frame_encoder()
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        test_ffmpeg_encoder(_dirpath)
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _paths = encode.get_frame_paths(f'{_dirpath}/shot.$F4.png', FRAMES)
+        _encoder = RecordingEncoder(f'{_dirpath}/shot.avi', fps=24)
+
+        _producer = threading.Thread(target=write_frames, args=(_paths,))
+
+        with encode.SequenceEncoder(_paths, encoder=_encoder, queue_size=4) as _sequence_encoder:
+            _producer.start()
+            _producer.join()
+            _last_write = time.perf_counter()
+
+        _info = read_avi(_sequence_encoder.output)
+
+        assert _info == {
+            'frames': len(FRAMES),
+            'size': SIZE,
+            'handler': b'MPNG',
+            'length': len(FRAMES),
+            'index': len(FRAMES),
+        }, _info
+        assert _encoder.first_write < _last_write
+
+        print(f'MDK | avi = {_info}')
+        print(f'MDK | encode started {(_last_write - _encoder.first_write) * 1000:.0f} ms before the last frame')
+
+        # 同じ連番に上書きする場合は前回のフレームを読み込まない
+        _encoder = RecordingEncoder(f'{_dirpath}/rerun.avi', fps=24)
+        _producer = threading.Thread(target=write_frames, args=(_paths, 128))
+
+        with encode.SequenceEncoder(_paths, encoder=_encoder, queue_size=4):
+            time.sleep(INTERVAL * 4)
+            assert _encoder.frame_count == 0, _encoder.frame_count
+
+            _producer.start()
+            _producer.join()
+
+        assert _encoder.frame_count == len(FRAMES)
+
+        with open(_paths[0], 'rb') as _file:
+            assert _encoder.first_data == _file.read()
+
+        print('MDK | rerun = old frames are not read')
+
+        # 抜けフレームはエラー
+        os.remove(_paths[10])
+
+        try:
+            encode.encode_sequence(_paths, f'{_dirpath}/missing.avi')
+            raise AssertionError('missing frame is not detected')
+
+        except FileNotFoundError as ex:
+            print(f'MDK | missing = {ex}')
+
+    print('MDK | OK')
@@ -0,0 +1,115 @@
+""" mdkapps.manifest テスト
+
+* run_exports() でヒット・ミスを確認
+    * 1回目 : すべて書き出し (new)
+    * 2回目 : 入力が同じならスキップ (hit)
+    * シーンの内容・フレーム範囲・出力ファイルが変わった場合は書き出し
+    * 出力の更新日時だけ変わった場合はハッシュで確認してスキップ
+    * シーンを同じ内容で保存し直した場合 (更新日時だけ変わった) はスキップ
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import manifest
+
+
+ASSETS = ['chara', 'prop', 'set']
+
+
+def create_jobs(dirpath: str, scene: str, framerange=(1001, 1100)) -> list[dict]:
+    _source = manifest.get_source_inputs(scene)
+
+    return [
+        {
+            'filepath': f'{dirpath}/cache/{_name}.abc',
+            'inputs': dict(_source, nodes=[f'|{_name}'], framerange=list(framerange), options={'abc': '-uvWrite'}),
+        }
+        for _name in ASSETS
+    ]
+
+
+def get_reasons(report: manifest.ExportReport) -> list[str]:
+    return [_result.reason for _result in report.results]
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _scene = f'{_dirpath}/shot.ma'
+        os.makedirs(f'{_dirpath}/cache')
+
+        with open(_scene, 'w') as _file:
+            _file.write('scene v1')
+
+        _exported = []
+
+        def _export(job: dict):
+            _exported.append(os.path.basename(job['filepath']))
+
+            with open(job['filepath'], 'wb') as _file:
+                _file.write(b'abc' * 1000)
+
+        _report = manifest.run_exports(create_jobs(_dirpath, _scene), _export)
+        assert get_reasons(_report) == ['new'] * 3, _report.results
+
+        _exported.clear()
+        _report = manifest.run_exports(create_jobs(_dirpath, _scene), _export)
+        assert get_reasons(_report) == ['hit'] * 3 and not _exported, _report.results
+        print(f'MDK | unchanged = {_report.summary()}')
+
+        # フレーム範囲が変わった
+        _jobs = create_jobs(_dirpath, _scene)
+        _jobs[0]['inputs']['framerange'] = [1001, 1200]
+        _report = manifest.run_exports(_jobs, _export)
+        assert get_reasons(_report) == ['inputs', 'hit', 'hit'], _report.results
+
+        # 出力が書き換えられた / 更新日時だけ変わった
+        with open(f'{_dirpath}/cache/prop.abc', 'wb') as _file:
+            _file.write(b'xyz' * 1000)
+
+        os.utime(f'{_dirpath}/cache/set.abc', (1, 1))
+
+        _report = manifest.run_exports(_jobs, _export)
+        assert get_reasons(_report) == ['hit', 'output', 'hit'], _report.results
+
+        # シーンを同じ内容で保存し直した (更新日時だけ変わった)
+        with open(_scene, 'w') as _file:
+            _file.write('scene v1')
+
+        os.utime(_scene, (os.path.getmtime(_scene) + 10, os.path.getmtime(_scene) + 10))
+
+        _jobs = create_jobs(_dirpath, _scene)
+        _jobs[0]['inputs']['framerange'] = [1001, 1200]
+        _report = manifest.run_exports(_jobs, _export)
+        assert get_reasons(_report) == ['hit'] * 3, _report.results
+
+        # シーンの内容が変わった (更新日時を戻してもハッシュで検出)
+        _mtime = os.path.getmtime(_scene)
+
+        with open(_scene, 'w') as _file:
+            _file.write('scene v2')
+
+        os.utime(_scene, (_mtime, _mtime))
+
+        _report = manifest.run_exports(create_jobs(_dirpath, _scene), _export)
+        assert get_reasons(_report) == ['inputs'] * 3, _report.results
+
+        # 入力を確定できない (未保存) / force
+        _jobs = create_jobs(_dirpath, _scene)
+        _jobs[0]['inputs'] = None
+        _report = manifest.run_exports(_jobs, _export, force=True)
+        assert get_reasons(_report) == ['unsaved', 'force', 'force'], _report.results
+        print(f'MDK | forced    = {_report.summary()}')
+
+    print('MDK | OK')
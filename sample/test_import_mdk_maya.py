@@ -0,0 +1,117 @@
+""" mdk_maya インポートテスト
+
+* maya.cmds / maya.mel のスタブで mdk_maya を読み込み
+* mdk_maya と先頭で読み込むモジュールで renderSetup, mayaUsd, Qt, numpy
+  などが読み込まれないことを確認
+* pytest では別プロセスで実行する (sys.modules のキャッシュを避けるため)
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import subprocess
+import sys
+import time
+import types
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+
+HEAVY_MODULES = (
+    'maya.app.renderSetup.model.renderSetup',
+    'maya.OpenMayaUI',
+    'mayaUsd',
+    'mayaUsd_createStageWithNewLayer',
+    'ufe',
+    'PySide6',
+    'qtpy',
+    'shiboken2',
+    'shiboken6',
+    'numpy',
+    'PIL',
+    'pxr',
+)
+
+# mdk_maya が先頭で読み込むモジュール
+EAGER_MODULES = (
+    'mdkapps.dependencies',
+    'mdkapps.encode',
+    'mdkapps.filetypes',
+    'mdkapps.manifest',
+    'mdkapps.playblast',
+    'mdkapps.preflight',
+    'mdkapps.scene',
+    'mdkapps.sequence',
+    'mdkapps.workers',
+    'mdkapps.mdk_maya.worker',
+)
+
+
+def install_stub_modules():
+    """ maya.cmds / maya.mel のスタブを登録 """
+    _maya = types.ModuleType('maya')
+    _maya.__path__ = []
+    _cmds = types.ModuleType('maya.cmds')
+    _mel = types.ModuleType('maya.mel')
+
+    _maya.cmds = _cmds
+    _maya.mel = _mel
+
+    sys.modules['maya'] = _maya
+    sys.modules['maya.cmds'] = _cmds
+    sys.modules['maya.mel'] = _mel
+
+
+def check_import():
+    """ mdk_maya の読み込み時間と重いモジュールを確認 """
+    os.environ['MDK_APP'] = 'maya'
+    install_stub_modules()
+
+    import mdkapps
+    assert 'mdkapps.mdk_maya' not in sys.modules
+
+    _start = time.perf_counter()
+    import mdkapps.mdk_maya
+    _time = time.perf_counter() - _start
+
+    _missing = [_name for _name in EAGER_MODULES if _name not in sys.modules]
+    _loaded = [_name for _name in HEAVY_MODULES if _name in sys.modules]
+
+    print(f'MDK | app = {mdkapps.APP}')
+    print(f'MDK | mdk_maya import time = {_time * 1000:.3f} ms')
+    print(f'MDK | heavy modules = {_loaded}')
+
+    assert mdkapps.APP == 'maya'
+    assert mdkapps.get_module('maya') is sys.modules['mdkapps.mdk_maya']
+    assert not _missing, _missing
+    assert not _loaded, _loaded
+
+    # 遅延読み込みの確認
+    _render_setup = types.ModuleType('maya.app.renderSetup.model.renderSetup')
+    sys.modules['maya.app.renderSetup.model.renderSetup'] = _render_setup
+
+    from mdkapps import mdk_maya
+    assert mdk_maya.renderSetup is _render_setup
+    assert mdk_maya.load_module('renderSetup') is _render_setup
+
+
+def test_import_mdk_maya():
+    _result = subprocess.run(
+        [sys.executable, __file__],
+        capture_output=True,
+        text=True,
+    )
+
+    assert _result.returncode == 0, _result.stderr
+    assert 'MDK | OK' in _result.stdout
+
+
+if __name__ == '__main__':
+    check_import()
+    print('MDK | OK')
@@ -0,0 +1,109 @@
+""" UDIMテクスチャのインポートテスト
+
+* sequence.collapse(udim=True) : UDIMタイルの番号 ('tex.1001.exr' ~ 'tex.1010.exr') を UDIM にまとめる
+* mdk_maya.import_files() : maya.cmds のスタブで uvTilingMode を設定し、フレームのエクスプレッションを作らないことを確認
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import tempfile
+import types
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import sequence
+
+import maya_stub
+
+
+class FakeCmds(types.ModuleType):
+    """ maya.cmds のスタブ (setAttr, expression を記録) """
+    def __init__(self):
+        super().__init__('maya.cmds')
+        self.attrs = {}
+        self.expressions = []
+        self.nodes = 0
+
+    def connectAttr(self, *args, **kwargs):
+        pass
+
+    def expression(self, s=None, object=None, alwaysEvaluate=False):
+        self.expressions.append(s)
+
+    def setAttr(self, attr, value, type=None):
+        self.attrs[attr] = value
+
+    def shadingNode(self, node_type, asShader=False, asUtility=False):
+        self.nodes += 1
+        return f'{node_type}{self.nodes}'
+
+    def undoInfo(self, openChunk=False, closeChunk=False, chunkName=None):
+        pass
+
+
+def write_files(dirpath: str) -> list[str]:
+    """ UDIMタイル (tex.1001.exr ~ tex.1010.exr) を作成 """
+    _filepath_list = [f'{dirpath}/tex.{_tile}.exr' for _tile in range(1001, 1011)]
+
+    for _filepath in _filepath_list:
+        with open(_filepath, 'wb'):
+            pass
+
+    return _filepath_list
+
+
+def test_collapse_udim(tmp_path):
+    _filepath_list = write_files(str(tmp_path))
+
+    # 番号だけではフレームと区別できないため、udim=True の場合のみ UDIM
+    _sequence, = sequence.collapse(_filepath_list)
+    assert not _sequence.udim
+
+    _sequence, = sequence.collapse(_filepath_list, udim=True)
+    assert _sequence.udim and len(_sequence) == 10, _sequence
+    assert _sequence.pattern() == f'{tmp_path}/tex.<UDIM>.exr'
+
+    assert sequence.is_udim_tiles([1001, 1002, 1011, 1012], 4)
+    assert not sequence.is_udim_tiles([1, 2, 3], 4)
+    assert not sequence.is_udim_tiles([1001, 2001], 4)
+    assert not sequence.is_udim_tiles([1001, 1002], 5)
+
+
+def test_maya(tmp_path, monkeypatch):
+    _filepath_list = write_files(str(tmp_path))
+
+    _cmds = FakeCmds()
+    mdk_maya = maya_stub.import_mdk_maya(monkeypatch, _cmds)
+    _app = mdk_maya.AppMain()
+
+    _tasks = _app.get_import_tasks(_filepath_list)
+    assert [_filepath for _filepath, _ in _tasks] == [f'{tmp_path}/tex.<UDIM>.exr'], _tasks
+
+    for _, _task in _tasks:
+        _task()
+
+    assert _cmds.attrs['file1.fileTextureName'] == f'{tmp_path}/tex.<UDIM>.exr'
+    assert _cmds.attrs['file1.uvTilingMode'] == 3
+    assert 'file1.useFrameExtension' not in _cmds.attrs and not _cmds.expressions, _cmds.expressions
+
+    print(f'MDK | maya texture = {_cmds.attrs["file1.fileTextureName"]}')
+
+
+if __name__ == '__main__':
+    import pytest
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        test_collapse_udim(_dirpath)
+
+    with tempfile.TemporaryDirectory() as _dirpath, pytest.MonkeyPatch.context() as _monkeypatch:
+        test_maya(_dirpath, _monkeypatch)
+
+    print('MDK | OK')
@@ -0,0 +1,71 @@
+""" mdkapps.playblast マニフェストテスト
+
+* 描画済みのフレームを記録し、抜け・サイズ違い・フィンガープリント違いのフレームだけが
+  再描画対象になることを確認
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import playblast
+
+
+FRAMERANGE = (1001, 1100)
+EXT = 'jpg'
+
+
+def render(prefix: str, ranges: list[tuple[int, int]]):
+    """ プレイブラストの代わりにダミーのフレームを書き出し """
+    for _start, _end in ranges:
+        for _frame in range(_start, _end + 1):
+            with open(playblast.get_frame_path(prefix, _frame, EXT), 'wb') as _file:
+                _file.write(b'frame')
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _prefix = f'{_dirpath}/shot'
+        _fingerprint = playblast.make_fingerprint(scene='shot.ma', mtime=1.0, camera='shotCam', size=(1920, 1080))
+
+        # 1回目はすべて描画
+        _ranges = playblast.get_stale_ranges(_prefix, EXT, FRAMERANGE, _fingerprint)
+        assert _ranges == [FRAMERANGE], _ranges
+
+        render(_prefix, _ranges)
+        playblast.update_manifest(_prefix, EXT, range(FRAMERANGE[0], FRAMERANGE[1] + 1), _fingerprint)
+
+        # 変更なし
+        _ranges = playblast.get_stale_ranges(_prefix, EXT, FRAMERANGE, _fingerprint)
+        assert _ranges == [], _ranges
+
+        # 抜けフレームと壊れたフレーム
+        os.remove(playblast.get_frame_path(_prefix, 1010, EXT))
+
+        with open(playblast.get_frame_path(_prefix, 1050, EXT), 'wb'):
+            pass
+
+        _ranges = playblast.get_stale_ranges(_prefix, EXT, FRAMERANGE, _fingerprint)
+        assert _ranges == [(1010, 1010), (1050, 1050)], _ranges
+        print(f'MDK | stale (missing, empty) = {_ranges}')
+
+        # 範囲を延長した場合は追加分のみ
+        _ranges = playblast.get_stale_ranges(_prefix, EXT, (1001, 1120), _fingerprint)
+        assert _ranges == [(1010, 1010), (1050, 1050), (1101, 1120)], _ranges
+
+        # シーンが変わった場合はすべて
+        _new_fingerprint = playblast.make_fingerprint(scene='shot.ma', mtime=2.0, camera='shotCam', size=(1920, 1080))
+        _ranges = playblast.get_stale_ranges(_prefix, EXT, FRAMERANGE, _new_fingerprint)
+        assert _ranges == [FRAMERANGE], _ranges
+
+    print('MDK | OK')
@@ -0,0 +1,72 @@
+""" mdkapps.playblast 進捗テスト
+
+* iter_frames() / run_frames() でフレームごとの進捗とキャンセルを確認
+* 描画はダミーのファイル書き出し (遅いフレームを含む)
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import playblast
+
+
+FRAMES = range(1001, 1021)
+SLOW_FRAME = 1007
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _prefix = f'{_dirpath}/shot'
+
+        def _render_frame(frame: int):
+            time.sleep(0.02 if frame == SLOW_FRAME else 0.001)
+
+            with open(playblast.get_frame_path(_prefix, frame, 'jpg'), 'wb') as _file:
+                _file.write(b'x' * frame)
+
+        def _get_path(frame: int) -> str:
+            return playblast.get_frame_path(_prefix, frame, 'jpg')
+
+        # すべて描画
+        _results = playblast.run_frames(playblast.iter_frames(_render_frame, FRAMES, _get_path))
+        _summary = playblast.summarize_frames(_results, slowest=1)
+
+        assert [_result.frame for _result in _results] == list(FRAMES)
+        assert all(_result.size == _result.frame for _result in _results)
+        assert _summary['slowest'][0].frame == SLOW_FRAME, _summary
+
+        print(f'MDK | frames = {_summary["frames"]}, {_summary["seconds"]:.3f} sec, slowest = {_summary["slowest"][0].frame}')
+
+        # コールバックでキャンセル
+        _results = playblast.run_frames(
+            playblast.iter_frames(_render_frame, FRAMES, _get_path),
+            callback=lambda result: result.frame < 1005,
+        )
+        assert [_result.frame for _result in _results] == list(range(1001, 1006)), _results
+
+        # cancel_event でキャンセル
+        _cancel_event = threading.Event()
+        _frames = []
+
+        for _result in playblast.iter_frames(_render_frame, FRAMES, _get_path, cancel_event=_cancel_event):
+            _frames.append(_result.frame)
+
+            if _result.frame == 1003:
+                _cancel_event.set()
+
+        assert _frames == [1001, 1002, 1003], _frames
+
+    print('MDK | OK')
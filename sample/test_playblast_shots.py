@@ -0,0 +1,72 @@
+""" mdkapps.playblast 複数ショットテスト
+
+* normalize_shots() / run_shots() / write_shot_manifest() を確認
+* 1ショットが失敗しても残りのショットが描画されること
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import playblast
+
+
+SHOTS = [
+    {'name': 'sh010', 'camera': 'sh010_cam', 'framerange': (1001, 1024)},
+    {'name': 'sh020', 'camera': 'sh020_cam', 'framerange': (1001, 1048), 'size': (1280, 720)},
+    {'name': 'sh030', 'camera': 'missing_cam', 'framerange': (1001, 1012), 'ext': 'png'},
+]
+
+
+if __name__ == '__main__':
+    _shots = playblast.normalize_shots(SHOTS, size=(1920, 1080), ext='jpg')
+
+    assert _shots[0]['size'] == (1920, 1080) and _shots[0]['ext'] == 'jpg'
+    assert _shots[1]['size'] == (1280, 720)
+    assert _shots[2]['ext'] == 'png'
+
+    _cameras = []
+
+    def _render_shot(shot: dict) -> str:
+        if shot['camera'] == 'missing_cam':
+            raise ValueError(f'Camera is not found: {shot["camera"]}')
+
+        _cameras.append(shot['camera'])
+        return f'/pb/{shot["name"]}.####.{shot["ext"]}'
+
+    _results = playblast.run_shots(_shots, _render_shot)
+
+    assert _cameras == ['sh010_cam', 'sh020_cam']
+    assert [_result.ok for _result in _results] == [True, True, False]
+    assert _results[1].frames == 48
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _filepath = playblast.write_shot_manifest(f'{_dirpath}/playblasts.json', _results)
+
+        with open(_filepath) as _file:
+            _data = json.load(_file)
+
+    assert _data[2]['error'].startswith('ValueError')
+
+    for _result in _results:
+        print(f'MDK | {_result.name} = {_result.output or _result.error}')
+
+    try:
+        playblast.normalize_shots(SHOTS + [SHOTS[0]])
+        raise AssertionError('duplicate shot name is not detected')
+
+    except ValueError:
+        pass
+
+    print('MDK | OK')
@@ -0,0 +1,76 @@
+""" mdkapps.preflight テスト
+
+* stat_files() のキャッシュは追加時に期限切れを削除する
+* MAX_CACHE_SIZE を超えた古いパスを削除する
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import preflight
+
+
+def write_files(dirpath: str, count: int) -> list[str]:
+    _filepath_list = [os.path.join(dirpath, f'prop_{_index:03d}.ma') for _index in range(count)]
+
+    for _filepath in _filepath_list:
+        with open(_filepath, 'wb') as _file:
+            _file.write(b'data')
+
+    return _filepath_list
+
+
+def test_purge_expired(tmp_path):
+    _filepath_list = write_files(str(tmp_path), 10)
+    preflight.clear_cache()
+
+    preflight.stat_files(_filepath_list[:5], ttl=0.05)
+    assert all(_filepath in preflight._CACHE for _filepath in _filepath_list[:5])
+
+    time.sleep(0.1)
+
+    # 期限切れのパスは次の追加時に削除
+    preflight.stat_files(_filepath_list[5:], ttl=0.05)
+    assert list(preflight._CACHE) == _filepath_list[5:], list(preflight._CACHE)
+
+    preflight.clear_cache()
+
+
+def test_max_cache_size(tmp_path, monkeypatch):
+    _filepath_list = write_files(str(tmp_path), 10)
+    preflight.clear_cache()
+    monkeypatch.setattr(preflight, 'MAX_CACHE_SIZE', 4)
+
+    for _filepath in _filepath_list:
+        assert preflight.stat_file(_filepath).exists
+
+    assert list(preflight._CACHE) == _filepath_list[-4:], list(preflight._CACHE)
+
+    # キャッシュから返したパスは入れ直さない (追加順のまま)
+    assert preflight.stat_files(_filepath_list[-4:]) and list(preflight._CACHE) == _filepath_list[-4:]
+
+    preflight.clear_cache()
+
+
+if __name__ == '__main__':
+    import pytest
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        test_purge_expired(_dirpath)
+
+    with tempfile.TemporaryDirectory() as _dirpath, pytest.MonkeyPatch.context() as _monkeypatch:
+        test_max_cache_size(_dirpath, _monkeypatch)
+
+    print('MDK | OK')
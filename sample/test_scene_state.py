@@ -0,0 +1,158 @@
+""" mdkapps.scene テスト
+
+* SceneStateCache : 1回だけ問い合わせ、invalidate() (コールバック) まで再利用する
+* 問い合わせ中に invalidate() された結果はキャッシュしない
+* mdk_maya.get_scene_state() : maya.cmds のスタブで scriptJob からの破棄を確認
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import time
+import types
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import scene
+
+import maya_stub
+
+
+class FakeCmds(types.ModuleType):
+    """ maya.cmds のスタブ (問い合わせ回数と scriptJob を記録) """
+    def __init__(self):
+        super().__init__('maya.cmds')
+        self.queries = 0
+        self.jobs = {}
+        self.job_count = 0
+        self.selection = ['|chara']
+
+    def _query(self, value):
+        self.queries += 1
+        return value
+
+    def about(self, batch=False):
+        return False
+
+    def currentUnit(self, query=True, time=True):
+        return self._query('film')
+
+    def evalDeferred(self, func):
+        func()
+
+    def file(self, q=True, sceneName=True):
+        return self._query('/shot/shot.ma')
+
+    def getAttr(self, attr):
+        return self._query({'defaultRenderGlobals.currentRenderer': 'arnold'}.get(attr, 1920))
+
+    def ls(self, sl=True, long=True):
+        return self._query(list(self.selection))
+
+    def objExists(self, name):
+        return not name.startswith('vray')
+
+    def playbackOptions(self, q=True, **kwargs):
+        return self._query(1001.0)
+
+    def scriptJob(self, event=None, attributeChange=None, exists=None, kill=None, force=False):
+        if exists is not None:
+            return exists in self.jobs
+
+        if kill is not None:
+            self.jobs.pop(kill)
+            return
+
+        self.job_count += 1
+        self.jobs[self.job_count] = tuple(event or attributeChange)
+
+        return self.job_count
+
+    def emit(self, name: str):
+        """ イベント・アトリビュートの変更を発生させる """
+        for _name, _func in list(self.jobs.values()):
+            if _name == name:
+                _func()
+
+
+def test_cache():
+    _cache = scene.SceneStateCache()
+    _count = [0]
+
+    def _query() -> scene.SceneState:
+        _count[0] += 1
+        return scene.SceneState(filepath='/shot/shot.ma', fps=24)
+
+    assert _cache.get(_query) is _cache.get(_query)
+    assert _count == [1] and _cache.hits == 1
+
+    _cache.invalidate('SceneOpened')
+    assert _cache.get(_query).fps == 24 and _count == [2]
+
+    # 問い合わせ中の invalidate
+    def _query_changed() -> scene.SceneState:
+        _cache.invalidate()
+        return _query()
+
+    _cache.invalidate()
+    _cache.get(_query_changed)
+    assert not _cache.is_valid
+
+    # ttl
+    _cache = scene.SceneStateCache(ttl=0.01)
+    _cache.get(_query)
+    time.sleep(0.02)
+    assert not _cache.is_valid
+
+    print(f'MDK | cache = {_cache}')
+
+
+def test_maya(monkeypatch):
+    _cmds = FakeCmds()
+    mdk_maya = maya_stub.import_mdk_maya(monkeypatch, _cmds)
+    _app = mdk_maya.AppMain()
+
+    _state = _app.get_scene_state()
+    _queries = _cmds.queries
+
+    for _ in range(100):
+        assert _app.get_scene_state() is _state
+
+    assert _cmds.queries == _queries, (_cmds.queries, _queries)
+    assert _state.framerange == (1001.0, 1001.0, 1001.0, 1001.0) and _state.selection == ('|chara',)
+
+    _cmds.selection = ['|prop']
+    _cmds.emit('SelectionChanged')
+    assert _app.get_scene_state().selection == ('|prop',)
+
+    _cmds.emit('defaultResolution.width')
+    assert _app.get_scene_state() is not _state
+
+    # 新規シーンでアトリビュートの scriptJob を作り直す
+    _attr_jobs = list(mdk_maya._scene_state_attr_jobs)
+    _cmds.emit('NewSceneOpened')
+    assert mdk_maya._scene_state_attr_jobs and mdk_maya._scene_state_attr_jobs != _attr_jobs
+
+    mdk_maya.uninstall_scene_callbacks()
+    assert not _cmds.jobs, _cmds.jobs
+
+    print(f'MDK | maya  = {_state}')
+    print(f'MDK | maya queries per state = {_queries}')
+
+
+if __name__ == '__main__':
+    import pytest
+
+    test_cache()
+
+    with pytest.MonkeyPatch.context() as _monkeypatch:
+        test_maya(_monkeypatch)
+
+    print('MDK | OK')
@@ -0,0 +1,190 @@
+""" apply_shot_settings テスト
+
+* scene.diff_settings() : 違う値だけを SHOT_SETTINGS の順番で返す
+* mdk_standalone.apply_shot_settings() : リファレンス実装
+* mdk_maya.apply_shot_settings() : maya.cmds のスタブで setAttr の回数と Undo チャンクを確認
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import types
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import scene
+
+import maya_stub
+
+
+SETTINGS = {
+    'unit': 'centimeter',
+    'fps': 24,
+    'framerange': (1001, 1009, 1100, 1108),
+    'render': 'arnold',
+    'render_framerange': (1009, 1100),
+    'render_size': (2048, 858),
+    'aperture_size': (36.0, 24.0),
+}
+
+
+class FakeCmds(types.ModuleType):
+    """ maya.cmds のスタブ (アトリビュートの値と setAttr, Undo チャンクを記録) """
+    def __init__(self):
+        super().__init__('maya.cmds')
+        self.attrs = {
+            'defaultRenderGlobals.currentRenderer': 'mayaSoftware',
+            'defaultRenderGlobals.startFrame': 1.0,
+            'defaultRenderGlobals.endFrame': 10.0,
+            'defaultResolution.width': 1920,
+            'defaultResolution.height': 1080,
+            'camShape.horizontalFilmAperture': 1.417,
+            'camShape.verticalFilmAperture': 0.945,
+        }
+        self.units = {'time': 'ntsc', 'linear': 'cm'}
+        self.playback = {'ast': 1.0, 'min': 1.0, 'max': 120.0, 'aet': 120.0}
+        self.edits = []
+        self.chunks = []
+
+    def currentTime(self, value):
+        pass
+
+    def currentUnit(self, query=False, **kwargs):
+        if query:
+            return self.units[next(iter(kwargs))]
+
+        self.edits.append(('currentUnit', kwargs))
+        self.units.update(kwargs)
+
+    def getAttr(self, attr):
+        return self.attrs[attr]
+
+    def listRelatives(self, node, shapes=True, type=None):
+        return ['camShape'] if node == 'cam' else None
+
+    def ls(self, sl=False, type=None, long=False):
+        if type == 'renderGlobals':
+            return ['defaultRenderGlobals']
+
+        return ['cam'] if sl else []
+
+    def objectType(self, node, isType=None):
+        return isType == 'transform'
+
+    def ogs(self, query=False, pause=False):
+        return False
+
+    def playbackOptions(self, q=False, **kwargs):
+        _aliases = {
+            'animationStartTime': 'ast',
+            'animationEndTime': 'aet',
+            'minTime': 'min',
+            'maxTime': 'max',
+        }
+
+        if q:
+            return self.playback[next(iter(kwargs))]
+
+        self.edits.append(('playbackOptions', kwargs))
+
+        for _key, _value in kwargs.items():
+            self.playback[_aliases[_key]] = _value
+
+    def refresh(self, query=False, suspend=False):
+        return False
+
+    def setAttr(self, attr, value, type=None):
+        self.edits.append(('setAttr', attr))
+        self.attrs[attr] = value
+
+    def shadingNode(self, *args, **kwargs):
+        pass
+
+    def undoInfo(self, openChunk=False, closeChunk=False, chunkName=None):
+        if openChunk:
+            self.chunks.append(chunkName)
+
+
+def test_diff_settings():
+    _current = {
+        'fps': 24.0,
+        'framerange': (1001, 1001, 1200, 1200),
+        'render': 'Arnold',
+        'render_size': [1920, 1080],
+    }
+
+    assert scene.diff_settings(_current, {'fps': 24, 'render': 'arnold', 'render_size': (1920, 1080)}) == {}
+    assert scene.diff_settings(_current, {'fps': 23.976}) == {'fps': (24.0, 23.976)}
+
+    # SHOT_SETTINGS の順番, 現在値がない項目は設定, None は設定しない
+    _changes = scene.diff_settings(_current, dict(SETTINGS, fps=None))
+    assert list(_changes) == ['unit', 'framerange', 'render_framerange', 'render_size', 'aperture_size'], list(_changes)
+
+    # レンダラーが変わった場合はレンダーサイズも設定し直す
+    _changes = scene.diff_settings(_current, {'render': 'vray', 'render_size': (1920, 1080)})
+    assert list(_changes) == ['render', 'render_size']
+
+    # compare, keys
+    _compare = {'framerange': scene.get_outer_range}
+    assert not scene.diff_settings(_current, {'framerange': (1001, 1009, 1192, 1200)}, compare=_compare)
+    assert not scene.diff_settings(_current, {'render_framerange': (1, 2)}, keys=['fps'])
+
+    try:
+        scene.diff_settings(_current, {'frame_range': (1001, 1100)})
+        raise AssertionError('unknown key is not detected')
+
+    except ValueError:
+        pass
+
+
+def test_standalone():
+    from mdkapps import mdk_standalone
+    _app = mdk_standalone.AppMain()
+
+    assert _app.apply_shot_settings({'fps': 24, 'render_size': (1920, 1080)}) == {}
+
+    _changes = _app.apply_shot_settings({'fps': 24, 'render': 'arnold'})
+    assert _changes == {'render': (None, 'arnold')}, _changes
+
+
+def test_maya(monkeypatch):
+    _cmds = FakeCmds()
+    mdk_maya = maya_stub.import_mdk_maya(monkeypatch, _cmds)
+    _app = mdk_maya.AppMain()
+
+    _changes = _app.apply_shot_settings(SETTINGS)
+    assert 'unit' not in _changes
+    assert list(_changes) == ['fps', 'framerange', 'render', 'render_framerange', 'render_size', 'aperture_size']
+    assert _cmds.chunks == ['mdkApplyShotSettings']
+    assert _cmds.units['time'] == 'film' and _cmds.attrs['defaultResolution.width'] == 2048
+
+    print(f'MDK | maya first edits = {len(_cmds.edits)}')
+
+    # 同じ設定は何もしない (Undo チャンクも作らない)
+    _cmds.edits.clear()
+    assert _app.apply_shot_settings(SETTINGS) == {}
+    assert not _cmds.edits and len(_cmds.chunks) == 1, _cmds.edits
+
+    _changes = _app.apply_shot_settings(dict(SETTINGS, render_size=(1920, 1080)))
+    assert list(_changes) == ['render_size'] and len(_cmds.chunks) == 2
+
+    print(f'MDK | maya second edits = 0, changes = {_changes}')
+
+
+if __name__ == '__main__':
+    import pytest
+
+    test_diff_settings()
+    test_standalone()
+
+    with pytest.MonkeyPatch.context() as _monkeypatch:
+        test_maya(_monkeypatch)
+
+    print('MDK | OK')
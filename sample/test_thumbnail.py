@@ -0,0 +1,108 @@
+""" mdkapps.thumbnail テスト
+
+* capture_frames() の書き出しスレッドでサムネイルとコンタクトシートを作成
+* 書き出したフレームを読み直さないこと (open をフックして確認)
+* NumPy がない場合は select_frames() のみ確認
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import builtins
+import os
+import struct
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import images
+from mdkapps import playblast
+from mdkapps import thumbnail
+
+
+FRAMES = range(1001, 1049)
+SIZE = (640, 360)
+
+
+def create_pixels(frame: int) -> bytes:
+    """ フレームごとに色が変わる BGRX """
+    _value = (frame * 5) % 256
+    return bytes((_value, 128, 255 - _value, 0)) * (SIZE[0] * SIZE[1])
+
+
+def read_png_size(filepath: str) -> tuple[int, int]:
+    with open(filepath, 'rb') as _file:
+        _data = _file.read(24)
+
+    return struct.unpack('>II', _data[16:24])
+
+
+if __name__ == '__main__':
+    assert thumbnail.select_frames(list(range(1001, 1101)), 4) == [1001, 1034, 1067, 1100]
+    assert thumbnail.select_frames([1, 2, 3], 16) == [1, 2, 3]
+
+    if thumbnail.np is None:
+        print('MDK | numpy is not installed. skip')
+        print('MDK | OK')
+        sys.exit(0)
+
+    _array = thumbnail.to_array(4, 2, bytes(range(32)), mode='BGRX')
+    assert _array.shape == (2, 4, 3) and list(_array[0, 0]) == [2, 1, 0]
+    assert thumbnail.block_mean(_array, 2).shape == (1, 2, 3)
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _prefix = f'{_dirpath}/shot'
+        _thumbnails = thumbnail.PlayblastThumbnails(
+            FRAMES,
+            sheet_path=f'{_prefix}_sheet.png',
+            thumbnail_path=f'{_prefix}_thumb.png',
+            columns=4,
+            rows=3,
+            tile_size=(160, 90),
+        )
+
+        def _write(frame: int, pixels: bytes) -> str:
+            _path = playblast.get_frame_path(_prefix, frame, 'png')
+            images.write_png(_path, SIZE[0], SIZE[1], pixels, mode='BGRX')
+            _thumbnails.add(frame, SIZE[0], SIZE[1], pixels, mode='BGRX')
+
+            return _path
+
+        # フレームの読み込みを検出
+        _open = builtins.open
+        _reads = []
+
+        def _hooked_open(file, mode='r', *args, **kwargs):
+            if 'r' in mode and str(file).endswith('.png'):
+                _reads.append(file)
+
+            return _open(file, mode, *args, **kwargs)
+
+        builtins.open = _hooked_open
+
+        try:
+            playblast.capture_frames(FRAMES, create_pixels, _write)
+            _result = _thumbnails.save()
+
+        finally:
+            builtins.open = _open
+
+        assert not _reads, _reads
+        assert len(_thumbnails.contact_sheet.frames) == 12
+        assert read_png_size(_result['contact_sheet']) == (4 * 164 + 4, 3 * 94 + 4)
+        assert read_png_size(_result['thumbnail']) == (320, 180)
+
+        # 中間フレームの色 (BGRX → RGB)
+        _value = (_thumbnails.thumbnail_frame * 5) % 256
+        assert list(_thumbnails._thumbnail[0, 0]) == [255 - _value, 128, _value]
+
+        for _key, _path in _result.items():
+            print(f'MDK | {_key} = {os.path.basename(_path)}')
+
+    print('MDK | OK')
@@ -0,0 +1,172 @@
+""" mdkapps.workers テスト
+
+* mayapy の代わりのスタンドインでチャンク分割プレイブラストを確認
+    * LocalLauncher : 同じプロセス内で連番を書き出し、1チャンクは1回目に失敗させてリトライを確認
+    * SubprocessLauncher : python で worker と同じ引数 (JSON) のスクリプトを実行
+    * submit_jobs : バックグラウンドで実行し、JobHandle の状態・ログ・時間・キャンセルを確認
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import sequence
+from mdkapps import workers
+
+
+FRAMERANGE = (1001, 1240)
+CHUNK_SIZE = 50
+
+STANDIN_SCRIPT = '''
+import json
+import sys
+
+job = json.loads(sys.argv[1])
+
+for frame in range(job['start'], job['end'] + 1):
+    with open(f"{job['filepath']}.{frame:04d}.{job['ext']}", 'wb') as f:
+        f.write(b'frame')
+
+print(f"MDK | {job['start']}-{job['end']}")
+'''
+
+
+def create_jobs(filepath: str) -> list[dict]:
+    return [
+        {'filepath': filepath, 'start': _start, 'end': _end, 'ext': 'jpg'}
+        for _start, _end in workers.split_range(*FRAMERANGE, CHUNK_SIZE)
+    ]
+
+
+def check_sequence(dirpath: str):
+    _sequences = sequence.scan_sequences(dirpath)
+
+    assert len(_sequences) == 1, _sequences
+    assert (_sequences[0].first, _sequences[0].last) == FRAMERANGE, _sequences[0]
+    assert not _sequences[0].missing_frames, _sequences[0].missing_frames
+
+
+def test_local_launcher():
+    _failed = set()
+    _lock = threading.Lock()
+
+    def _playblast(job: dict):
+        with _lock:
+            if job['start'] == FRAMERANGE[0] and job['start'] not in _failed:
+                _failed.add(job['start'])
+                raise RuntimeError('simulated crash')
+
+        for _frame in range(job['start'], job['end'] + 1):
+            with open(f'{job["filepath"]}.{_frame:04d}.{job["ext"]}', 'wb') as _file:
+                _file.write(b'frame')
+
+    _progress = []
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _results = workers.run_jobs(
+            create_jobs(f'{_dirpath}/shot'),
+            workers.LocalLauncher(_playblast),
+            max_workers=3,
+            retries=1,
+            callback=lambda done, total, result: _progress.append((done, total)),
+        )
+
+        check_sequence(_dirpath)
+
+    assert all(_result.ok for _result in _results), _results
+    assert _results[0].attempts == 2, _results[0]
+    assert _progress[-1] == (len(_results), len(_results)), _progress
+
+    print(f'MDK | local      = {len(_results)} chunks, retried = {_results[0].attempts - 1}')
+
+
+def test_subprocess_launcher():
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _script = os.path.join(_dirpath, 'standin_worker.py')
+
+        with open(_script, 'w') as _file:
+            _file.write(STANDIN_SCRIPT)
+
+        _outdir = os.path.join(_dirpath, 'out')
+        os.makedirs(_outdir)
+
+        _results = workers.run_jobs(
+            create_jobs(f'{_outdir}/shot'),
+            workers.SubprocessLauncher(sys.executable, _script),
+            max_workers=3,
+        )
+
+        check_sequence(_outdir)
+
+    assert all(_result.ok for _result in _results), _results
+
+    print(f'MDK | subprocess = {len(_results)} chunks, {sum(_result.seconds for _result in _results):.3f} sec')
+
+
+def test_submit_jobs():
+    _started = threading.Event()
+    _release = threading.Event()
+
+    def _wait(job: dict):
+        _started.set()
+        _release.wait(5)
+
+    # 状態とキャンセル (1ワーカーで2つ目以降は未実行のままキャンセル)
+    _handle = workers.submit_jobs(create_jobs('/tmp/shot'), workers.LocalLauncher(_wait), max_workers=1, name='test')
+    assert _handle.status == 'running', _handle
+
+    _started.wait(5)
+    _handle.cancel()
+    _release.set()
+    _results = _handle.result(timeout=5)
+
+    assert _handle.status == 'cancelled', _handle
+    assert _results[0].ok and _results[-1].error == 'cancelled', _results
+
+    # ログと時間 (SubprocessLauncher)
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _script = os.path.join(_dirpath, 'standin_worker.py')
+
+        with open(_script, 'w') as _file:
+            _file.write(STANDIN_SCRIPT)
+
+        _done = []
+        _start = time.perf_counter()
+        _handle = workers.submit_jobs(
+            create_jobs(f'{_dirpath}/shot'),
+            workers.SubprocessLauncher(sys.executable, _script),
+            max_workers=3,
+            name='export',
+            timings={'snapshot': 0.5},
+        )
+        _handle.add_done_callback(lambda handle: _done.append(handle.status))
+        _submit_time = time.perf_counter() - _start
+
+        _handle.result(timeout=30)
+
+    assert _handle.status == 'done' and _done == ['done'], (_handle, _done)
+    assert _handle.logs[0].strip() == f'MDK | {FRAMERANGE[0]}-{FRAMERANGE[0] + CHUNK_SIZE - 1}', _handle.logs
+    assert _handle.timings['snapshot'] == 0.5 and len(_handle.timings['jobs']) == len(_handle.jobs)
+    assert _submit_time < _handle.timings['total'], (_submit_time, _handle.timings)
+
+    print(f'MDK | submit     = {_submit_time * 1000:.3f} ms, total = {_handle.timings["total"]:.3f} sec')
+
+
+if __name__ == '__main__':
+    test_local_launcher()
+    test_subprocess_launcher()
+    test_submit_jobs()
+
+    print('MDK | OK')
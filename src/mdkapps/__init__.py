@@ -8,6 +8,13 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * added : detect.detect_app()
+        * added : registry, get_app()
+        * updated : バックエンドの star import を廃止し遅延参照に変更
+        * updated : find_specでAppを判定, MDK_APPで上書き
+        * fixed : APP は import できたバックエンド名 (registry.detect_backend)
+
     * v0.0.3 2025-02-04 Tatsuya Yamagishi
 
         * fixed : import mdk_b3d
@@ -22,7 +29,7 @@ Release Note:
         * New
 """
 
-VERSION = 'v0.0.3'
+VERSION = 'v0.0.4'
 NAME = 'mdkapps'
 
 import os
@@ -37,55 +44,36 @@ if os.environ.get('MDK_DEBUG'):
 
 
 
-try:
-   """ Import Blender """
-   import bpy
-   print('MDK | Successfully imported Blender Python API bpy')
-   from .mdk_b3d import *
+from .detect import detect_app
+from .registry import get_app, get_backend, get_module, register_backend
+
+
+def __getattr__(name: str):
+    """ バックエンドモジュールの関数・クラスを遅延参照
+
+    * mdkapps.AppMain, mdkapps.create_playblast などは
+      判定したバックエンドモジュールから取得する
+    """
+    if name == 'APP':
+        return get_backend().name
+
+    if name.startswith('__'):
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-# except Exception as ex:
-#     raise RuntimeError(ex)
+    _module = get_module()
 
-except ImportError:
     try:
-        """ Improt Cinema4D """
-        import c4d
-        from .mdk_c4d import *
-
-        print('MDK | Successfully imported Cinema4D Python API c4d')
-
-    except ImportError:
-        try:
-            """ Improt Houdini """
-            import hou
-            from .mdk_houdini import *
-            print('MDK | Successfully imported Hoduini Python API hou')
-
-        except ImportError:
-            try:
-                """ Improt Max """
-                import pymxs
-                from .mdk_max import *
-                print('MDK | Successfully imported 3dsMax Python API pymxs')
-
-            except ImportError:
-                try:
-                    """ Improt Maya """
-                    import maya.cmds as cmds
-                    from .mdk_maya import *
-                    print('MDK | Successfully imported Maya Python API maya.cmds')
-
-                except ImportError:
-                    try:
-                        """ Improt nuke """
-                        import nuke
-                        from .mdk_nuke import *
-                        print('MDK | Successfully imported Nuke Python API nuke')
-
-                    except ImportError:
-                        try:
-                            """ Improt standalone """
-                            from .mdk_standalone import *
-                            print('MDK | Successfully imported Python API standalone')
-                        except ImportError:
-                            print("Failed to import all libraries. Please check your environment.")
\ No newline at end of file
+        return getattr(_module, name)
+    except AttributeError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+
+def __dir__():
+    _names = set(globals())
+
+    try:
+        _names.update(_name for _name in dir(get_module()) if not _name.startswith('_'))
+    except Exception:
+        pass
+
+    return sorted(_names)
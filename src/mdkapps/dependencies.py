@@ -0,0 +1,341 @@
+""" mdkapps.dependencies
+
+* シーンが参照するファイル (テクスチャ, キャッシュ, リファレンスなど) を確認するモジュール
+
+* DCC ごとにシーンを1回だけ走査して集めた (ノードタイプ, ノード, ファイルパス) をまとめて確認する
+* 同じファイルは1つにまとめ、連番は FileSequence にまとめる
+* パターン ('####', '%04d', '<UDIM>', '$F4') のディレクトリはスレッドプールで1回ずつ走査する
+* すべてのファイルを preflight.stat_files() でまとめて stat する
+    * missing : 存在しないファイル (パターンの連番は抜けているフレームも含む)
+    * empty : サイズが 0 のファイル
+    * stale : stale_time (通常はシーンファイルの更新日時) より後に更新されたファイル
+
+Examples:
+    >>> from mdkapps import dependencies
+    >>> _report = dependencies.collect_dependencies([
+    ...     ('file', 'diffuse_file', '/asset/tex/diffuse.<UDIM>.exr'),
+    ...     ('AlembicNode', 'chara_abc', '/cache/chara.abc'),
+    ... ], stale_time=_scene_mtime)
+    >>> _report.summary()
+    {'dependencies': 2, 'files': 11, 'missing': 0, 'empty': 0, 'stale': 1, 'seconds': 0.01}
+    >>> _report.stale
+    [FileDependency('/cache/chara.abc', nodes=1, status='stale')]
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+        * fixed: collect_dependencies() で sequence.collapse_dict() の対応表を使う (normpath の比較をやめる)
+"""
+
+import concurrent.futures
+import os
+import time
+import typing
+
+from . import preflight
+from . import sequence
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+STATUS_OK = 'ok'
+STATUS_MISSING = 'missing'
+STATUS_EMPTY = 'empty'
+STATUS_STALE = 'stale'
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class FileDependency:
+    """ 1つの参照ファイル (単体ファイル, または連番)
+
+    Args:
+        path(str): ファイルパス, または連番のパターン
+        sequence(FileSequence, optional): 連番
+        nodes(dict[str, list[str]], optional): 参照しているノード {ノードタイプ: [ノード, ...]}
+        check_frames(bool): True の場合は連番の抜けているフレームも missing にする
+    """
+    def __init__(
+                self,
+                path: str,
+                sequence: sequence.FileSequence = None,
+                nodes: dict[str, list[str]] = None,
+                check_frames: bool = False):
+        self.path = str(path)
+        self.sequence = sequence
+        self.nodes = nodes or {}
+        self.check_frames = check_frames
+
+        self.missing_files = []
+        self.empty_files = []
+        self.stale_files = []
+        self.size = 0
+        self.mtime = 0.0
+
+
+    def __repr__(self):
+        _count = sum(len(_nodes) for _nodes in self.nodes.values())
+        return f'{type(self).__name__}({self.path!r}, nodes={_count}, status={self.status!r})'
+
+
+    @property
+    def files(self) -> list[str]:
+        """ stat するファイルパス """
+        if self.sequence is None:
+            return [self.path]
+
+        return self.sequence.paths()
+
+
+    @property
+    def node_types(self) -> list[str]:
+        return list(self.nodes)
+
+
+    @property
+    def status(self) -> str:
+        """ 'missing', 'empty', 'stale', 'ok' (複数の場合は左を優先) """
+        if self.missing_files:
+            return STATUS_MISSING
+
+        if self.empty_files:
+            return STATUS_EMPTY
+
+        if self.stale_files:
+            return STATUS_STALE
+
+        return STATUS_OK
+
+
+    def add_node(self, node_type: str, node: str):
+        self.nodes.setdefault(node_type, []).append(node)
+
+
+    def check(self, stats: dict[str, preflight.FileStat], stale_time: float = None):
+        """ stat の結果から missing, empty, stale を判定
+
+        Args:
+            stats(dict[str, FileStat]): preflight.stat_files() の結果
+            stale_time(float, optional): この時刻 (UNIX 時間) より後に更新されたファイルを stale にする
+        """
+        self.missing_files = []
+        self.empty_files = []
+        self.stale_files = []
+        self.size = 0
+        self.mtime = 0.0
+
+        for _filepath in self.files:
+            _stat = stats[_filepath]
+
+            if not _stat.is_file:
+                self.missing_files.append(_filepath)
+                continue
+
+            self.size += _stat.size
+            self.mtime = max(self.mtime, _stat.mtime)
+
+            if _stat.size == 0:
+                self.empty_files.append(_filepath)
+
+            if stale_time and _stat.mtime > stale_time:
+                self.stale_files.append(_filepath)
+
+        if self.check_frames and self.sequence is not None:
+            self.missing_files.extend(self.sequence.get_path(_frame) for _frame in self.sequence.missing_frames)
+
+
+class DependencyReport:
+    """ collect_dependencies() の結果
+
+    Args:
+        dependencies(list[FileDependency]): 参照ファイル (最初に参照された順)
+        seconds(float): 確認にかかった時間
+    """
+    def __init__(self, dependencies: list[FileDependency] = None, seconds: float = 0.0):
+        self.dependencies = list(dependencies or [])
+        self.seconds = seconds
+
+
+    def __iter__(self):
+        return iter(self.dependencies)
+
+
+    def __len__(self):
+        return len(self.dependencies)
+
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.summary()})'
+
+
+    @property
+    def empty(self) -> list[FileDependency]:
+        return [_dependency for _dependency in self.dependencies if _dependency.empty_files]
+
+
+    @property
+    def missing(self) -> list[FileDependency]:
+        return [_dependency for _dependency in self.dependencies if _dependency.missing_files]
+
+
+    @property
+    def ok(self) -> bool:
+        """ missing, empty, stale がない場合は True """
+        return all(_dependency.status == STATUS_OK for _dependency in self.dependencies)
+
+
+    @property
+    def stale(self) -> list[FileDependency]:
+        return [_dependency for _dependency in self.dependencies if _dependency.stale_files]
+
+
+    def by_type(self) -> dict[str, list[FileDependency]]:
+        """ ノードタイプごとの参照ファイル """
+        _result = {}
+
+        for _dependency in self.dependencies:
+            for _node_type in _dependency.node_types:
+                _result.setdefault(_node_type, []).append(_dependency)
+
+        return _result
+
+
+    def summary(self) -> dict:
+        return {
+            'dependencies': len(self.dependencies),
+            'files': sum(len(_dependency.files) for _dependency in self.dependencies),
+            'missing': len(self.missing),
+            'empty': len(self.empty),
+            'stale': len(self.stale),
+            'seconds': round(self.seconds, 3),
+        }
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def collect_dependencies(
+            entries: typing.Iterable[tuple[str, str, str]],
+            stale_time: float = None,
+            kinds: tuple[str] = None,
+            max_workers: int = preflight.MAX_WORKERS) -> DependencyReport:
+    """ 参照ファイルをまとめて確認
+
+    * 空のパスは無視する
+    * 連番のフレームを参照しているノードは1つの FileDependency にまとめる
+
+    Args:
+        entries(Iterable[tuple[str, str, str]]): [(ノードタイプ, ノード, ファイルパス), ...]
+        stale_time(float, optional): この時刻 (UNIX 時間) より後に更新されたファイルを stale にする
+        kinds(tuple[str], optional): 連番にまとめるファイルタイプ (sequence.collapse). None の場合は全てのファイル
+        max_workers(int): ディレクトリの走査と stat のスレッド数
+
+    Returns:
+        DependencyReport: 参照ファイルの確認結果
+    """
+    _start = time.perf_counter()
+
+    # ファイルパスごとのノード (同じパスは1回だけ確認する)
+    _nodes = {}
+
+    for _node_type, _node, _filepath in entries:
+        if not _filepath:
+            continue
+
+        _nodes.setdefault(str(_filepath), {})[(_node_type, _node)] = None
+
+    _patterns = [_filepath for _filepath in _nodes if sequence.is_pattern(_filepath)]
+    _expanded = expand_patterns(_patterns, max_workers=max_workers)
+    _items = sequence.collapse_dict([_filepath for _filepath in _nodes if _filepath not in _expanded], kinds=kinds)
+
+    # 連番, ファイルパス → FileDependency (参照された順に並べる)
+    _result = {}
+
+    for _filepath, _node_list in _nodes.items():
+        _is_pattern = _filepath in _expanded
+        _item = _expanded[_filepath] if _is_pattern else _items[_filepath]
+        _key = _filepath if _is_pattern or isinstance(_item, str) else id(_item)
+
+        if _key not in _result:
+            _result[_key] = _create_dependency(_item, check_frames=_is_pattern)
+
+        _dependency = _result[_key]
+
+        for _node_type, _node in _node_list:
+            _dependency.add_node(_node_type, _node)
+
+    _result = list(_result.values())
+    _stats = preflight.stat_files(
+            [_filepath for _dependency in _result for _filepath in _dependency.files],
+            ttl=0,
+            max_workers=max_workers)
+
+    for _dependency in _result:
+        _dependency.check(_stats, stale_time=stale_time)
+
+    return DependencyReport(_result, seconds=time.perf_counter() - _start)
+
+
+def expand_patterns(
+            filepath_list: list[str],
+            max_workers: int = preflight.MAX_WORKERS) -> dict[str, sequence.FileSequence|str]:
+    """ パターンのファイルパスから連番を検索
+
+    * 同じディレクトリは1回だけ走査し、複数のディレクトリはスレッドプールで走査する
+    * フレームが見つからないパターンはパスのまま返す
+
+    Returns:
+        dict[str, FileSequence | str]: {パターン: 連番}
+    """
+    _dirpaths = list(dict.fromkeys(os.path.dirname(str(_filepath)) for _filepath in filepath_list))
+    _listings = list_dirs(_dirpaths, max_workers=max_workers)
+    _result = {}
+
+    for _filepath in filepath_list:
+        _filepath = str(_filepath)
+        _sequence = sequence.expand_pattern(_filepath, filenames=_listings[os.path.dirname(_filepath)])
+        _result[_filepath] = _sequence if _sequence.frames else _filepath
+
+    return _result
+
+
+def get_scene_time(filepath: str) -> float:
+    """ シーンファイルの更新日時 (stale_time 用). 未保存の場合は None """
+    if not filepath:
+        return None
+
+    _stat = preflight.stat_file(filepath, ttl=0)
+
+    return _stat.mtime if _stat.is_file else None
+
+
+def list_dirs(dirpaths: list[str], max_workers: int = preflight.MAX_WORKERS) -> dict[str, list[str]]:
+    """ ディレクトリ内のファイル名をまとめて取得 (存在しないディレクトリは空)
+
+    Returns:
+        dict[str, list[str]]: {ディレクトリ: [ファイル名, ...]}
+    """
+    def _list_dir(dirpath: str) -> list[str]:
+        return list(sequence.iter_files(dirpath))
+
+    if len(dirpaths) < preflight.MIN_PARALLEL or max_workers <= 1:
+        return {_dirpath: _list_dir(_dirpath) for _dirpath in dirpaths}
+
+    _workers = min(max_workers, len(dirpaths))
+
+    with concurrent.futures.ThreadPoolExecutor(_workers, thread_name_prefix='mdk_dependencies') as _executor:
+        return dict(zip(dirpaths, _executor.map(_list_dir, dirpaths)))
+
+
+def _create_dependency(item: sequence.FileSequence|str, check_frames: bool = False) -> FileDependency:
+    if isinstance(item, sequence.FileSequence):
+        return FileDependency(item.pattern(), sequence=item, check_frames=check_frames)
+
+    return FileDependency(item)
@@ -0,0 +1,196 @@
+""" mdkapps.detect
+
+* 起動中のAppを判定するモジュール
+
+* import を試行せず、sys.modules と importlib.util.find_spec で判定する
+* 環境変数 MDK_APP で判定結果を上書きできる
+* 判定結果はプロセス内でキャッシュする
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * updated : エントリポイントは detect_app(entry_points=True) の場合のみ読み込む
+        * added : find_backends(), detect_apps() (import できないバックエンドの次の候補用)
+        * updated : 判定用プローブを registry から取得
+        * New
+"""
+
+import functools
+import importlib.util
+import os
+import sys
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+ENV_APP = 'MDK_APP'
+STANDALONE = 'standalone'
+
+APP_ALIASES = {
+    'blender': 'b3d',
+    'cinema4d': 'c4d',
+    'hou': 'houdini',
+    '3dsmax': 'max',
+}
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def find_module(name: str) -> bool:
+    """ モジュールが読み込み可能か判定
+
+    * 読み込み済みであれば sys.modules を参照
+    * サブモジュールの場合は親パッケージのみ import される
+
+    Args:
+        name(str): モジュール名
+
+    Returns:
+        bool: 読み込み可能ならTrue
+    """
+    if name in sys.modules:
+        return sys.modules[name] is not None
+
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def normalize_app_name(name: str) -> str:
+    """ App名を正規化 """
+    _name = str(name).strip().lower()
+
+    if _name.startswith('mdk_'):
+        _name = _name[4:]
+
+    return APP_ALIASES.get(_name, _name)
+
+
+@functools.cache
+def detect_app(entry_points: bool = False) -> str:
+    """ 起動中のAppを判定
+
+    * 判定順
+        1. 環境変数 MDK_APP
+        2. sys.modules に読み込み済みのApp API
+        3. importlib.util.find_spec で見つかるApp API / 判定関数
+
+    * 判定用プローブは registry に登録されたバックエンドを参照
+    * エントリポイントの読み込みは遅いため、entry_points=True の場合のみ
+      組み込みバックエンドで判定できなければ読み込む
+      (登録済みのエントリポイントのバックエンドは常に判定する)
+
+    Args:
+        entry_points(bool): True の場合はエントリポイントのバックエンドも判定
+
+    Returns:
+        str: App名 ('b3d', 'c4d', 'houdini', 'max', 'maya', 'nuke', 'standalone', ...)
+    """
+    _env = os.environ.get(ENV_APP)
+
+    if _env:
+        return normalize_app_name(_env)
+
+    from . import registry
+
+    _app = probe_backends(registry.get_backends(entry_points=False))
+
+    if _app is None and entry_points:
+        _app = probe_backends(registry.get_backends(entry_points=True))
+
+    return _app or STANDALONE
+
+
+@functools.cache
+def detect_apps(entry_points: bool = False) -> tuple[str]:
+    """ プローブで見つかるすべてのAppを判定順に返す
+
+    * find_spec で見つかっても import できない場合 (App 外の Python で PYTHONPATH に hou がある場合など) に
+      次の候補を使うため (registry.detect_backend)
+    * 環境変数 MDK_APP は参照しない
+
+    Args:
+        entry_points(bool): True の場合はエントリポイントのバックエンドも判定
+
+    Returns:
+        tuple[str]: App名
+    """
+    from . import registry
+
+    return tuple(find_backends(registry.get_backends(entry_points=entry_points)))
+
+
+def find_backends(backends: list) -> list[str]:
+    """ バックエンドのプローブで判定 (見つかったすべて)
+
+    * sys.modules で見つかったバックエンドを先に、次に find_spec / 判定関数で見つかったバックエンド
+
+    Args:
+        backends(list[registry.Backend]): 判定順のバックエンドリスト
+
+    Returns:
+        list[str]: 判定したApp名
+    """
+    _backends = [_backend for _backend in backends if _backend.probe]
+    _result = {}
+
+    for _backend in _backends:
+        if not callable(_backend.probe):
+            if any(_module in sys.modules for _module in _backend.probe):
+                _result[_backend.name] = None
+
+    for _backend in _backends:
+        if _backend.name in _result:
+            continue
+
+        if callable(_backend.probe):
+            if _backend.probe():
+                _result[_backend.name] = None
+
+        elif any(find_module(_module) for _module in _backend.probe):
+            _result[_backend.name] = None
+
+    return list(_result)
+
+
+def probe_backends(backends: list) -> str:
+    """ バックエンドのプローブで判定
+
+    * sys.modules を先に確認し、次に find_spec / 判定関数で確認
+
+    Args:
+        backends(list[registry.Backend]): 判定順のバックエンドリスト
+
+    Returns:
+        str: 判定したApp名. 見つからなければ None
+    """
+    _backends = [_backend for _backend in backends if _backend.probe]
+
+    for _backend in _backends:
+        if not callable(_backend.probe):
+            if any(_module in sys.modules for _module in _backend.probe):
+                return _backend.name
+
+    for _backend in _backends:
+        if callable(_backend.probe):
+            if _backend.probe():
+                return _backend.name
+
+        elif any(find_module(_module) for _module in _backend.probe):
+            return _backend.name
+
+
+def clear_cache():
+    """ 判定結果のキャッシュを削除 """
+    detect_app.cache_clear()
+    detect_apps.cache_clear()
+
+    from . import registry
+    registry.clear_detected_backend()
@@ -0,0 +1,731 @@
+""" mdkapps.encode
+
+* プレイブラストの連番を動画にエンコードするモジュール
+
+* FFmpegEncoder : ffmpeg にパイプでフレーム (JPEG / PNG) を渡してエンコード
+* AviEncoder : ffmpeg がない環境用. Python のみで MJPEG / PNG の AVI を書き出す
+* FrameEncoder : メモリ上のフレームを put() で順番に渡してエンコード (ディスクを読まない)
+* SequenceEncoder : 書き出し中の連番を監視して、書き出されたフレームから順にエンコード
+    * 読み込みスレッドとエンコードスレッドを上限付きキューでつなぐ
+    * 最後のフレームを待たずにエンコードを開始できる
+    * start() の時点で存在するフレーム (前回の書き出し) は更新されるまで書き出し中とみなす
+
+Examples:
+    >>> from mdkapps import encode
+    >>> _paths = encode.get_frame_paths('/pb/shot.####.jpg', range(1001, 1101))
+    >>> with encode.SequenceEncoder(_paths, '/pb/shot.mp4', fps=24) as _encoder:
+    ...     create_playblast(...)  # 連番を書き出し
+    >>> _encoder.output
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+        * fixed: SequenceEncoder で上書きする連番の前回のフレームを読み込まない (start() 時の更新日時, サイズと比較)
+        * added: FrameEncoder (メモリ上のフレームをエンコード. SequenceEncoder の基底クラス)
+        * fixed: FFmpegEncoder の stderr を一時ファイルに書き出す (パイプが一杯になって止まらない)
+        * added: FFmpegEncoder.abort(), AviEncoder.abort(). FrameEncoder.cancel() は ffmpeg を終了して途中のファイルを削除
+"""
+
+import logging
+import os
+import queue
+import shutil
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+import typing
+
+from . import preflight
+from . import sequence
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+logger = logging.getLogger(__name__)
+
+ENV_FFMPEG = 'MDK_FFMPEG'
+
+QUEUE_SIZE = 8
+POLL_INTERVAL = 0.02
+
+# abort() で ffmpeg の終了を待つ時間 (秒). 過ぎた場合は kill
+TERMINATE_TIMEOUT = 5.0
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+JPEG_SIGNATURE = b'\xff\xd8'
+
+# JPEG の SOF マーカー (DHT, JPG, DAC を除く)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+AVIF_HASINDEX = 0x10
+AVIIF_KEYFRAME = 0x10
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class AviEncoder:
+    """ Python のみで AVI を書き出すエンコーダ
+
+    * JPEG のフレームは 'MJPG', PNG のフレームは 'MPNG' としてそのまま格納する (再エンコードなし)
+    * サイズとコーデックは最初のフレームから取得する
+    * AVI 1.0 形式のため 1GB 程度までを想定
+
+    Args:
+        filepath(str): 出力ファイルパス
+        fps(float): フレームレート
+    """
+    def __init__(self, filepath: str, fps: float = 24):
+        self.filepath = str(filepath)
+        self.fps = fps
+        self.frame_count = 0
+
+        self._file = None
+        self._index = []
+        self._max_size = 0
+        self._fourcc = None
+        self._movi_pos = 0
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+    def write(self, data: bytes):
+        """ フレーム (JPEG / PNG のバイト列) を追加 """
+        _fourcc, _width, _height = get_image_info(data)
+
+        if self._file is None:
+            self._fourcc = _fourcc
+            self._open(_width, _height)
+
+        elif _fourcc != self._fourcc:
+            raise ValueError(f'MDK | Mixed frame formats: {self._fourcc} / {_fourcc}')
+
+        _offset = self._file.tell() - self._movi_pos
+        self._file.write(b'00dc' + struct.pack('<I', len(data)))
+        self._file.write(data)
+
+        if len(data) % 2:
+            self._file.write(b'\0')
+
+        self._index.append((_offset, len(data)))
+        self._max_size = max(self._max_size, len(data))
+        self.frame_count += 1
+
+
+    def close(self) -> str:
+        """ インデックスを書き込んでファイルを閉じる
+
+        Returns:
+            str: 出力ファイルパス
+        """
+        if self._file is None:
+            return self.filepath
+
+        _file = self._file
+        _movi_end = _file.tell()
+
+        _file.write(b'idx1' + struct.pack('<I', len(self._index) * 16))
+
+        for _offset, _size in self._index:
+            _file.write(struct.pack('<4sIII', b'00dc', AVIIF_KEYFRAME, _offset, _size))
+
+        _end = _file.tell()
+
+        # RIFF / movi のサイズ, フレーム数を書き換え
+        _file.seek(4)
+        _file.write(struct.pack('<I', _end - 8))
+
+        _file.seek(self._movi_pos - 4)
+        _file.write(struct.pack('<I', _movi_end - self._movi_pos))
+
+        _file.seek(self._avih_pos + 16)
+        _file.write(struct.pack('<I', self.frame_count))
+        _file.seek(self._avih_pos + 28)
+        _file.write(struct.pack('<I', self._max_size))
+
+        _file.seek(self._strh_pos + 32)
+        _file.write(struct.pack('<II', self.frame_count, self._max_size))
+
+        _file.close()
+        self._file = None
+
+        return self.filepath
+
+
+    def abort(self):
+        """ 書き出しを中止して途中のファイルを削除 """
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+        _remove_file(self.filepath)
+
+
+    def _open(self, width: int, height: int):
+        _scale, _rate = 1000, int(round(self.fps * 1000))
+        _usec = int(round(1000000 / self.fps))
+
+        _avih = struct.pack(
+            '<IIIIIIIIII16x',
+            _usec, 0, 0, AVIF_HASINDEX,
+            0, 0, 1, 0,
+            width, height,
+        )
+
+        _strh = struct.pack(
+            '<4s4sIHHIIIIIIIIhhhh',
+            b'vids', self._fourcc, 0, 0, 0,
+            0, _scale, _rate, 0, 0, 0, 0xFFFFFFFF, 0,
+            0, 0, width, height,
+        )
+
+        _strf = struct.pack(
+            '<IiiHH4sIiiII',
+            40, width, height, 1, 24, self._fourcc, width * height * 3, 0, 0, 0, 0,
+        )
+
+        _strl = b'strl' + _chunk(b'strh', _strh) + _chunk(b'strf', _strf)
+        _hdrl = b'hdrl' + _chunk(b'avih', _avih) + _chunk(b'LIST', _strl)
+
+        _dirpath = os.path.dirname(self.filepath)
+
+        if _dirpath:
+            os.makedirs(_dirpath, exist_ok=True)
+
+        self._file = open(self.filepath, 'wb')
+        self._file.write(b'RIFF\0\0\0\0AVI ')
+
+        _hdrl_pos = self._file.tell()
+        self._file.write(_chunk(b'LIST', _hdrl))
+
+        # 書き換え用の位置 (LIST hdrl avih / LIST strl strh のデータ先頭)
+        self._avih_pos = _hdrl_pos + 8 + 4 + 8
+        self._strh_pos = self._avih_pos + len(_avih) + 8 + 4 + 8
+
+        self._file.write(b'LIST\0\0\0\0movi')
+        self._movi_pos = self._file.tell() - 4
+
+
+class FFmpegEncoder:
+    """ ffmpeg にパイプでフレームを渡すエンコーダ
+
+    * 'image2pipe' でフレーム (JPEG / PNG のバイト列) をそのまま渡す
+    * yuv420p のため、サイズは偶数に揃える
+    * stderr は一時ファイルに書き出し、エラーの場合のみ読み込む
+      (パイプのまま読まないと、ffmpeg の出力が多い場合にバッファが一杯になって止まる)
+
+    Args:
+        filepath(str): 出力ファイルパス
+        fps(float): フレームレート
+        ffmpeg(str, optional): ffmpeg の実行ファイル. None の場合は find_ffmpeg()
+        codec(str): 映像コーデック
+        crf(int): 品質 (libx264)
+    """
+    def __init__(
+                self,
+                filepath: str,
+                fps: float = 24,
+                ffmpeg: str = None,
+                codec: str = 'libx264',
+                crf: int = 18):
+        self.filepath = str(filepath)
+        self.fps = fps
+        self.frame_count = 0
+
+        _ffmpeg = ffmpeg or find_ffmpeg()
+
+        if not _ffmpeg:
+            raise FileNotFoundError('MDK | ffmpeg is not found')
+
+        _dirpath = os.path.dirname(self.filepath)
+
+        if _dirpath:
+            os.makedirs(_dirpath, exist_ok=True)
+
+        self._stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(
+            [
+                _ffmpeg, '-y', '-loglevel', 'error',
+                '-f', 'image2pipe', '-framerate', str(fps), '-i', '-',
+                '-c:v', codec, '-crf', str(crf), '-pix_fmt', 'yuv420p',
+                '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2',
+                self.filepath,
+            ],
+            stdin=subprocess.PIPE,
+            stderr=self._stderr,
+        )
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+    def write(self, data: bytes):
+        """ フレーム (JPEG / PNG のバイト列) を追加 """
+        self._proc.stdin.write(data)
+        self.frame_count += 1
+
+
+    def close(self) -> str:
+        """ エンコードの終了を待つ
+
+        Returns:
+            str: 出力ファイルパス
+        """
+        if self._proc.returncode is not None:
+            return self.filepath
+
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+        self._proc.wait()
+
+        with self._stderr:
+            if self._proc.returncode:
+                self._stderr.seek(0)
+                _stderr = self._stderr.read().decode(errors='replace')
+                raise RuntimeError(f'MDK | ffmpeg failed: {_stderr}')
+
+        return self.filepath
+
+
+    def abort(self):
+        """ ffmpeg を終了して途中のファイルを削除
+
+        * close() と違い、書き込んだフレームで動画を完成させない
+        """
+        if self._proc.returncode is not None:
+            return
+
+        self._proc.terminate()
+
+        try:
+            self._proc.wait(timeout=TERMINATE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+        self._stderr.close()
+        _remove_file(self.filepath)
+
+
+class FrameEncoder:
+    """ メモリ上のフレームをエンコード
+
+    * put() でフレーム (JPEG / PNG のバイト列) を順番に渡す
+    * エンコードスレッド: キューからフレームを取り出してエンコーダに渡す
+    * キューが一杯になると put() を待つ (メモリ使用量を抑える)
+
+    Args:
+        filepath(str): 出力ファイルパス
+        fps(float): フレームレート
+        encoder(object, optional): write(data), close() を持つエンコーダ. None の場合は open_encoder()
+            * abort() を持つ場合、cancel() では close() の代わりに abort() を呼ぶ
+        queue_size(int): キューの上限
+    """
+    def __init__(
+                self,
+                filepath: str = None,
+                fps: float = 24,
+                encoder = None,
+                queue_size: int = QUEUE_SIZE):
+        self.fps = fps
+        self.output = None
+
+        self._encoder = encoder
+        self._filepath = filepath
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._done = threading.Event()
+        self._cancel = threading.Event()
+        self._errors = []
+        self._threads = []
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.finish()
+        else:
+            self.cancel()
+
+
+    def start(self):
+        """ エンコードを開始 """
+        if self._encoder is None:
+            self._encoder = open_encoder(self._filepath, fps=self.fps)
+
+        self._threads = self._create_threads()
+
+        for _thread in self._threads:
+            _thread.start()
+
+
+    def put(self, data: bytes):
+        """ フレーム (JPEG / PNG のバイト列) を追加
+
+        Raises:
+            Exception: エンコードでエラーが起きた場合
+        """
+        if self._errors:
+            raise self._errors[0]
+
+        self._put(data)
+
+
+    def finish(self) -> str:
+        """ フレームの追加完了を通知して、エンコードの終了を待つ
+
+        Returns:
+            str: 出力ファイルパス
+        """
+        self._done.set()
+        self._put_end()
+        self._join()
+
+        if self._errors:
+            raise self._errors[0]
+
+        return self.output
+
+
+    def cancel(self):
+        """ エンコードを中止
+
+        * エンコーダが abort() を持つ場合は abort() (ffmpeg を終了して途中のファイルを削除)
+        """
+        self._cancel.set()
+        self._done.set()
+        self._put_end()
+        self._join(abort=True)
+
+
+    def _create_threads(self) -> list[threading.Thread]:
+        return [threading.Thread(target=self._encode_frames, name='mdk_encode_write', daemon=True)]
+
+
+    def _join(self, abort: bool = False):
+        for _thread in self._threads:
+            _thread.join()
+
+        if self._encoder is None or self.output is not None:
+            return
+
+        try:
+            if abort and hasattr(self._encoder, 'abort'):
+                self._encoder.abort()
+            else:
+                self.output = self._encoder.close()
+
+        except Exception as ex:
+            self._errors.append(ex)
+
+
+    def _put(self, data: bytes):
+        while not self._cancel.is_set():
+            try:
+                self._queue.put(data, timeout=POLL_INTERVAL * 5)
+                return
+            except queue.Full:
+                continue
+
+
+    def _put_end(self):
+        """ エンコードスレッドに終了を通知 (キューが一杯でもエンコードスレッドが取り出す) """
+        self._queue.put(None)
+
+
+    def _encode_frames(self):
+        while True:
+            _data = self._queue.get()
+
+            if _data is None:
+                return
+
+            if self._cancel.is_set():
+                continue
+
+            try:
+                self._encoder.write(_data)
+
+            except Exception as ex:
+                self._errors.append(ex)
+                self._cancel.set()
+
+
+class SequenceEncoder(FrameEncoder):
+    """ 書き出し中の連番をエンコード
+
+    * 読み込みスレッド: フレームが書き出されたら読み込み、キューに追加
+        * 次のフレームが存在するか、finish() が呼ばれたらフレームの書き出し完了とみなす
+        * start() の時点で存在するフレームは、更新日時かサイズが変わるまで存在しないものとみなす
+          (forceOverwrite で上書きする場合に前回のフレームを読み込まない)
+        * finish() 後は更新されていないフレームもそのまま読み込む (インクリメンタルで描画しなかったフレーム)
+    * エンコードスレッド: キューからフレームを取り出してエンコーダに渡す
+    * キューが一杯になると読み込みを待つ (メモリ使用量を抑える)
+
+    Args:
+        frame_paths(list[str]): フレームのパス (順番)
+        filepath(str): 出力ファイルパス
+        fps(float): フレームレート
+        encoder(object, optional): write(data), close() を持つエンコーダ. None の場合は open_encoder()
+        queue_size(int): キューの上限
+        timeout(float, optional): finish() 後に存在しないフレームを待つ時間 (秒)
+    """
+    def __init__(
+                self,
+                frame_paths: list[str],
+                filepath: str = None,
+                fps: float = 24,
+                encoder = None,
+                queue_size: int = QUEUE_SIZE,
+                timeout: float = 0):
+        super().__init__(filepath, fps=fps, encoder=encoder, queue_size=queue_size)
+
+        self.frame_paths = list(frame_paths)
+        self.timeout = timeout
+
+        self._old_stats = {}
+
+
+    def start(self):
+        """ エンコードを開始 (連番を書き出す前に呼ぶ) """
+        # 前回のフレーム {パス: (更新日時, サイズ)}
+        self._old_stats = {
+            _filepath: (_stat.mtime, _stat.size)
+            for _filepath, _stat in preflight.stat_files(self.frame_paths, ttl=0).items()
+            if _stat.is_file
+        }
+
+        super().start()
+
+
+    def put(self, data: bytes):
+        raise TypeError('MDK | SequenceEncoder reads frames from frame_paths')
+
+
+    def finish(self) -> str:
+        """ 連番の書き出し完了を通知して、エンコードの終了を待つ
+
+        Raises:
+            FileNotFoundError: 存在しないフレームがある場合
+
+        Returns:
+            str: 出力ファイルパス
+        """
+        return super().finish()
+
+
+    def _create_threads(self) -> list[threading.Thread]:
+        return [
+            threading.Thread(target=self._read_frames, name='mdk_encode_read', daemon=True),
+            *super()._create_threads(),
+        ]
+
+
+    def _put_end(self):
+        # 終了は読み込みスレッドが通知する
+        pass
+
+
+    def _read_frames(self):
+        try:
+            for _index, _filepath in enumerate(self.frame_paths):
+                _next = self.frame_paths[_index + 1] if _index + 1 < len(self.frame_paths) else None
+
+                if not self._wait_frame(_filepath, _next):
+                    return
+
+                with open(_filepath, 'rb') as _file:
+                    self._put(_file.read())
+
+        except Exception as ex:
+            self._errors.append(ex)
+            self._cancel.set()
+
+        finally:
+            self._queue.put(None)
+
+
+    def _is_written(self, filepath: str) -> bool:
+        """ start() 後に書き出されたフレームか判定 """
+        try:
+            _stat = os.stat(filepath)
+
+        except OSError:
+            return False
+
+        return self._old_stats.get(filepath) != (_stat.st_mtime, _stat.st_size)
+
+
+    def _wait_frame(self, filepath: str, next_filepath: str = None) -> bool:
+        _deadline = None
+
+        while not self._cancel.is_set():
+            if self._is_written(filepath):
+                if self._done.is_set() or (next_filepath and self._is_written(next_filepath)):
+                    return True
+
+            elif self._done.is_set() and os.path.exists(filepath):
+                return True
+
+            elif self._done.is_set():
+                if _deadline is None:
+                    _deadline = time.monotonic() + (self.timeout or 0)
+
+                if time.monotonic() >= _deadline:
+                    raise FileNotFoundError(f'MDK | Frame is not found: {filepath}')
+
+            time.sleep(POLL_INTERVAL)
+
+        return False
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def encode_sequence(frame_paths: list[str], filepath: str, fps: float = 24, encoder = None) -> str:
+    """ 書き出し済みの連番をエンコード
+
+    Returns:
+        str: 出力ファイルパス
+    """
+    _encoder = SequenceEncoder(frame_paths, filepath, fps=fps, encoder=encoder)
+    _encoder.start()
+
+    return _encoder.finish()
+
+
+def find_ffmpeg() -> str:
+    """ ffmpeg のパスを返す (環境変数 MDK_FFMPEG > PATH). 見つからない場合は None """
+    return os.environ.get(ENV_FFMPEG) or shutil.which('ffmpeg')
+
+
+def get_frame_paths(pattern: str, frames: typing.Iterable[int]) -> list[str]:
+    """ 連番パターンからフレームのパスリストを返す
+
+    Examples:
+        >>> get_frame_paths('/pb/shot.$F4.jpg', [1001, 1002])
+        ['/pb/shot.1001.jpg', '/pb/shot.1002.jpg']
+    """
+    _dirpath, _filename = os.path.split(str(pattern))
+    _split = sequence.split_pattern(_filename)
+
+    if _split is None:
+        raise ValueError(f'MDK | Not a sequence pattern: {pattern}')
+
+    _head, _padding, _tail, _ = _split
+    _prefix = os.path.join(_dirpath, _head) if _dirpath else _head
+
+    return [f'{_prefix}{_frame:0{_padding}d}{_tail}' for _frame in frames]
+
+
+def get_movie_path(pattern: str, ext: str = '.mp4') -> str:
+    """ 連番パターンから動画のパスを返す
+
+    Examples:
+        >>> get_movie_path('/pb/shot.####.jpg')
+        '/pb/shot.mp4'
+    """
+    _dirpath, _filename = os.path.split(str(pattern))
+    _split = sequence.split_pattern(_filename)
+    _name = _split[0].rstrip('._') if _split else os.path.splitext(_filename)[0]
+
+    return os.path.join(_dirpath, f'{_name}{ext}') if _dirpath else f'{_name}{ext}'
+
+
+def get_image_info(data: bytes) -> tuple[bytes, int, int]:
+    """ JPEG / PNG のバイト列から AVI の fourcc とサイズを返す
+
+    Returns:
+        tuple[bytes, int, int]: (fourcc, width, height)
+    """
+    if data.startswith(PNG_SIGNATURE):
+        _width, _height = struct.unpack('>II', data[16:24])
+        return b'MPNG', _width, _height
+
+    if data.startswith(JPEG_SIGNATURE):
+        _pos = 2
+
+        while _pos + 9 < len(data):
+            if data[_pos] != 0xFF:
+                _pos += 1
+                continue
+
+            _marker = data[_pos + 1]
+            _length = struct.unpack('>H', data[_pos + 2:_pos + 4])[0]
+
+            if _marker in JPEG_SOF_MARKERS:
+                _height, _width = struct.unpack('>HH', data[_pos + 5:_pos + 9])
+                return b'MJPG', _width, _height
+
+            _pos += 2 + _length
+
+    raise ValueError('MDK | Not supported frame format (JPEG / PNG only)')
+
+
+def open_encoder(filepath: str, fps: float = 24):
+    """ エンコーダを返す
+
+    * ffmpeg があれば FFmpegEncoder
+    * なければ AviEncoder (拡張子を '.avi' に変更)
+    """
+    if find_ffmpeg() and not str(filepath).lower().endswith('.avi'):
+        return FFmpegEncoder(filepath, fps=fps)
+
+    _filepath = os.path.splitext(str(filepath))[0] + '.avi'
+
+    if _filepath != str(filepath):
+        logger.warning('ffmpeg is not found. write %s instead of %s', _filepath, filepath)
+
+    return AviEncoder(_filepath, fps=fps)
+
+
+def _remove_file(filepath: str):
+    """ 途中まで書き出したファイルを削除 """
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
+    except OSError as ex:
+        logger.warning('failed to remove %s (%s)', filepath, ex)
+
+
+def _chunk(fourcc: bytes, data: bytes) -> bytes:
+    _pad = b'\0' if len(data) % 2 else b''
+    return fourcc + struct.pack('<I', len(data)) + data + _pad
@@ -0,0 +1,289 @@
+""" mdkapps.filetypes
+
+* ファイルタイプ判定モジュール
+
+* 拡張子のテーブル参照で判定する (大文字小文字は区別しない)
+* '.bgeo.sc' などの複数拡張子に対応
+* 'name.####.exr', 'name.%04d.exr', 'name.<UDIM>.exr', 'name.$F4.bgeo.sc'
+  などの連番パターンも拡張子で判定できる
+
+Examples:
+    >>> from mdkapps import filetypes
+    >>> filetypes.get_suffix('/cache/smoke.1001.bgeo.sc')
+    '.bgeo.sc'
+    >>> filetypes.is_type('C:/tex/diffuse.<UDIM>.EXR', 'image')
+    True
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * added: classify_files()
+        * updated: classify_files() で連番 (FileSequence) に対応
+        * updated: find_existing_files() を preflight の並列 stat に変更
+        * added: get_file_filter() (旧 FILE_FILTER_* 定数の互換用)
+        * added: 'still' (連番にできる静止画)
+        * New
+"""
+
+import re
+
+from . import preflight
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+FILE_TYPES = {
+    'abc': ('.abc',),
+    'bgeo': ('.bgeo', '.bgeo.sc', '.bgeo.gz', '.bgeo.lzma', '.bgeo.bz2'),
+    'blender': ('.blend',),
+    'fbx': ('.fbx',),
+    'hip': ('.hip', '.hiplc', '.hipnc'),
+    'image': ('.png', '.jpeg', '.jpg', '.tif', '.tiff', '.exr', '.tx', '.hdr'),
+    'image_sdr': ('.bmp', '.gif', '.png', '.jpeg', '.jpg', '.svg', '.tif', '.tiff'),
+    'max': ('.max',),
+    'maxscript': ('.ms',),
+    'maya': ('.ma', '.mb', '.abc', '.fbx', '.obj'),
+    'media': ('.bmp', '.png', '.jpeg', '.jpg', '.svg', '.tif', '.tiff', '.exr',
+              '.mp4', '.mp3', '.pdf', '.mov', '.mkv', '.dpx', '.cin', '.tga'),
+    'nuke': ('.nk', '.nknc'),
+    'obj': ('.obj',),
+    'raw': ('.cr2', '.cr3', '.dng'),
+    'script': ('.py',),
+    # 連番にできる静止画 (動画, 音声, PDF を含まない)
+    'still': ('.bmp', '.png', '.jpeg', '.jpg', '.tif', '.tiff', '.exr', '.tx', '.hdr', '.dpx', '.cin', '.tga'),
+    'text': ('.doc', '.txt', '.text', '.json', '.py', '.usda', '.nk', '.sh', '.zsh', '.bat'),
+    'usd': ('.usd', '.usda', '.usdc', '.usdz'),
+    'vdb': ('.vdb',),
+}
+
+# インポート時の分類 (優先順)
+IMPORT_KINDS = ('usd', 'image', 'abc', 'vdb', 'hip', 'maya')
+
+UNSUPPORTED = 'unsupported'
+MISSING = 'missing'
+
+# 連番パターン ('####', '%04d', '<UDIM>', '$F4', '1001')
+SEQUENCE_PATTERN = re.compile(
+    r'(?P<token>#+|@+|%0?\d*d|<udim>|<UDIM>|\$F\d*|\d+)(?=\.[^./\\]+(\.[^./\\]+)?$)'
+)
+
+
+def _build_suffix_table(file_types: dict) -> dict[str, frozenset]:
+    _table = {}
+
+    for _kind, _suffixes in file_types.items():
+        for _suffix in _suffixes:
+            _table.setdefault(_suffix.lower(), set()).add(_kind)
+
+    return {_suffix: frozenset(_kinds) for _suffix, _kinds in _table.items()}
+
+
+SUFFIX_TABLE = _build_suffix_table(FILE_TYPES)
+MAX_SUFFIX_PARTS = max(_suffix.count('.') for _suffix in SUFFIX_TABLE)
+MULTI_SUFFIX_TAILS = frozenset(
+    _suffix[_suffix.rfind('.'):] for _suffix in SUFFIX_TABLE if _suffix.count('.') > 1
+)
+
+_EMPTY = frozenset()
+_TYPE_TABLES = {}
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def get_filename(filepath: str) -> str:
+    """ パス区切り ('/', '\\') を考慮してファイル名を返す """
+    _filepath = str(filepath)
+    _index = max(_filepath.rfind('/'), _filepath.rfind('\\'))
+
+    return _filepath[_index + 1:]
+
+
+def get_suffix(filepath: str) -> str:
+    """ 拡張子を返す (小文字)
+
+    * SUFFIX_TABLE に登録されている複数拡張子 ('.bgeo.sc') を優先
+    * '.abc' のようなドットで始まるだけの名前は拡張子なしとする
+
+    Returns:
+        str: 拡張子. 見つからない場合は ''
+    """
+    _filename = get_filename(filepath)
+    _index = _filename.rfind('.')
+
+    if _index <= 0:
+        return ''
+
+    return find_suffix(_filename) or _filename[_index:].lower()
+
+
+def find_suffix(filepath: str) -> str:
+    """ SUFFIX_TABLE に登録されている拡張子を返す (小文字)
+
+    * 判定の高速化のため、ファイル名の切り出しは行わない
+
+    Returns:
+        str: 登録済みの拡張子. 見つからない場合は ''
+    """
+    _index = filepath.rfind('.')
+
+    if _index <= 0:
+        return ''
+
+    _suffix = filepath[_index:].lower()
+
+    # 複数拡張子は末尾が一致する場合のみ確認
+    if _suffix in MULTI_SUFFIX_TAILS:
+        _multi_index = _index
+
+        for _ in range(MAX_SUFFIX_PARTS - 1):
+            _multi_index = filepath.rfind('.', 0, _multi_index)
+
+            if _multi_index <= 0 or filepath[_multi_index - 1] in '/\\':
+                break
+
+            _multi_suffix = filepath[_multi_index:].lower()
+
+            if _multi_suffix in SUFFIX_TABLE:
+                _suffix = _multi_suffix
+                _index = _multi_index
+
+    if _suffix in SUFFIX_TABLE and filepath[_index - 1] not in '/\\':
+        return _suffix
+
+    return ''
+
+
+def get_kinds(filepath: str) -> frozenset:
+    """ ファイルタイプのセットを返す
+
+    Examples:
+        >>> get_kinds('/geo/chara.ABC')
+        frozenset({'abc', 'maya'})
+    """
+    return SUFFIX_TABLE.get(find_suffix(filepath), _EMPTY)
+
+
+def get_file_filter(*kinds: str) -> re.Pattern:
+    """ ファイルタイプの正規表現を返す (旧 FILE_FILTER_* 定数の互換用)
+
+    * FILE_TYPES の拡張子から作成する (大文字小文字は区別しない)
+
+    Examples:
+        >>> FILE_FILTER_ABC = get_file_filter('abc')
+        >>> bool(FILE_FILTER_ABC.match('/geo/chara.ABC'))
+        True
+    """
+    _suffixes = dict.fromkeys(_suffix for _kind in kinds for _suffix in FILE_TYPES[_kind])
+    _pattern = '|'.join(re.escape(_suffix) for _suffix in sorted(_suffixes, key=len, reverse=True))
+
+    return re.compile(rf'.+({_pattern})$', re.IGNORECASE)
+
+
+def get_type_table(kinds: tuple[str]) -> dict[str, str]:
+    """ 拡張子 -> ファイルタイプ のテーブルを返す
+
+    Args:
+        kinds(tuple[str]): ファイルタイプ (優先順)
+    """
+    try:
+        return _TYPE_TABLES[kinds]
+
+    except KeyError:
+        _table = {}
+
+        for _kind in reversed(kinds):
+            for _suffix in FILE_TYPES[_kind]:
+                _table[_suffix] = _kind
+
+        _TYPE_TABLES[kinds] = _table
+        return _table
+
+
+def get_type(filepath: str, kinds: tuple[str]) -> str:
+    """ kinds の中から最初に該当するファイルタイプを返す
+
+    Args:
+        filepath(str): ファイルパス
+        kinds(tuple[str]): 判定するファイルタイプ (優先順)
+
+    Returns:
+        str: ファイルタイプ. 該当しなければ None
+    """
+    _table = _TYPE_TABLES.get(kinds) or get_type_table(kinds)
+    return _table.get(find_suffix(filepath))
+
+
+def is_type(filepath: str, kind: str) -> bool:
+    """ ファイルタイプ判定 """
+    return kind in SUFFIX_TABLE.get(find_suffix(filepath), _EMPTY)
+
+
+def is_sequence(filepath: str) -> bool:
+    """ 連番パターン ('####', '%04d', '<UDIM>', '$F4') を含むか判定 """
+    _match = SEQUENCE_PATTERN.search(get_filename(filepath))
+
+    return bool(_match) and not _match.group('token').isdigit()
+
+
+def classify_files(
+            filepath_list: list[str],
+            kinds: tuple[str] = IMPORT_KINDS,
+            check_exists: bool = True) -> dict[str, list[str]]:
+    """ ファイルをファイルタイプごとに分類
+
+    * 1回のループで分類し、存在確認はまとめて行う
+
+    Args:
+        filepath_list(list[str | sequence.FileSequence]): ファイルパスリスト
+        kinds(tuple[str]): 分類するファイルタイプ (優先順)
+        check_exists(bool): True の場合は存在しないファイルを 'missing' に分類
+
+    Returns:
+        dict[str, list[str]]: {kind: [filepath, ...], 'unsupported': [...], 'missing': [...]}
+    """
+    kinds = tuple(kinds)
+    _table = _TYPE_TABLES.get(kinds) or get_type_table(kinds)
+    _result = {_kind: [] for _kind in kinds}
+    _result[UNSUPPORTED] = []
+    _result[MISSING] = []
+
+    # 連番 (sequence.FileSequence) はフレームがあれば存在するものとする
+    _items = [
+        _item if hasattr(_item, 'frames') else str(_item)
+        for _item in filepath_list
+    ]
+
+    if check_exists:
+        _existing = find_existing_files([_item for _item in _items if isinstance(_item, str)])
+
+    for _item in _items:
+        if isinstance(_item, str):
+            _exists = _item in _existing if check_exists else True
+        else:
+            _exists = bool(_item.frames)
+
+        if not _exists:
+            _result[MISSING].append(_item)
+            continue
+
+        _kind = _table.get(find_suffix(str(_item)), UNSUPPORTED)
+        _result[_kind].append(_item)
+
+    return _result
+
+
+def find_existing_files(filepath_list: list[str]) -> set[str]:
+    """ 存在するファイルパスを返す
+
+    * preflight.stat_files でまとめて確認する (並列 stat, 短時間キャッシュ)
+
+    Returns:
+        set[str]: 存在するファイルパス
+    """
+    return preflight.find_existing_files(filepath_list)
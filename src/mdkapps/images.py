@@ -0,0 +1,150 @@
+""" mdkapps.images
+
+* 画像書き出しモジュール (Python のみ)
+
+* ピクセルバッファ (RGB / RGBA / BGRA / BGRX) から PNG を書き出す
+* 圧縮 (zlib) は GIL を解放するため、スレッドプールで並列に書き出せる
+
+Examples:
+    >>> from mdkapps import images
+    >>> images.write_png('/pb/shot.1001.png', 1920, 1080, _pixels, mode='BGRX')
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+
+import struct
+import zlib
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# mode: (バイト数, PNG のカラータイプ)
+PIXEL_MODES = {
+    'RGB': (3, 2),
+    'RGBA': (4, 6),
+    'BGR': (3, 2),
+    'BGRA': (4, 6),
+    'BGRX': (4, 2),
+}
+
+DEFAULT_LEVEL = 6
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def encode_png(
+            width: int,
+            height: int,
+            pixels: bytes,
+            mode: str = 'RGB',
+            stride: int = None,
+            level: int = DEFAULT_LEVEL) -> bytes:
+    """ ピクセルバッファを PNG にエンコード
+
+    Args:
+        width(int): 幅
+        height(int): 高さ
+        pixels(bytes): ピクセルバッファ (上の行から)
+        mode(str): 'RGB', 'RGBA', 'BGR', 'BGRA', 'BGRX' ('BGRX' は Qt の Format_RGB32)
+        stride(int, optional): 1行のバイト数. None の場合は width * バイト数
+        level(int): zlib の圧縮レベル
+
+    Returns:
+        bytes: PNG
+    """
+    _rows = to_png_rows(width, height, pixels, mode, stride)
+    _color_type = PIXEL_MODES[mode][1]
+    _ihdr = struct.pack('>IIBBBBB', width, height, 8, _color_type, 0, 0, 0)
+
+    return b''.join((
+        PNG_SIGNATURE,
+        _png_chunk(b'IHDR', _ihdr),
+        _png_chunk(b'IDAT', zlib.compress(_rows, level)),
+        _png_chunk(b'IEND', b''),
+    ))
+
+
+def to_png_rows(width: int, height: int, pixels: bytes, mode: str = 'RGB', stride: int = None) -> bytes:
+    """ ピクセルバッファを PNG の行データ (フィルタ 0 + RGB / RGBA) に変換 """
+    if mode not in PIXEL_MODES:
+        raise ValueError(f'MDK | Not supported pixel mode: {mode}')
+
+    _bpp = PIXEL_MODES[mode][0]
+    _row_size = width * _bpp
+    stride = stride or _row_size
+
+    if len(pixels) < stride * (height - 1) + _row_size:
+        raise ValueError(f'MDK | Pixel buffer is too small: {len(pixels)} bytes for {width}x{height} {mode}')
+
+    _data = memoryview(pixels)
+
+    if stride == _row_size:
+        _data = _data[:_row_size * height]
+    else:
+        _data = b''.join(_data[_y * stride:_y * stride + _row_size] for _y in range(height))
+
+    _data = _convert_channels(bytes(_data), mode)
+    _out_row_size = len(_data) // height if height else 0
+
+    return b''.join(
+        b'\0' + _data[_y * _out_row_size:(_y + 1) * _out_row_size]
+        for _y in range(height)
+    )
+
+
+def write_png(
+            filepath: str,
+            width: int,
+            height: int,
+            pixels: bytes,
+            mode: str = 'RGB',
+            stride: int = None,
+            level: int = DEFAULT_LEVEL) -> int:
+    """ ピクセルバッファを PNG で書き出し
+
+    Returns:
+        int: 書き出したバイト数
+    """
+    _data = encode_png(width, height, pixels, mode=mode, stride=stride, level=level)
+
+    with open(filepath, 'wb') as _file:
+        _file.write(_data)
+
+    return len(_data)
+
+
+def _convert_channels(data: bytes, mode: str) -> bytes:
+    """ BGR 系の並びを RGB / RGBA に変換 """
+    if mode in ('RGB', 'RGBA'):
+        return data
+
+    _src = PIXEL_MODES[mode][0]
+    _count = len(data) // _src
+
+    if mode == 'BGRX':
+        _result = bytearray(_count * 3)
+        _result[0::3] = data[2::4]
+        _result[1::3] = data[1::4]
+        _result[2::3] = data[0::4]
+        return bytes(_result)
+
+    _result = bytearray(data)
+    _result[0::_src] = data[2::_src]
+    _result[2::_src] = data[0::_src]
+
+    return bytes(_result)
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
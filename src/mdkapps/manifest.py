@@ -0,0 +1,321 @@
+""" mdkapps.manifest
+
+* エクスポートのマニフェストで変更のない書き出しをスキップするモジュール
+
+* 出力ファイルごとにマニフェスト ('{filepath}.export.json') を保存する
+    * inputs : ノード, フレーム範囲, オプション, シーンのハッシュ, リファレンスの更新日時
+        * シーンの更新日時は記録のみ (フィンガープリントに含めない. 保存し直し・コピーでは書き出さない)
+    * output : 出力ファイルのサイズ, 更新日時, ハッシュ (ストリーミングで計算)
+* 入力のフィンガープリントが同じで、出力が変更されていなければスキップする (ヒット)
+* run_exports() はヒット・ミスを ExportReport で返す
+
+Examples:
+    >>> from mdkapps import manifest
+    >>> _source = manifest.get_source_inputs('/shot/shot.ma')
+    >>> _jobs = [{'filepath': '/cache/chara.abc', 'inputs': dict(_source, nodes=['|chara'], framerange=[1001, 1100])}]
+    >>> _report = manifest.run_exports(_jobs, lambda job: export(job))
+    >>> _report.summary()
+    {'total': 1, 'hits': 0, 'misses': 1, 'seconds': 12.3}
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+        * fixed: フィンガープリントにシーンの更新日時を含めない (ハッシュで判定し、更新日時はハッシュのキャッシュにのみ使う)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import typing
+
+from . import preflight
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+MANIFEST_SUFFIX = '.export.json'
+MANIFEST_VERSION = 1
+HASH_ALGORITHM = 'sha1'
+HASH_CHUNK_SIZE = 1 << 20
+
+# 記録のみでフィンガープリントに含めない入力
+FINGERPRINT_IGNORE_KEYS = frozenset({'scene_mtime'})
+
+# (filepath, size, mtime_ns, ctime_ns) -> hash
+_hash_cache = {}
+_hash_lock = threading.Lock()
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class ExportResult(typing.NamedTuple):
+    """ 1ファイルの書き出し結果
+
+    * reason : 'hit', 'new', 'inputs', 'output', 'force', 'unsaved'
+    """
+    filepath: str
+    hit: bool
+    seconds: float
+    reason: str = ''
+
+
+class ExportReport:
+    """ run_exports() のヒット・ミスの集計 """
+    def __init__(self, results: list[ExportResult] = None):
+        self.results = list(results or [])
+
+
+    def __repr__(self):
+        return f'{type(self).__name__}(hits={len(self.hits)}, misses={len(self.misses)})'
+
+
+    @property
+    def hits(self) -> list[ExportResult]:
+        return [_result for _result in self.results if _result.hit]
+
+
+    @property
+    def misses(self) -> list[ExportResult]:
+        return [_result for _result in self.results if not _result.hit]
+
+
+    def summary(self) -> dict:
+        return {
+            'total': len(self.results),
+            'hits': len(self.hits),
+            'misses': len(self.misses),
+            'seconds': sum(_result.seconds for _result in self.results),
+        }
+
+
+class ExportManifest:
+    """ 1つの出力ファイルのマニフェスト
+
+    Args:
+        filepath(str): 出力ファイルパス
+        fingerprint(str, optional): 入力のフィンガープリント
+        inputs(dict, optional): 入力の値 (確認用)
+        output(dict, optional): {'size', 'mtime', 'hash'}
+    """
+    def __init__(self, filepath: str, fingerprint: str = None, inputs: dict = None, output: dict = None):
+        self.output_path = str(filepath)
+        self.fingerprint = fingerprint
+        self.inputs = inputs or {}
+        self.output = output or {}
+
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.output_path!r}, fingerprint={self.fingerprint!r})'
+
+
+    @property
+    def filepath(self) -> str:
+        return get_manifest_path(self.output_path)
+
+
+    @classmethod
+    def load(cls, filepath: str) -> 'ExportManifest':
+        """ マニフェストを読み込み
+
+        * ファイルがない・壊れている・バージョンが違う場合は空のマニフェスト
+        """
+        _manifest = cls(filepath)
+
+        try:
+            with open(_manifest.filepath, encoding='utf-8') as _file:
+                _data = json.load(_file)
+
+        except (OSError, ValueError):
+            return _manifest
+
+        if _data.get('version') != MANIFEST_VERSION:
+            return _manifest
+
+        _manifest.fingerprint = _data.get('fingerprint')
+        _manifest.inputs = _data.get('inputs', {})
+        _manifest.output = _data.get('output', {})
+
+        return _manifest
+
+
+    def save(self):
+        """ マニフェストを保存 (一時ファイルに書いてから置き換え) """
+        _data = {
+            'version': MANIFEST_VERSION,
+            'fingerprint': self.fingerprint,
+            'inputs': self.inputs,
+            'output': self.output,
+        }
+
+        _filepath = self.filepath
+        _tmp_filepath = f'{_filepath}.tmp'
+
+        with open(_tmp_filepath, 'w', encoding='utf-8') as _file:
+            json.dump(_data, _file, indent=1, sort_keys=True, default=str)
+
+        os.replace(_tmp_filepath, _filepath)
+
+
+    def check(self, fingerprint: str) -> str:
+        """ 書き出しが必要か判定
+
+        * サイズと更新日時が同じなら出力のハッシュは計算しない
+
+        Returns:
+            str: 'hit' (スキップ可), 'new', 'inputs', 'output'
+        """
+        if self.fingerprint is None:
+            return 'new'
+
+        if self.fingerprint != fingerprint:
+            return 'inputs'
+
+        _stat = preflight.stat_file(self.output_path, ttl=0)
+
+        if not _stat.is_file or _stat.size != self.output.get('size'):
+            return 'output'
+
+        if _stat.mtime == self.output.get('mtime'):
+            return 'hit'
+
+        if get_file_hash(self.output_path) == self.output.get('hash'):
+            return 'hit'
+
+        return 'output'
+
+
+    def update(self, fingerprint: str, inputs: dict = None):
+        """ 書き出した出力を記録
+
+        Raises:
+            FileNotFoundError: 出力ファイルがない場合
+        """
+        _stat = preflight.stat_file(self.output_path, ttl=0)
+
+        if not _stat.is_file:
+            raise FileNotFoundError(f'MDK | Export output is not found: {self.output_path}')
+
+        self.fingerprint = fingerprint
+        self.inputs = inputs or {}
+        self.output = {
+            'size': _stat.size,
+            'mtime': _stat.mtime,
+            'hash': get_file_hash(self.output_path),
+        }
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def get_file_hash(filepath: str) -> str:
+    """ ファイルのハッシュ (パス, サイズ, 更新日時, 変更日時が同じ間はキャッシュ) """
+    _stat = os.stat(filepath)
+    _key = (str(filepath), _stat.st_size, _stat.st_mtime_ns, _stat.st_ctime_ns)
+
+    with _hash_lock:
+        _hash = _hash_cache.get(_key)
+
+    if _hash is None:
+        _hash = hash_file(filepath)
+
+        with _hash_lock:
+            _hash_cache[_key] = _hash
+
+    return _hash
+
+
+def get_manifest_path(filepath: str) -> str:
+    return f'{filepath}{MANIFEST_SUFFIX}'
+
+
+def get_source_inputs(scene: str, references: list[str] = None) -> dict:
+    """ シーンファイルとリファレンスの入力情報
+
+    * シーンはハッシュ、リファレンスは更新日時とサイズ
+    * シーンの更新日時は記録のみ (FINGERPRINT_IGNORE_KEYS)
+        * ハッシュはパス, サイズ, 更新日時が同じ間は計算し直さない (get_file_hash)
+
+    Returns:
+        dict: {'scene': str, 'scene_mtime': float, 'scene_hash': str, 'references': [[path, mtime, size], ...]}
+    """
+    _stats = preflight.stat_files([scene] + sorted(set(references or [])), ttl=0)
+    _scene_stat = _stats.pop(str(scene))
+
+    return {
+        'scene': str(scene),
+        'scene_mtime': _scene_stat.mtime,
+        'scene_hash': get_file_hash(scene) if _scene_stat.is_file else None,
+        'references': [[_path, _stat.mtime, _stat.size] for _path, _stat in _stats.items()],
+    }
+
+
+def hash_file(filepath: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """ ファイルのハッシュをストリーミングで計算 (ファイル全体をメモリに読み込まない) """
+    _hash = hashlib.new(HASH_ALGORITHM)
+
+    with open(filepath, 'rb') as _file:
+        while _chunk := _file.read(chunk_size):
+            _hash.update(_chunk)
+
+    return _hash.hexdigest()
+
+
+def make_fingerprint(inputs: dict) -> str:
+    """ 入力のフィンガープリント (FINGERPRINT_IGNORE_KEYS は含めない) """
+    _inputs = {_key: _value for _key, _value in inputs.items() if _key not in FINGERPRINT_IGNORE_KEYS}
+    _data = json.dumps(_inputs, sort_keys=True, default=str)
+    return hashlib.sha1(_data.encode('utf-8')).hexdigest()
+
+
+def run_exports(jobs: list[dict], export, force: bool = False, callback=None) -> ExportReport:
+    """ マニフェストを確認して、必要なジョブだけ書き出し
+
+    * job['inputs'] が None の場合 (未保存のシーンなど) は常に書き出し、マニフェストも更新しない
+
+    Args:
+        jobs(list[dict]): [{'filepath': str, 'inputs': dict, ...}, ...]
+        export(Callable): export(job) で書き出し
+        force(bool): True の場合はすべて書き出し
+        callback(Callable, optional): callback(done, total, ExportResult) で進捗を通知
+
+    Returns:
+        ExportReport: ヒット・ミスの結果
+    """
+    _report = ExportReport()
+    _total = len(jobs)
+
+    for _done, _job in enumerate(jobs, 1):
+        _start = time.perf_counter()
+        _filepath = str(_job['filepath'])
+        _inputs = _job.get('inputs')
+
+        if _inputs is None:
+            export(_job)
+            _reason = 'unsaved'
+
+        else:
+            _fingerprint = make_fingerprint(_inputs)
+            _manifest = ExportManifest.load(_filepath)
+            _reason = 'force' if force else _manifest.check(_fingerprint)
+
+            if _reason != 'hit':
+                export(_job)
+                _manifest.update(_fingerprint, _inputs)
+                _manifest.save()
+
+        _result = ExportResult(_filepath, _reason == 'hit', time.perf_counter() - _start, _reason)
+        _report.results.append(_result)
+
+        if callback:
+            callback(_done, _total, _result)
+
+    return _report
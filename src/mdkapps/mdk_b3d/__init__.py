@@ -8,11 +8,20 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.2 2026-10-18 Tatsuya Yamagishi
+        * updated: ファイル判定を mdkapps.filetypes に変更
+        * added: is_abc()
+        * added: classify_files()
+        * fixed: import_files()
+        * updated: ファイルの存在確認を preflight に変更
+        * added: get_scene_state() でシーン状態をまとめて取得 (ハンドラで破棄するキャッシュ)
+        * fixed: FILE_FILTER_USD を filetypes から作成する互換定数として復元
+
     * v0.0.1 2024-11-15 Tatsuya Yamagishi
         * added: path
 """
 
-VERSION = 'v0.0.1'
+VERSION = 'v0.0.2'
 NAME = 'mdk_b3d'
 
 import os
@@ -25,6 +34,10 @@ import sys
 
 import bpy
 
+from .. import filetypes
+from .. import preflight
+from .. import scene
+
 
 if os.environ.get('MDK_DEBUG'):
     print('MDK | ---------------------------')
@@ -37,8 +50,6 @@ if os.environ.get('MDK_DEBUG'):
 #=======================================#
 # Settings
 #=======================================#
-FILE_FILTER_USD = re.compile(r'.+\.(usd|usdc|usda)')
-
 EXT_LIST = [
     '.b3d',
     '.abc',
@@ -55,6 +66,17 @@ EXT_DICT = {
     'usd': '.usd',
 }
 
+# 旧バージョン互換のファイル判定 (filetypes.FILE_TYPES から作成)
+FILE_FILTER_USD = filetypes.get_file_filter('usd')
+
+# import_files の分類 (優先順)
+IMPORT_KINDS = ('usd', 'abc')
+
+# get_scene_state のキャッシュを破棄するハンドラ
+SCENE_STATE_HANDLERS = ('load_post', 'save_post', 'depsgraph_update_post')
+
+_scene_state_cache = scene.SceneStateCache()
+
 
 # ======================================= #
 # Functions
@@ -86,15 +108,45 @@ def create_playblast(filepath: str, size: list|tuple=None, range: list|tuple=Non
     raise RuntimeError('未実装')
 
 
+@bpy.app.handlers.persistent
+def _on_scene_changed(*args):
+    """ get_scene_state() のキャッシュを破棄 (ファイルを開いても残るハンドラ) """
+    _scene_state_cache.invalidate()
+
+
+def install_scene_callbacks():
+    """ get_scene_state() のキャッシュを破棄するハンドラを登録 (1回のみ)
+
+    * ファイルを開く・保存, depsgraph の更新 (選択, シーン設定の変更)
+    """
+    for _name in SCENE_STATE_HANDLERS:
+        _handlers = getattr(bpy.app.handlers, _name)
+
+        if _on_scene_changed not in _handlers:
+            _handlers.append(_on_scene_changed)
+
+
+def uninstall_scene_callbacks():
+    """ install_scene_callbacks() で登録したハンドラを削除 """
+    for _name in SCENE_STATE_HANDLERS:
+        _handlers = getattr(bpy.app.handlers, _name)
+
+        if _on_scene_changed in _handlers:
+            _handlers.remove(_on_scene_changed)
+
+    _scene_state_cache.invalidate()
+
+
 def open_dir(filepath):
     """
     フォルダを開く
     """
     _filepath = pathlib.Path(filepath)
+    _stat = preflight.stat_file(filepath)
     OS_NAME = platform.system()
 
-    if _filepath.exists():
-        if _filepath.is_file():
+    if _stat.exists:
+        if _stat.is_file:
             _filepath = _filepath.parent
 
         if OS_NAME == 'Windows':
@@ -116,6 +168,15 @@ class AppMain:
     def __init__(self):
         pass
 
+    def classify_files(self, filepath_list: list[str]) -> dict[str, list[str]]:
+        """ ファイルをインポート方法ごとに分類
+
+        Returns:
+            dict[str, list[str]]: {'usd', 'abc', 'unsupported', 'missing'}
+        """
+        return filetypes.classify_files(filepath_list, IMPORT_KINDS)
+
+
     def get_ext(self, key: str = None) -> str:
         return '.b3d'
 
@@ -136,6 +197,38 @@ class AppMain:
         return _start_frame, _start_frame, _end_frame, _end_frame
     
 
+    def get_scene_state(self) -> scene.SceneState:
+        """ シーン状態 (ファイルパス, FPS, フレーム範囲, レンダーサイズ, レンダラー, 選択) をまとめて返す
+
+        * キャッシュを返し、load_post / save_post / depsgraph_update_post ハンドラで破棄する
+
+        Returns:
+            scene.SceneState: 不変のスナップショット
+        """
+        install_scene_callbacks()
+        return _scene_state_cache.get(self.query_scene_state)
+
+
+    def invalidate_scene_state(self):
+        """ get_scene_state() のキャッシュを破棄 """
+        _scene_state_cache.invalidate()
+
+
+    def query_scene_state(self) -> scene.SceneState:
+        """ シーン状態を問い合わせ (キャッシュしない) """
+        _scene = bpy.context.scene
+        _render = _scene.render
+
+        return scene.SceneState(
+            filepath=self.get_filepath(),
+            fps=_render.fps / _render.fps_base,
+            framerange=tuple(self.get_framerange()),
+            render_size=(_render.resolution_x, _render.resolution_y),
+            render=_render.engine,
+            selection=tuple(_obj.name for _obj in self.get_selected_nodes()),
+        )
+
+
     def get_selected_nodes(self):
         """ 選択中のオブジェクトをリストとして取得 
         # selected_objects = bpy.context.selected_objects
@@ -160,8 +253,24 @@ class AppMain:
             self.import_abc(filepath)
 
     def import_files(self, filepath_list: list[str], namespace=None):
-        for _filepath in filepath_list:
-            self.import_file(_filepath, namespace=namespace)
+        """ 複数ファイルをインポート
+
+        * classify_files で分類してから、ファイルタイプごとにまとめてインポート
+        * 存在しない・未対応のファイルがあればインポート前にエラー
+        """
+        _groups = self.classify_files(filepath_list)
+
+        if _groups['missing']:
+            raise FileNotFoundError(f'MDK | File is not found: {_groups["missing"]}')
+
+        if _groups['unsupported']:
+            raise TypeError(f'MDK | Not supported file type: {_groups["unsupported"]}')
+
+        for _filepath in _groups['usd']:
+            self.import_usd(_filepath)
+
+        for _filepath in _groups['abc']:
+            self.import_abc(_filepath)
 
 
     @context_window
@@ -205,9 +314,14 @@ class AppMain:
                 scale=scale,)
 
 
-    def is_usd(self, filepath: str) -> tuple:
+    def is_abc(self, filepath: str) -> bool:
+        """ Alembicファイル判定 """
+        return filetypes.is_type(filepath, 'abc')
+
+
+    def is_usd(self, filepath: str) -> bool:
         """ USDファイル判定 """
-        return FILE_FILTER_USD.match(filepath)
+        return filetypes.is_type(filepath, 'usd')
     
 
     
@@ -8,13 +8,33 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.2 2026-10-18 Tatsuya Yamagishi
+        * updated : ファイル判定を mdkapps.filetypes に変更
+        * added : is_bgeo()
+        * added : classify_files(), import_files()
+        * updated : import_files() で連番VDBを1ノードにまとめる
+        * updated : ファイルの存在確認を preflight に変更
+        * updated : import_files() を1つのUndoグループで作成し、最後にまとめてレイアウト
+        * added : get_unique_names()
+        * updated : デバッグ出力を logging に変更
+        * fixed : import_vdb() の geo ネットワークでのノード作成と戻り値
+        * added : create_playblast(mp4=True) で連番を書き出しながら動画にエンコード
+        * added : iter_playblast() で1フレームごとに進捗を通知
+        * added : create_playblasts() で複数ショットを1つのセッションでフリップブック
+        * added : get_scene_state() でシーン状態をまとめて取得 (イベントコールバックで破棄するキャッシュ)
+        * added : apply_shot_settings() で違う値だけを1つのUndoグループで設定, get_shot_settings()
+        * fixed : get_framerange() の cutin, cutout を再生範囲から取得
+        * added : collect_file_dependencies() でシーン全体の参照ファイルをまとめて確認 (mdkapps.dependencies), get_parm_filepath()
+        * fixed : FILE_FILTER_* を filetypes から作成する互換定数として復元
+
     * v0.0.1 2025-06-17 Tatsuya Yamagishi
         * New
 """
 
-VERSION = 'v0.0.1'
+VERSION = 'v0.0.2'
 NAME = 'mdk_houdini'
 
+import logging
 import os
 import re
 import pathlib
@@ -24,6 +44,14 @@ import sys
 
 import hou
 
+from .. import dependencies
+from .. import encode
+from .. import filetypes
+from .. import playblast
+from .. import preflight
+from .. import scene
+from .. import sequence
+
 
 if os.environ.get('MDK_DEBUG'):
     print('MDK | ---------------------------')
@@ -34,6 +62,8 @@ if os.environ.get('MDK_DEBUG'):
 # ======================================= #
 # Settings
 # ======================================= #
+logger = logging.getLogger(__name__)
+
 EXT = {
     'hindie': '.hiplc',
     'houdinifx': '.hip',
@@ -53,9 +83,36 @@ EXT_DICT = {
     'usd': '.usd',
 }
 
-FILE_FILTER_HIP = re.compile(r'.+\.(hip)')
-FILE_FILTER_USD = re.compile(r'.+\.(usd|usdc|usda|usdz)')
-FILE_FILTER_VBD = re.compile(r'.+\.(vdb)')
+# 旧バージョン互換のファイル判定 (filetypes.FILE_TYPES から作成)
+FILE_FILTER_HIP = filetypes.get_file_filter('hip')
+FILE_FILTER_USD = filetypes.get_file_filter('usd')
+FILE_FILTER_VBD = filetypes.get_file_filter('vdb')
+
+# import_files の分類 (優先順)
+IMPORT_KINDS = ('usd', 'vdb', 'hip')
+
+# import_files で連番にまとめるファイルタイプ
+SEQUENCE_KINDS = ('vdb',)
+
+# get_scene_state のキャッシュの有効時間 (秒)
+# FPS とフレーム範囲の変更はコールバックで検知できないため、短い時間で期限切れにする
+SCENE_STATE_TTL = 1.0
+
+_scene_state_cache = scene.SceneStateCache(ttl=SCENE_STATE_TTL)
+_scene_state_callbacks = []
+
+# set_unit の単位 {名前: スケール}
+UNIT_SCALE_DICT = {
+    'centimeter': 0.01,
+    'millimeter': 0.001,
+    'meter': 1.0,
+    'kilometer': 1000.0,
+}
+
+# apply_shot_settings で比較する前の変換 (set_* で設定される精度に合わせる)
+SHOT_SETTINGS_COMPARE = {
+    'fps': lambda value: int(float(value)+0.05),
+}
 
 FILENODE_DICT = {
     'alembic': 'filename',
@@ -72,6 +129,11 @@ FILENODE_DICT = {
     'volume': 'filepath1',
 }
 
+# ファイルパスのフレーム変数 ('$F', '$F4') → '#' のパターンに変換
+FRAME_VAR_PATTERN = re.compile(r'\$F(\d*)(?![A-Za-z_])')
+
+USD_FORMAT_ARGS = ':SDF_FORMAT_ARGS:format=usda'
+
 # ======================================= #
 # Functins
 # ======================================= #
@@ -87,15 +149,60 @@ def create_playblast(filepath: str, size: list|tuple=None, range: list|tuple=Non
     raise RuntimeError('未実装')
 
 
+def get_parm_filepath(parm) -> str:
+    """ ファイルパスのパラメータを連番のパターンのまま展開
+
+    * '$F4' は '####' に変換し、それ以外の変数 ($HIP, $JOB など) を展開する
+    * エキスプレッション・キーフレームのパラメータは現在のフレームで評価
+    """
+    try:
+        _value = FRAME_VAR_PATTERN.sub(lambda _match: '#' * int(_match.group(1) or 1), parm.unexpandedString())
+        _filepath = hou.text.expandString(_value)
+
+    except hou.OperationFailed:
+        _filepath = parm.evalAsString()
+
+    return _filepath.replace(USD_FORMAT_ARGS, '')
+
+
+def install_scene_callbacks():
+    """ get_scene_state() のキャッシュを破棄するコールバックを登録 (1回のみ)
+
+    * hou.hipFile (開く, 保存, クリア), 選択 (UI がある場合)
+    """
+    if _scene_state_callbacks:
+        return
+
+    # 削除するときに同じオブジェクトを渡すため、バウンドメソッドを保持する
+    _callback = _scene_state_cache.invalidate
+
+    hou.hipFile.addEventCallback(_callback)
+    _scene_state_callbacks.append((hou.hipFile.removeEventCallback, _callback))
+
+    if hou.isUIAvailable():
+        hou.ui.addSelectionCallback(_callback)
+        _scene_state_callbacks.append((hou.ui.removeSelectionCallback, _callback))
+
+
+def uninstall_scene_callbacks():
+    """ install_scene_callbacks() で登録したコールバックを削除 """
+    for _remove, _callback in _scene_state_callbacks:
+        _remove(_callback)
+
+    _scene_state_callbacks.clear()
+    _scene_state_cache.invalidate()
+
+
 def open_dir(filepath):
     """
     フォルダを開く
     """
     _filepath = pathlib.Path(filepath)
+    _stat = preflight.stat_file(filepath)
     OS_NAME = platform.system()
 
-    if _filepath.exists():
-        if _filepath.is_file():
+    if _stat.exists:
+        if _stat.is_file:
             _filepath = _filepath.parent
 
         if OS_NAME == 'Windows':
@@ -113,7 +220,7 @@ def open_in_explorer(filepath: str):
     """
     Explorerでフォルダを開く
     """
-    if os.path.exists(filepath):
+    if preflight.exists(filepath):
         if platform.system() == 'Windows':
             filepath = str(filepath)
             filepath = filepath.replace('/', '\\')
@@ -137,13 +244,110 @@ class AppMain:
         self._unit_scale = 0.01
     
 
+    def apply_shot_settings(self, settings: dict) -> dict:
+        """ ショット設定をまとめて適用
+
+        * 現在値を1回だけ取得し、違う値だけを設定する
+        * 1つのUndoグループにまとめて設定する
+        * Houdini で設定できる項目 (unit, fps, framerange) 以外は無視
+
+        Args:
+            settings(dict): {'unit', 'fps', 'framerange', ...}
+
+        Returns:
+            dict: 変更した項目 {key: (変更前, 変更後)}
+        """
+        _setters = {
+            'fps': self.set_fps,
+            'framerange': lambda values: self.set_framerange(*values),
+            'unit': self.set_unit,
+        }
+
+        _changes = scene.diff_settings(
+                self.get_shot_settings(), settings, keys=_setters, compare=SHOT_SETTINGS_COMPARE)
+
+        if not _changes:
+            return _changes
+
+        with hou.undos.group('MDK | Apply Shot Settings'):
+            scene.apply_settings(_changes, _setters)
+
+        self.invalidate_scene_state()
+
+        for _key, (_before, _after) in _changes.items():
+            logger.info('%s = %s -> %s', _key, _before, _after)
+
+        return _changes
+
+
+    def classify_files(self, filepath_list: list[str]) -> dict[str, list[str]]:
+        """ ファイルをインポート方法ごとに分類
+
+        Returns:
+            dict[str, list[str]]: {'usd', 'vdb', 'hip', 'unsupported', 'missing'}
+        """
+        return filetypes.classify_files(filepath_list, IMPORT_KINDS)
+
+
+    def collect_file_dependencies(
+                self,
+                node_types: list[str] = None,
+                stale_time: float = None) -> dependencies.DependencyReport:
+        """ シーン全体の参照ファイルをまとめて確認
+
+        * FILENODE_DICT のノードタイプのインスタンスを1回だけ集める (選択に関係なくシーン全体)
+        * '$F4' などのフレーム変数は連番のパターンとして確認
+        * 同じファイルは1回だけ、すべてのファイルをスレッドプールで stat する
+
+        Args:
+            node_types(list[str], optional): 確認するノードタイプ (FILENODE_DICT のキー). None の場合はすべて
+            stale_time(float, optional): この時刻より後に更新されたファイルを stale にする. None の場合は hip の保存日時
+
+        Returns:
+            dependencies.DependencyReport: missing, empty, stale とノードタイプごとの参照ファイル
+        """
+        if node_types is None:
+            node_types = list(FILENODE_DICT)
+
+        if stale_time is None:
+            stale_time = dependencies.get_scene_time(hou.hipFile.path())
+
+        _entries = []
+
+        for _category in hou.nodeTypeCategories().values():
+            for _type_name in node_types:
+                _node_type = _category.nodeType(_type_name)
+
+                if _node_type is None:
+                    continue
+
+                for _node in _node_type.instances():
+                    _parm = _node.parm(FILENODE_DICT[_type_name])
+
+                    if _parm is not None:
+                        _entries.append((_type_name, _node.path(), get_parm_filepath(_parm)))
+
+        return dependencies.collect_dependencies(_entries, stale_time=stale_time, kinds=SEQUENCE_KINDS)
+
+
     def create_playblast(
             self,
             filepath,
             size: tuple[int]|list[int],
             framerange: tuple[int],
+            mp4: bool = False,
         ):
+        """ フリップブックを作成
 
+        Args:
+            filepath(str): 出力パス ('/pb/shot.$F4.jpg')
+            size(tuple[int] | list[int]): サイズ
+            framerange(tuple[int]): フレーム範囲
+            mp4(bool): True の場合は連番を書き出しながら動画にエンコード (mdkapps.encode)
+
+        Returns:
+            str: 動画のパス (mp4=False の場合は None)
+        """
 
         _cur_desktop = hou.ui.curDesktop()
         _scene = _cur_desktop.paneTabOfType(hou.paneTabType.SceneViewer)
@@ -159,7 +363,131 @@ class AppMain:
         _flip_options.outputToMPlay(False)
         _flip_options.frameRange(framerange)
         _flip_options.output(filepath)
-        _scene.flipbook(_scene.curViewport(), _flip_options)
+
+        if not mp4:
+            _scene.flipbook(_scene.curViewport(), _flip_options)
+            return None
+
+        _frame_paths = [
+            hou.expandStringAtFrame(filepath, _frame)
+            for _frame in range(int(framerange[0]), int(framerange[1]) + 1)
+        ]
+
+        with encode.SequenceEncoder(
+                _frame_paths,
+                encode.get_movie_path(filepath),
+                fps=self.get_fps()) as _encoder:
+            _scene.flipbook(_scene.curViewport(), _flip_options)
+
+        return _encoder.output
+
+
+    def create_playblasts(
+            self,
+            shots: list[dict],
+            filepath: str,
+            size: tuple[int]|list[int] = None,
+            ext: str = 'jpg',
+            callback = None,
+        ) -> list[playblast.ShotResult]:
+        """ 複数ショットのフリップブックを1つのセッションで作成
+
+        * フリップブックの設定は最初に1回だけ作成し、ショットごとにカメラ・範囲・サイズを切り替える
+        * 終了後にビューポートのカメラを元に戻す
+        * 出力は '{filepath}/{name}.$F4.{ext}'
+
+        Args:
+            shots(list[dict]): [{'name', 'camera', 'framerange', 'size', 'ext'}, ...]
+            filepath(str): 出力ディレクトリ
+            size(tuple[int] | list[int], optional): ショットに 'size' がない場合のサイズ
+            ext(str): ショットに 'ext' がない場合の拡張子
+            callback(Callable, optional): callback(done, total, ShotResult)
+
+        Returns:
+            list[playblast.ShotResult]: ショットごとの出力と時間
+        """
+        _shots = playblast.normalize_shots(shots, size, ext)
+        _scene = hou.ui.curDesktop().paneTabOfType(hou.paneTabType.SceneViewer)
+
+        if not _scene:
+            raise RuntimeError('MDK | Scene Viewer is not found')
+
+        if not _scene.isCurrentTab():
+            _scene.setIsCurrentTab()
+
+        _viewport = _scene.curViewport()
+        _camera = _viewport.camera()
+        _default_camera = _viewport.defaultCamera().stash()
+
+        _flip_options = _scene.flipbookSettings().stash()
+        _flip_options.outputToMPlay(False)
+
+        def _render_shot(shot: dict) -> str:
+            if shot['camera']:
+                _viewport.setCamera(hou.node(shot['camera']))
+
+            _output = f'{filepath}/{shot["name"]}.$F4.{shot["ext"]}'
+
+            if shot['size']:
+                _flip_options.resolution(shot['size'])
+
+            _flip_options.frameRange(shot['framerange'])
+            _flip_options.output(_output)
+            _scene.flipbook(_viewport, _flip_options)
+
+            return _output
+
+        try:
+            return playblast.run_shots(_shots, _render_shot, callback=callback)
+
+        finally:
+            if _camera is not None:
+                _viewport.setCamera(_camera)
+            else:
+                _viewport.setDefaultCamera(_default_camera)
+
+
+    def iter_playblast(
+            self,
+            filepath,
+            size: tuple[int]|list[int],
+            framerange: tuple[int],
+            cancel_event = None,
+        ):
+        """ 1フレームずつフリップブックして結果を返すジェネレータ
+
+        * ループを抜ける (close()) か cancel_event をセットするとキャンセル
+
+        Args:
+            filepath(str): 出力パス ('/pb/shot.$F4.jpg')
+
+        Yields:
+            playblast.FrameResult: (frame, path, seconds, size)
+        """
+        _scene = hou.ui.curDesktop().paneTabOfType(hou.paneTabType.SceneViewer)
+
+        if not _scene:
+            return
+
+        if not _scene.isCurrentTab():
+            _scene.setIsCurrentTab()
+
+        _flip_options = _scene.flipbookSettings().stash()
+        _flip_options.resolution(size)
+        _flip_options.outputToMPlay(False)
+        _flip_options.output(filepath)
+        _viewport = _scene.curViewport()
+
+        def _render_frame(frame: int):
+            _flip_options.frameRange((frame, frame))
+            _scene.flipbook(_viewport, _flip_options)
+
+        yield from playblast.iter_frames(
+            _render_frame,
+            range(int(framerange[0]), int(framerange[1]) + 1),
+            lambda frame: hou.expandStringAtFrame(filepath, frame),
+            cancel_event=cancel_event,
+        )
 
 
 
@@ -179,6 +507,42 @@ class AppMain:
             return hou.node(_network_path)
         
 
+    def get_shot_settings(self) -> dict:
+        """ ショット設定の現在値 (apply_shot_settings 用) """
+        return {
+            'unit': next((_name for _name, _scale in UNIT_SCALE_DICT.items() if _scale == self._unit_scale), None),
+            'fps': self.get_fps(),
+            'framerange': tuple(self.get_framerange()),
+        }
+
+
+    def get_unique_names(self, names: list[str], root_node) -> list[str]:
+        """ ネットワーク内で重複しないノード名のリストを返す
+
+        * 既存の子ノード名と、リスト内の名前どうしの重複を避ける
+        * 子ノード名の取得は1回だけ行う
+
+        Examples:
+            >>> get_unique_names(['smoke', 'smoke'], hou.node('/obj'))
+            ['smoke', 'smoke_1']
+        """
+        _used = {_node.name() for _node in root_node.children()}
+        _result = []
+
+        for _name in names:
+            _unique_name = _name
+            _index = 1
+
+            while _unique_name in _used:
+                _unique_name = f'{_name}_{_index}'
+                _index += 1
+
+            _used.add(_unique_name)
+            _result.append(_unique_name)
+
+        return _result
+
+
     def get_default_ext(self) -> str:
         """ 拡張子を返す 
         
@@ -225,11 +589,39 @@ class AppMain:
     def get_framerange(self) -> tuple[int]:
         """ Plugin Builtin Function """
         head_in, tail_out = hou.playbar.frameRange()
-        cut_in, cut_out = hou.playbar.frameRange()
+        cut_in, cut_out = hou.playbar.playbackRange()
 
         return head_in, cut_in, cut_out, tail_out
     
 
+    def get_scene_state(self) -> scene.SceneState:
+        """ シーン状態 (ファイルパス, FPS, フレーム範囲, 選択) をまとめて返す
+
+        * キャッシュを返し、hipFile と選択のイベントで破棄する (SCENE_STATE_TTL 秒で期限切れ)
+        * レンダーサイズとレンダラーは None
+
+        Returns:
+            scene.SceneState: 不変のスナップショット
+        """
+        install_scene_callbacks()
+        return _scene_state_cache.get(self.query_scene_state)
+
+
+    def invalidate_scene_state(self):
+        """ get_scene_state() のキャッシュを破棄 """
+        _scene_state_cache.invalidate()
+
+
+    def query_scene_state(self) -> scene.SceneState:
+        """ シーン状態を問い合わせ (キャッシュしない) """
+        return scene.SceneState(
+            filepath=self.get_filepath(),
+            fps=self.get_fps(),
+            framerange=tuple(self.get_framerange()),
+            selection=tuple(_node.path() for _node in hou.selectedNodes()),
+        )
+
+
     def get_main_window(self):
         """ Get the Houdini main window.
 
@@ -297,19 +689,13 @@ class AppMain:
         _root_node = hou.node(_network_path)
         _name = self.optimize_name(pathlib.Path(filepath).stem)
 
-        if os.path.exists(filepath):
-            if self.is_usd(filepath):
-                _node = self.import_usd(filepath, name=_name, network=_network_path, root_node=_root_node)
-
-            elif self.is_vdb(filepath):
-                _node = self.import_vdb(filepath, name=_name, network=_network_path, root_node=_root_node)
+        if preflight.exists(filepath):
+            _kind = filetypes.get_type(filepath, IMPORT_KINDS)
 
-            elif self.is_hip(filepath):
-                _node = self.import_hipfile(filepath)
-
-            else:
+            if _kind is None:
                 raise TypeError()
-            
+
+            _node = self.import_kind(_kind, filepath, name=_name, network=_network_path, root_node=_root_node)
 
             if _node:
                 _node.moveToGoodPosition()
@@ -321,6 +707,70 @@ class AppMain:
         
 
 
+    def import_files(self, filepath_list: list[str]) -> list:
+        """ 複数ファイルをインポート
+
+        * classify_files で分類してから、ファイルタイプごとにまとめてインポート
+        * 存在しない・未対応のファイルがあればインポート前にエラー
+        * 連番のVDBは '$F4' のパスで1つのノードにまとめる
+        """
+        _groups = self.classify_files(sequence.collapse(filepath_list, kinds=SEQUENCE_KINDS))
+
+        if _groups['missing']:
+            raise FileNotFoundError(f'MDK | File is not found: {_groups["missing"]}')
+
+        if _groups['unsupported']:
+            raise TypeError(f'MDK | Not supported file type: {_groups["unsupported"]}')
+
+        _network_path = self.get_current_network_path()
+        _root_node = hou.node(_network_path)
+
+        _items = []
+
+        for _kind in IMPORT_KINDS:
+            for _item in _groups[_kind]:
+                if isinstance(_item, sequence.FileSequence):
+                    _filepath = _item.pattern(sequence.STYLE_HOUDINI)
+                    _name = self.optimize_name(_item.head.rstrip('._'))
+                else:
+                    _filepath = _item
+                    _name = self.optimize_name(pathlib.Path(_filepath).stem)
+
+                _items.append((_kind, _filepath, _name))
+
+        _names = self.get_unique_names([_name for _, _, _name in _items], _root_node)
+        _nodes = []
+
+        # ノード作成は1つのUndoにまとめ、レイアウトは最後に1回だけ行う
+        with hou.undos.group('MDK | Import Files'):
+            for (_kind, _filepath, _), _name in zip(_items, _names):
+                logger.debug('import %s = %s (%s)', _kind, _filepath, _name)
+                _node = self.import_kind(_kind, _filepath, name=_name, network=_network_path, root_node=_root_node)
+
+                if _node:
+                    _nodes.append(_node)
+
+            if _nodes:
+                _root_node.layoutChildren(items=_nodes)
+
+        return _nodes
+
+
+    def import_kind(self, kind: str, filepath: str, name: str=None, network=None, root_node=None):
+        """ ファイルタイプを指定してインポート """
+        if kind == 'usd':
+            return self.import_usd(filepath, name=name, network=network, root_node=root_node)
+
+        elif kind == 'vdb':
+            return self.import_vdb(filepath, name=name, network=network, root_node=root_node)
+
+        elif kind == 'hip':
+            return self.import_hipfile(filepath)
+
+        else:
+            raise TypeError(f'MDK | Not supported file type: {kind}')
+
+
     def import_hipfile(self, filepath: str):
         """ hipファイルを読み込み """
 
@@ -342,8 +792,7 @@ class AppMain:
             _node_type = root_node.type().name()
 
 
-        print(f'MDK | Houdini | {network=}')
-        print(f'MDK | Houdini | {filepath=}')
+        logger.debug('import_usd | network = %s, filepath = %s', network, filepath)
 
 
         if _node_type == 'obj':
@@ -353,12 +802,12 @@ class AppMain:
             _node.setDisplayFlag(_DISPLAY_FLAG)
 
         elif _node_type == 'geo':
-            _node = root_node.createNode('usdimport')
+            _node = root_node.createNode('usdimport', name)
             _node.parm('filepath1').set(filepath)
             _node.setDisplayFlag(_DISPLAY_FLAG)
 
         elif _node_type == 'stage' or _node_type == 'lopnet':
-            _node = root_node.createNode('reference')
+            _node = root_node.createNode('reference', name)
             _node.parm('filepath1').set(filepath)
             _node.setDisplayFlag(_DISPLAY_FLAG)
 
@@ -367,13 +816,16 @@ class AppMain:
 
 
     def import_vdb(self, filepath: str, name: str=None, network=None, root_node=None):
+        """ VDBファイルをインポートする """
         _node = None
+
+        if root_node is None:
+            root_node = hou.node(network or self.get_current_network_path())
+
         _node_type = root_node.type().name()
 
 
-        print(f'MDK | Houdini | {network=}')
-        print(f'MDK | Houdini | {filepath=}')
-        print(f'MDK | Houdini | node_type = {_node_type}')
+        logger.debug('import_vdb | network = %s, filepath = %s, node_type = %s', network, filepath, _node_type)
 
 
         if _node_type == 'obj':
@@ -384,7 +836,7 @@ class AppMain:
 
         
         elif _node_type == 'geo':
-            _node = _node.createNode('file')
+            _node = root_node.createNode('file', name)
             _node.parm('file').set(filepath)
             _node.setDisplayFlag(False)
 
@@ -395,22 +847,29 @@ class AppMain:
             _node.bypass(True)
 
 
+        return _node
 
 
 
-    def is_hip(self, filepath: str):
-        """ USDファイル判定 """
-        return FILE_FILTER_HIP.match(filepath)
 
+    def is_bgeo(self, filepath: str) -> bool:
+        """ bgeoファイル判定 """
+        return filetypes.is_type(filepath, 'bgeo')
 
-    def is_usd(self, filepath: str):
+
+    def is_hip(self, filepath: str) -> bool:
+        """ hipファイル判定 """
+        return filetypes.is_type(filepath, 'hip')
+
+
+    def is_usd(self, filepath: str) -> bool:
         """ USDファイル判定 """
-        return FILE_FILTER_USD.match(filepath)
+        return filetypes.is_type(filepath, 'usd')
 
 
-    def is_vdb(self, filepath: str):
+    def is_vdb(self, filepath: str) -> bool:
         """ VDBファイル判定 """
-        return FILE_FILTER_VBD.match(filepath)
+        return filetypes.is_type(filepath, 'vdb')
     
 
     def open_dir(self):
@@ -424,7 +883,7 @@ class AppMain:
 
             print(f'MDK | File = {_filepath}')
             
-            if os.path.exists(_filepath):
+            if preflight.exists(_filepath):
                 open_in_explorer(_filepath)
 
         else:
@@ -492,11 +951,4 @@ class AppMain:
         * houdiniは単位設定がないのでpass
         
         """
-        unit_dict = {
-            'centimeter': 0.01,
-            'millimeter': 0.001,
-            'meter': 1.0,
-            'kilometer': 1000.0,
-        }
-
-        self._unit_scale = unit_dict.get(unit)
\ No newline at end of file
+        self._unit_scale = UNIT_SCALE_DICT.get(unit)
\ No newline at end of file
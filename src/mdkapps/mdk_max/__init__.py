@@ -8,6 +8,18 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.3 (v0.0.3) 2026-10-18 Tatsuya Yamagishi
+        * added: is_script()
+        * updated: ファイルの存在確認を preflight に変更
+        * added: iter_playblast() で1フレームごとに進捗を通知
+        * added: capture_playblast() でキャプチャと画像の書き出しを分けて実行
+        * fixed: create_playblast() で filetype を使用
+        * added: create_playblasts() で複数ショットを1つのセッションでプレイブラスト
+        * added: capture_playblast(thumbnails=True) で書き出し中にサムネイルとコンタクトシートを作成
+        * added: get_scene_state() でシーン状態をまとめて取得 (callbacks で破棄するキャッシュ)
+        * added: apply_shot_settings() で違う値だけを1つの Undo でまとめて設定, get_shot_settings(), get_render()
+        * fixed: capture_playblast(mp4=True) でメモリ上の画像をフレーム順にエンコード (書き出し中のファイルを読まない), encode_image()
+
     * v0.0.2 (v0.0.2) 2025-03-31 Tatsuya Yamagishi
         * added: FILE_FILTER_SCRIPT
         * added: create_playblast
@@ -16,7 +28,7 @@ Release Note:
         * added: path
 """
 
-VERSION = 'v0.0.2'
+VERSION = 'v0.0.3'
 NAME = 'mdk_max'
 
 import os
@@ -28,6 +40,14 @@ import sys
 import pymxs
 rt = pymxs.runtime
 
+from .. import encode
+from .. import filetypes
+from .. import images
+from .. import playblast
+from .. import preflight
+from .. import scene
+from .. import thumbnail
+
 try:
     from PySide6 import QtCore, QtGui, QtWidgets
 except:
@@ -54,14 +74,153 @@ EXT_LIST = [
 
 FILE_FILTER_SCRIPT = re.compile(r'.+\.(py|ms)')
 
+# get_scene_state のキャッシュを破棄するコールバック
+SCENE_STATE_EVENTS = (
+    'filePostOpen',
+    'filePostSave',
+    'systemPostNew',
+    'systemPostReset',
+    'selectionSetChanged',
+    'animationRangeChange',
+)
+
+# FPS とレンダーサイズの変更はコールバックで検知できないため、短い時間で期限切れにする
+SCENE_STATE_TTL = 1.0
+SCENE_STATE_CALLBACK_ID = 'mdkSceneState'
+
+_scene_state_cache = scene.SceneStateCache(ttl=SCENE_STATE_TTL)
+_scene_state_installed = False
+
+# レンダラーのクラス名 → set_render の名前
+RENDERER_DICT = {
+    'Arnold': 'arnold',
+    'Default_Scanline_Renderer': 'default',
+    'V_Ray_Adv_3_60_04': 'vray',
+    'Redshift_Renderer': 'redshift',
+}
+
+# apply_shot_settings で比較する前の変換 (set_* で設定される精度に合わせる)
+SHOT_SETTINGS_COMPARE = {
+    'aperture_size': lambda values: values[0],
+    'fps': lambda value: int(value+0.5),
+    'framerange': scene.get_outer_range,
+    'unit': lambda value: str(value).lower().rstrip('s'),
+}
+
 #=======================================#
 # Functions
 #=======================================#
+def grab_viewport(index: int = None):
+    """ ビューポートをキャプチャ (メインスレッドで実行)
+
+    * ビューポートの HWND を Qt でキャプチャする (gw.getViewportDib より高速)
+
+    Args:
+        index(int, optional): ビューポート番号. None の場合はアクティブなビューポート
+
+    Returns:
+        QtGui.QImage: キャプチャした画像
+    """
+    _hwnd = rt.viewport.getHWnd() if index is None else rt.viewport.getHWnd(index=index)
+    _pixmap = QtGui.QGuiApplication.primaryScreen().grabWindow(int(_hwnd))
+
+    return _pixmap.toImage()
+
+
+def scale_image(image, size: list|tuple=None):
+    """ 画像を size に拡大縮小 (同じサイズの場合はそのまま) """
+    if size and (image.width(), image.height()) != tuple(size):
+        image = image.scaled(
+            size[0],
+            size[1],
+            QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation,
+        )
+
+    return image
+
+
+def encode_image(image, filetype: str = 'png') -> bytes:
+    """ キャプチャした画像を PNG / JPEG などのバイト列に変換 (書き出しスレッドで実行)
+
+    * PNG は mdkapps.images で圧縮 (zlib は GIL を解放する)
+    * それ以外は QImage.save
+
+    Args:
+        image(QtGui.QImage): 画像
+        filetype(str): 'png', 'jpg'
+    """
+    filetype = filetype.lstrip('.').lower()
+
+    if filetype == 'png':
+        image = image.convertToFormat(QtGui.QImage.Format.Format_RGB32)
+
+        return images.encode_png(
+            image.width(),
+            image.height(),
+            bytes(image.constBits()),
+            mode='BGRX',
+            stride=image.bytesPerLine(),
+        )
+
+    _buffer = QtCore.QBuffer()
+    _buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+
+    if not image.save(_buffer, filetype.upper()):
+        raise IOError(f'MDK | Failed to encode image: {filetype}')
+
+    return bytes(_buffer.data())
+
+
+def write_image(filepath: str, image, size: list|tuple=None) -> str:
+    """ キャプチャした画像を書き出し (書き出しスレッドで実行)
+
+    * encode_image() で変換して書き出す
+
+    Args:
+        filepath(str): 出力ファイルパス
+        image(QtGui.QImage): 画像
+        size(list | tuple, optional): サイズ
+    """
+    _data = encode_image(scale_image(image, size), os.path.splitext(filepath)[1])
+
+    with open(filepath, 'wb') as _file:
+        _file.write(_data)
+
+    return filepath
+
+
+def install_scene_callbacks():
+    """ get_scene_state() のキャッシュを破棄するコールバックを登録 (1回のみ) """
+    global _scene_state_installed
+
+    if _scene_state_installed:
+        return
+
+    for _event in SCENE_STATE_EVENTS:
+        rt.callbacks.addScript(
+            rt.Name(_event),
+            _scene_state_cache.invalidate,
+            id=rt.Name(SCENE_STATE_CALLBACK_ID),
+        )
+
+    _scene_state_installed = True
+
+
+def uninstall_scene_callbacks():
+    """ install_scene_callbacks() で登録したコールバックを削除 """
+    global _scene_state_installed
+
+    rt.callbacks.removeScripts(id=rt.Name(SCENE_STATE_CALLBACK_ID))
+    _scene_state_installed = False
+    _scene_state_cache.invalidate()
+
+
 def open_in_explorer(filepath: str):
     """
     Explorerでフォルダを開く
     """
-    if os.path.exists(filepath):
+    if preflight.exists(filepath):
         if platform.system() == 'Windows':
             filepath = str(filepath)
             filepath = filepath.replace('/', '\\')
@@ -85,6 +244,40 @@ class AppMain:
     def __init__(self):
         self.FILE_FILTER_SCRIPT = FILE_FILTER_SCRIPT
 
+    def apply_shot_settings(self, settings: dict) -> dict:
+        """ ショット設定をまとめて適用
+
+        * 現在値を1回だけ取得し、違う値だけを設定する
+        * 1つの Undo にまとめ、ビューポートの再描画を止めて設定する
+
+        Args:
+            settings(dict): {'unit', 'fps', 'framerange', 'render', 'render_framerange', 'render_size', 'aperture_size'}
+
+        Returns:
+            dict: 変更した項目 {key: (変更前, 変更後)}
+        """
+        _setters = {
+            'aperture_size': lambda values: self.set_aperture_size(*values),
+            'fps': self.set_fps,
+            'framerange': lambda values: self.set_framerange(*values),
+            'render': self.set_render,
+            'render_framerange': lambda values: self.set_render_framerange(*values),
+            'render_size': lambda values: self.set_render_size(*values),
+            'unit': self.set_unit,
+        }
+
+        _changes = scene.diff_settings(self.get_shot_settings(), settings, compare=SHOT_SETTINGS_COMPARE)
+
+        if not _changes:
+            return _changes
+
+        with pymxs.undo(True, 'MDK | Apply Shot Settings'), pymxs.redraw(False):
+            scene.apply_settings(_changes, _setters)
+
+        self.invalidate_scene_state()
+
+        return _changes
+
     def create_playblast(
                     self,
                     filepath: str,
@@ -113,7 +306,7 @@ class AppMain:
             outputAVI:false
             outputImageSeq:true
             filename:"{filepath}" 
-            imageFormat: #png
+            imageFormat: #{filetype}
             start: {framerange[0]}
             end: {framerange[1]}
             width: {size[0]}
@@ -122,6 +315,229 @@ class AppMain:
         """
         rt.execute(cmd)
         
+
+    def capture_playblast(
+                self,
+                filepath: str,
+                size: list|tuple=None,
+                framerange: list|tuple=None,
+                filetype='png',
+                max_workers: int=None,
+                callback=None,
+                cancel_event=None,
+                mp4: bool=False,
+                thumbnails: bool=False) -> list[playblast.FrameResult]:
+        """ ビューポートをキャプチャしてプレイブラストを作成
+
+        * キャプチャはメインスレッド、PNG の圧縮と書き出しはスレッドプールで実行
+        * '{filepath}.####.{filetype}' に書き出す
+        * thumbnails=True の場合は書き出しスレッドでメモリ上の画像から
+          '{filepath}_thumb.png' と '{filepath}_sheet.png' (4x4) を作成 (NumPy が必要)
+        * mp4=True の場合は書き出しスレッドで変換したバイト列をフレーム順にエンコーダに渡す
+          (書き出し中のファイルは読み込まない)
+
+        Args:
+            filepath(str): 出力パス (拡張子・フレーム番号なし)
+            size(list | tuple, optional): サイズ. None の場合はビューポートのサイズ
+            framerange(list | tuple): フレーム範囲
+            filetype(str): 'png', 'jpg'
+            max_workers(int, optional): 書き出しスレッド数
+            callback(Callable, optional): callback(FrameResult). False を返すとキャンセル
+            cancel_event(threading.Event, optional): セットするとキャンセル
+            mp4(bool): True の場合は書き出しながら '{filepath}.mp4' にエンコード
+            thumbnails(bool): True の場合はサムネイルとコンタクトシートを作成
+
+        Returns:
+            list[playblast.FrameResult]: 書き出したフレーム
+        """
+        _frames = range(int(framerange[0]), int(framerange[1]) + 1)
+        _dirpath = os.path.dirname(filepath)
+
+        if _dirpath:
+            os.makedirs(_dirpath, exist_ok=True)
+
+        _thumbnails = None
+
+        if thumbnails:
+            _thumbnails = thumbnail.PlayblastThumbnails(
+                _frames,
+                sheet_path=f'{filepath}_sheet.png',
+                thumbnail_path=f'{filepath}_thumb.png',
+            )
+
+        def _capture(frame: int):
+            rt.sliderTime = frame
+            return grab_viewport()
+
+        # エンコード待ちのフレーム {frame: バイト列} (書き出しスレッドは順不同で完了する)
+        _frame_data = {}
+
+        def _write(frame: int, image) -> str:
+            image = scale_image(image, size).convertToFormat(QtGui.QImage.Format.Format_RGB32)
+            _path = playblast.get_frame_path(filepath, frame, filetype)
+            _data = encode_image(image, filetype)
+
+            with open(_path, 'wb') as _file:
+                _file.write(_data)
+
+            if _encoder is not None:
+                _frame_data[frame] = _data
+
+            if _thumbnails is not None:
+                _thumbnails.add(
+                    frame,
+                    image.width(),
+                    image.height(),
+                    image.constBits(),
+                    mode='BGRX',
+                    stride=image.bytesPerLine(),
+                )
+
+            return _path
+
+        def _callback(result: playblast.FrameResult):
+            # capture_frames はフレーム順に結果を返す
+            if _encoder is not None:
+                _encoder.put(_frame_data.pop(result.frame))
+
+            if callback:
+                return callback(result)
+
+        _encoder = None
+
+        if mp4:
+            _encoder = encode.FrameEncoder(f'{filepath}.mp4', fps=self.get_fps())
+            _encoder.start()
+
+        try:
+            _results = playblast.capture_frames(
+                _frames,
+                _capture,
+                _write,
+                max_workers=max_workers,
+                callback=_callback,
+                cancel_event=cancel_event,
+            )
+
+        except BaseException:
+            if _encoder:
+                _encoder.cancel()
+
+            raise
+
+        if _encoder:
+            if len(_results) == len(_frames):
+                print(f'MdkMax | Movie = {_encoder.finish()}')
+            else:
+                _encoder.cancel()
+
+        if _thumbnails is not None and len(_results) == len(_frames):
+            for _key, _path in _thumbnails.save().items():
+                print(f'MdkMax | {_key} = {_path}')
+
+        return _results
+
+
+    def create_playblasts(
+                self,
+                shots: list[dict],
+                filepath: str,
+                size: list|tuple=None,
+                ext: str='png',
+                callback=None,
+                thumbnails: bool=False) -> list[playblast.ShotResult]:
+        """ 複数ショットのプレイブラストを1つのセッションで作成
+
+        * ショットごとにアクティブなビューポートのカメラと範囲を切り替えて capture_playblast()
+        * 終了後にビューポートのカメラと現在のフレームを元に戻す
+        * 出力は '{filepath}/{name}.####.{ext}'
+
+        Args:
+            shots(list[dict]): [{'name', 'camera', 'framerange', 'size', 'ext'}, ...]
+            filepath(str): 出力ディレクトリ
+            size(list | tuple, optional): ショットに 'size' がない場合のサイズ
+            ext(str): ショットに 'ext' がない場合の拡張子
+            callback(Callable, optional): callback(done, total, ShotResult)
+            thumbnails(bool): True の場合はショットごとにサムネイルとコンタクトシートを作成
+
+        Returns:
+            list[playblast.ShotResult]: ショットごとの出力と時間
+        """
+        _shots = playblast.normalize_shots(shots, size, ext)
+        _camera = rt.viewport.getCamera()
+        _slider_time = rt.sliderTime
+
+        def _render_shot(shot: dict) -> str:
+            if shot['camera']:
+                _node = rt.getNodeByName(shot['camera'])
+
+                if _node is None:
+                    raise ValueError(f'MDK | Camera is not found: {shot["camera"]}')
+
+                rt.viewport.setCamera(_node)
+
+            _prefix = f'{filepath}/{shot["name"]}'
+            self.capture_playblast(
+                _prefix,
+                shot['size'],
+                shot['framerange'],
+                filetype=shot['ext'],
+                thumbnails=thumbnails,
+            )
+
+            return f'{_prefix}.####.{shot["ext"]}'
+
+        try:
+            return playblast.run_shots(_shots, _render_shot, callback=callback)
+
+        finally:
+            if _camera is not None:
+                rt.viewport.setCamera(_camera)
+
+            rt.sliderTime = _slider_time
+
+
+    def iter_playblast(
+                self,
+                filepath: str,
+                size: list|tuple=None,
+                framerange: list|tuple=None,
+                filetype='png',
+                cancel_event=None):
+        """ 1フレームずつビューポートをキャプチャして結果を返すジェネレータ
+
+        * '{filepath}.####.{filetype}' に書き出す
+        * ループを抜ける (close()) か cancel_event をセットするとキャンセル
+
+        Yields:
+            playblast.FrameResult: (frame, path, seconds, size)
+        """
+        def _render_frame(frame: int):
+            rt.sliderTime = frame
+            self.save_viewport(playblast.get_frame_path(filepath, frame, filetype), size)
+
+        yield from playblast.iter_frames(
+            _render_frame,
+            range(int(framerange[0]), int(framerange[1]) + 1),
+            lambda frame: playblast.get_frame_path(filepath, frame, filetype),
+            cancel_event=cancel_event,
+        )
+
+
+    def save_viewport(self, filepath: str, size: list|tuple=None):
+        """ アクティブなビューポートを画像として保存 (gw.getViewportDib) """
+        _dib = rt.gw.getViewportDib()
+
+        if size:
+            _bitmap = rt.bitmap(size[0], size[1])
+            rt.copy(_dib, _bitmap)
+            rt.close(_dib)
+            _dib = _bitmap
+
+        _dib.filename = filepath
+        rt.save(_dib)
+        rt.close(_dib)
+
             
     def get_default_ext(self) -> str:
         """ デフォルト拡張子を返す """
@@ -182,9 +598,65 @@ class AppMain:
         return None
     
     
+    def get_scene_state(self) -> scene.SceneState:
+        """ シーン状態 (ファイルパス, FPS, フレーム範囲, レンダーサイズ, レンダラー, 選択) をまとめて返す
+
+        * キャッシュを返し、ファイル・選択・アニメーション範囲のコールバックで破棄する (SCENE_STATE_TTL 秒で期限切れ)
+
+        Returns:
+            scene.SceneState: 不変のスナップショット
+        """
+        install_scene_callbacks()
+        return _scene_state_cache.get(self.query_scene_state)
+
+
+    def invalidate_scene_state(self):
+        """ get_scene_state() のキャッシュを破棄 """
+        _scene_state_cache.invalidate()
+
+
+    def query_scene_state(self) -> scene.SceneState:
+        """ シーン状態を問い合わせ (キャッシュしない) """
+        return scene.SceneState(
+            filepath=self.get_filepath(),
+            fps=self.get_fps(),
+            framerange=tuple(self.get_framerange()),
+            render_size=tuple(self.get_render_size()),
+            render=self.get_render(),
+            selection=tuple(_node.name for _node in rt.selection),
+        )
+
+
+    def get_render(self) -> str:
+        """ 現在のレンダラー (set_render の名前, 未登録の場合はクラス名) """
+        _class = str(rt.classOf(rt.renderers.current))
+        return RENDERER_DICT.get(_class, _class)
+
+
     def get_render_size(self) -> tuple[int]:
         """ レンダーサイズを取得 """
         return (rt.renderWidth, rt.renderHeight)
+
+
+    def get_shot_settings(self) -> dict:
+        """ ショット設定の現在値 (apply_shot_settings 用)
+
+        * render_framerange はレンダー範囲 (rendTimeType = 2) でない場合は None
+        """
+        _render_framerange = None
+
+        if rt.rendTimeType == 2:
+            _render_framerange = (int(rt.rendStart.frame), int(rt.rendEnd.frame))
+
+        return {
+            'unit': str(rt.units.SystemType),
+            'fps': self.get_fps(),
+            'framerange': tuple(self.get_framerange()),
+            'render': self.get_render(),
+            'render_framerange': _render_framerange,
+            'render_size': tuple(self.get_render_size()),
+            'aperture_size': (rt.getRendApertureWidth(), None),
+        }
     
 
     def import_file(self, filepath: str, namespace=None):
@@ -204,11 +676,17 @@ class AppMain:
         rt.ImportFile(filepath, rt.Name("noPrompt"))
 
 
+    def is_script(self, filepath: str) -> bool:
+        """ スクリプトファイル判定 (.py, .ms) """
+        _kinds = filetypes.get_kinds(filepath)
+        return 'script' in _kinds or 'maxscript' in _kinds
+
+
     def open_dir(self):
         print('MdkMax | Open Dir')
 
         _filepath = self.get_filepath()
-        if os.path.exists(_filepath):
+        if preflight.exists(_filepath):
             open_in_explorer(_filepath)
 
 
@@ -9,6 +9,46 @@ Info:
 
     
 Release Note:
+    * v0.0.4 (v0.0.4) 2026-10-18 Tatsuya Yamagishi
+        * updated: renderSetup, mayaUsd, Qt を遅延読み込み
+        * added: load_module()
+        * updated: ファイル判定を mdkapps.filetypes に変更
+        * added: classify_files()
+        * updated: import_files() をファイルタイプごとにまとめてインポート
+        * updated: import_files(), import_texture() で連番を1ノードにまとめる
+        * added: batch_edit(), import_files_batch(), reference_files_batch()
+        * added: reference_files(deferred=True), load_references(), get_unloaded_references()
+        * updated: ファイルの存在確認を preflight に変更
+        * added: create_playblast_batch(), find_mayapy(), get_active_camera()
+        * added: create_playblast(incremental=True), get_playblast_fingerprint()
+        * added: create_playblast(mp4=True) で連番を書き出しながら動画にエンコード
+        * added: iter_playblast() で1フレームごとに進捗を通知
+        * added: create_playblasts() で複数ショットを1つのセッションでプレイブラスト
+        * added: get_active_panel()
+        * added: export_abc_batch() で複数の Alembic を1回の AbcExport で書き出し, get_abc_job_arg()
+        * added: export_nodes_async(), export_nodes(background=True) で一時シーンからヘッドレスの mayapy で書き出し
+        * added: save_snapshot()
+        * added: export_nodes_cached() でマニフェスト (mdkapps.manifest) を確認して変更のない書き出しをスキップ
+        * updated: export_nodes() で USD に対応
+        * added: apply_fbx_profile(), set_fbx_take(), export_fbx_batch(), FBX_PROFILES
+        * updated: export_fbx() で同じ FBX 設定の場合は FBXResetExport を省略
+        * fixed: export_fbx() で nodes を選択して書き出し
+        * added: export_usd_batch() で複数アセットを書き出し (共有ベースレイヤー + ペイロードレイヤー)
+        * added: export_usd(stride, samples), get_usd_export_kwargs(), get_usd_prim_path(), write_usd_payload_layer()
+        * added: get_scene_state() でシーン状態をまとめて取得 (scriptJob で破棄するキャッシュ), install_scene_callbacks()
+        * added: apply_shot_settings() で違う値だけを1つの Undo チャンクで設定, get_shot_settings()
+        * fixed: get_camera_shape() でカメラ以外のトランスフォームの場合は None
+        * added: collect_file_dependencies() でシーン全体の参照ファイルをまとめて確認 (mdkapps.dependencies), get_reference_filepath(), get_texture_filepath()
+        * fixed: FILE_FILTER_* を filetypes から作成する互換定数として復元
+        * fixed: import_files_batch(), reference_files_batch() の時間を [(filepath, 秒), ...] で返す (同じファイルを複数回リファレンスする場合)
+        * fixed: create_playblast_batch() で ext をジョブの実行前に確認
+        * fixed: get_playblast_fingerprint() で未保存の変更がある場合は毎回違う値にする (全フレームを描画し直す)
+        * fixed: 適用済みの FBX プロファイルをモジュールで管理し FBXExportBakeComplexAnimation -q で確認, export_fbx_batch() はベイク成功後のみ Undo
+        * fixed: export_usd_batch() で同じプリムパスになるルート ('|setA|chair', '|setB|chair') を書き出し前にエラー, get_usd_prim_paths()
+        * fixed: get_texture_filepath() で '<f>' を fileTextureName の桁数で変換 ('tex.0001.exr' → '%04d')
+        * fixed: import_files() で UDIMタイルの番号 ('tex.1001.exr' ~ 'tex.1010.exr') の画像は UDIM として読み込む
+
+        
     * v0.0.3 (v0.0.3) 2025-06-24 Tatsuya Yamagishi
         * added: apply_alembic_cache()
         * added: set_aperture_size()
@@ -24,18 +64,24 @@ Release Note:
 
 """
 
-VERSION = 'v0.0.3'
+VERSION = 'v0.0.4'
 NAME = 'mdk_maya'
 
 #=======================================#
 # Import Built-in
 #=======================================#
+import contextlib
+import functools
+import importlib
 import os
 import pathlib
 import platform
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
 
 #=======================================#
 # Import Maya Modules
@@ -43,31 +89,99 @@ import sys
 import maya.cmds as cmds
 import maya.mel as mel
 
-from maya.app.renderSetup.model import selector
-from maya.app.renderSetup.model import renderLayer
-from maya.app.renderSetup.model import renderSetup
-import maya.app.renderSetup.views.renderSetupPreferences as prefs
-from maya.app.renderSetup.model import typeIDs
+#=======================================#
+# Import mdkapps Modules
+#=======================================#
+from .. import dependencies
+from .. import encode
+from .. import filetypes
+from .. import manifest
+from .. import playblast
+from .. import preflight
+from .. import scene
+from .. import sequence
+from .. import workers
 
+from . import worker
 
-import mayaUsd.ufe
-import mayaUsd.lib
-import mayaUsd_createStageWithNewLayer
 
 
-try:
-    from PySide6 import QtCore, QtGui, QtWidgets
-except:
-    from qtpy import QtCore, QtGui, QtWidgets
+#=======================================#
+# Lazy Modules
+#=======================================#
+# renderSetup / mayaUsd / Qt は必要になるまで読み込まない
+LAZY_MODULES = {
+    'selector': ('maya.app.renderSetup.model.selector', None),
+    'renderLayer': ('maya.app.renderSetup.model.renderLayer', None),
+    'renderSetup': ('maya.app.renderSetup.model.renderSetup', None),
+    'prefs': ('maya.app.renderSetup.views.renderSetupPreferences', None),
+    'typeIDs': ('maya.app.renderSetup.model.typeIDs', None),
+    'mayaUsd': ('mayaUsd', None),
+    'mayaUsd_createStageWithNewLayer': ('mayaUsd_createStageWithNewLayer', None),
+    'omui': ('maya.OpenMayaUI', None),
+    'ufe': ('ufe', None),
+    'Sdf': ('pxr.Sdf', None),
+    'QtCore': (('PySide6', 'qtpy'), 'QtCore'),
+    'QtGui': (('PySide6', 'qtpy'), 'QtGui'),
+    'QtWidgets': (('PySide6', 'qtpy'), 'QtWidgets'),
+    'wrapInstance': (('shiboken2', 'shiboken6'), 'wrapInstance'),
+}
+
+
+def load_module(name: str):
+    """ 遅延読み込みモジュールを取得
 
-from maya import OpenMayaUI as omui 
+    * 一度読み込んだモジュールはグローバルに登録する
+
+    Args:
+        name(str): LAZY_MODULES のキー
+
+    Returns:
+        module | object: 読み込んだモジュール
+    """
+    if name in globals():
+        return globals()[name]
+
+    if name not in LAZY_MODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    _modules, _attr = LAZY_MODULES[name]
+    if isinstance(_modules, str):
+        _modules = (_modules,)
+
+    _error = None
+    for _module_name in _modules:
+        try:
+            if _attr is None:
+                _result = importlib.import_module(_module_name)
+            else:
+                _module = importlib.import_module(_module_name)
+
+                if hasattr(_module, _attr):
+                    _result = getattr(_module, _attr)
+                else:
+                    _result = importlib.import_module(f'{_module_name}.{_attr}')
+            break
+
+        except ImportError as ex:
+            _error = ex
+    else:
+        raise ImportError(f'MDK | Failed to import {name}') from _error
 
-try:
-    from shiboken2 import wrapInstance
-except:
-    from shiboken6 import wrapInstance
+    globals()[name] = _result
+    return _result
 
-import ufe
+
+def load_usd():
+    """ mayaUsdモジュールを読み込み """
+    importlib.import_module('mayaUsd.ufe')
+    importlib.import_module('mayaUsd.lib')
+
+    return load_module('mayaUsd')
+
+
+def __getattr__(name: str):
+    return load_module(name)
 
 
 #=======================================#
@@ -101,34 +215,152 @@ EXT_DICT = {
     'usd': '.usd',
 }
 
-FILE_FILTER_ABC = re.compile(r'.+\.(abc)')
-FILE_FILTER_FBX = re.compile(r'.+\.(fbx)')
-FILE_FILTER_USD = re.compile(r'.+\.(usd|usdc|usda)')
-FILE_FILTER_IMAGE = re.compile(r'.+\.(png|jpeg|jpg|tif|tiff|exr|tx|hdr)')
-FILE_FILTER_IMAGE_SDR = re.compile(r'.+\.(bmp|gif|png|jpeg|jpg|svg|tif|tiff)')
-FILE_FILTER_MAYA = re.compile(r'.+\.(ma|mb|abc|fbx|obj)')
-FILE_FILTER_MEDIA = re.compile(r'.+\.(bmp|png|jpeg|jpg|svg|tif|tiff|exr|mp4|mp3|pdf|mov|mkv)')
-FILE_FILTER_OBJ = re.compile(r'.+\.(obj)')
-FILE_FILTER_RAW = re.compile(r'.+\.(cr2|cr3|dng|CR2|CR3|DNG)')
-FILE_FILTER_SCRIPT = re.compile(r'.+\.(py)')
-FILE_FILTER_TEXT = re.compile(r'.+\.(doc|txt|text|json|py|usda|nk|sh|zsh|bat)')
+# 旧バージョン互換のファイル判定 (filetypes.FILE_TYPES から作成)
+FILE_FILTER_ABC = filetypes.get_file_filter('abc')
+FILE_FILTER_FBX = filetypes.get_file_filter('fbx')
+FILE_FILTER_USD = filetypes.get_file_filter('usd')
+FILE_FILTER_IMAGE = filetypes.get_file_filter('image')
+FILE_FILTER_IMAGE_SDR = filetypes.get_file_filter('image_sdr')
+FILE_FILTER_MAYA = filetypes.get_file_filter('maya')
+FILE_FILTER_MEDIA = filetypes.get_file_filter('media')
+FILE_FILTER_OBJ = filetypes.get_file_filter('obj')
+FILE_FILTER_RAW = filetypes.get_file_filter('raw')
+FILE_FILTER_SCRIPT = filetypes.get_file_filter('script')
+FILE_FILTER_TEXT = filetypes.get_file_filter('text')
+
+# export_abc / export_abc_batch の AbcExport オプション
+ABC_OPTIONS = '-stripNamespaces -uvWrite'
+
+# FBX 書き出し設定のプロファイル {名前: {FBX コマンド: 値}}
+FBX_PROFILES = {
+    'default': {},
+    'animation': {
+        'FBXExportBakeComplexAnimation': 'true',
+    },
+    'baked': {
+        'FBXExportBakeComplexAnimation': 'false',
+    },
+}
+
+# set_unit の単位 {名前: currentUnit の linear}
+UNIT_DICT = {
+    'centimeter': 'cm',
+    'millimeter': 'mm',
+    'meter': 'm',
+    'kilometer': 'km',
+}
+
+# apply_shot_settings で比較する前の変換 (set_* で設定される精度に合わせる)
+SHOT_SETTINGS_COMPARE = {
+    'fps': lambda value: int(float(value)+0.5),
+    'framerange': scene.get_outer_range,
+}
+
+# collect_file_dependencies で確認するアトリビュート {ノードタイプ: ファイルパスのアトリビュート}
+FILE_ATTR_DICT = {
+    'file': 'fileTextureName',
+    'imagePlane': 'imageName',
+    'audio': 'filename',
+    'AlembicNode': 'abc_File',
+    'gpuCache': 'cacheFileName',
+    'aiImage': 'filename',
+    'aiStandIn': 'dso',
+    'aiVolume': 'filename',
+    'VRayMesh': 'fileName',
+    'mayaUsdProxyShape': 'filePath',
+}
+
+# import_files の分類 (優先順)
+IMPORT_KINDS = ('usd', 'image', 'abc', 'maya')
+
+# import_files で連番にまとめるファイルタイプ
+SEQUENCE_KINDS = ('image',)
+
+# get_scene_state のキャッシュを破棄するイベント / アトリビュート
+SCENE_STATE_EVENTS = (
+    'NewSceneOpened',
+    'SceneOpened',
+    'SceneSaved',
+    'SelectionChanged',
+    'playbackRangeChanged',
+    'playbackRangeSliderChanged',
+    'timeUnitChanged',
+)
+
+SCENE_STATE_ATTRS = (
+    'defaultResolution.width',
+    'defaultResolution.height',
+    'vraySettings.width',
+    'vraySettings.height',
+)
+
+_scene_state_cache = scene.SceneStateCache()
+_scene_state_jobs = []
+_scene_state_attr_jobs = []
+
+# 適用済みの FBX プロファイルとテイク (FBX の設定はプラグインのグローバルな状態のため、AppMain ごとではなくモジュールで管理)
+#   * bake : 適用時の FBXExportBakeComplexAnimation -q (他のツールによる変更の確認用)
+_fbx_state = {'profile': None, 'take': None, 'bake': None}
 
 
 #=======================================#
 # Functions
 #=======================================#
+@contextlib.contextmanager
+def batch_edit(chunk_name: str = 'mdkBatchEdit'):
+    """ まとめて編集するためのコンテキスト
+
+    * 1つのUndoチャンクにまとめる
+    * 画面更新 (refresh) とビューポート (ogs) を停止し、評価を抑える
+    * エラーが発生しても元の状態に戻す
+
+    Examples:
+        >>> with batch_edit('importProps'):
+        ...     for _filepath in filepath_list:
+        ...         cmds.file(_filepath, i=True)
+    """
+    _refresh_suspended = cmds.refresh(query=True, suspend=True)
+    _ogs_paused = cmds.ogs(query=True, pause=True)
+
+    cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+
+    try:
+        if not _refresh_suspended:
+            cmds.refresh(suspend=True)
+
+        if not _ogs_paused:
+            cmds.ogs(pause=True)
+
+        yield
+
+    finally:
+        if not _ogs_paused and cmds.ogs(query=True, pause=True):
+            cmds.ogs(pause=True)
+
+        if not _refresh_suspended:
+            cmds.refresh(suspend=False)
+
+        cmds.undoInfo(closeChunk=True)
+
+
 def create_playblast(
             filepath: str,
             size: list|tuple=None,
             range: list|tuple=None,
-            filetype='jpg'
-):
+            filetype='jpg',
+            incremental: bool=False,
+) -> list[tuple[int, int]]:
     """ プレイブラストを作成
     
     Args:
         filepath(str): 出力ファイルパス
         size(list | turple): サイズ
         range(list | turple): サイズ
+        incremental(bool): True の場合は存在しない・古いフレームのみ描画 (mdkapps.playblast)
+            * 未保存の変更がある場合はすべてのフレームを描画
+
+    Returns:
+        list[tuple[int, int]]: 描画したフレーム範囲
     """
 
     _FILE_FORMATS = {
@@ -137,26 +369,39 @@ def create_playblast(
     }
     
     _startframe, _endframe = range
+    _ranges = [(_startframe, _endframe)]
+
+    if incremental:
+        _fingerprint = get_playblast_fingerprint(get_active_camera(), size, filetype)
+        _ranges = playblast.get_stale_ranges(filepath, filetype, range, _fingerprint)
+
+        if not _ranges:
+            return []
+
     cmds.setAttr ('defaultRenderGlobals.imageFormat', _FILE_FORMATS[filetype])
 
     
+    for _startframe, _endframe in _ranges:
+        cmds.playblast( 
+                f=filepath,
+                v=False,
+                percent=100,
+                format='image',
+                widthHeight=size,
+                startTime=_startframe,
+                endTime=_endframe,
+                forceOverwrite=incremental
+            )
 
-    cmds.playblast( 
-            f=filepath,
-            v=False,
-            percent=100,
-            format='image',
-            widthHeight=size,
-            startTime=_startframe,
-            endTime=_endframe,
-            forceOverwrite=False
-        )
+    if incremental:
+        playblast.update_manifest(filepath, filetype, iter_range_frames(_ranges), _fingerprint)
+
+    return _ranges
     
 
 def exec_script(filepath):
-    if FILE_FILTER_SCRIPT.match(filepath):
-        if filepath.lower().endswith('.py'):
-            exec_python_file(filepath, globals())
+    if filetypes.is_type(filepath, 'script'):
+        exec_python_file(filepath, globals())
     else:
         raise TypeError()
     
@@ -172,11 +417,351 @@ def exec_python_file(filepath, globals=None, locals=None):
         exec(compile(file.read(), filepath, 'exec'), globals, locals)
 
 
+def find_mayapy() -> str:
+    """ mayapy のパスを返す
+
+    * 環境変数 MDK_MAYAPY > 実行中の Maya と同じ bin > MAYA_LOCATION/bin の順に探す
+
+    Raises:
+        FileNotFoundError: 見つからない場合
+    """
+    _env = os.environ.get('MDK_MAYAPY')
+
+    if _env:
+        return _env
+
+    _name = 'mayapy.exe' if platform.system() == 'Windows' else 'mayapy'
+    _candidates = [pathlib.Path(sys.executable).with_name(_name)]
+
+    if os.environ.get('MAYA_LOCATION'):
+        _candidates.append(pathlib.Path(os.environ['MAYA_LOCATION'], 'bin', _name))
+
+    for _filepath in _candidates:
+        if _filepath.is_file():
+            return str(_filepath)
+
+    raise FileNotFoundError(f'MDK | mayapy is not found: {[str(_path) for _path in _candidates]}')
+
+
+def get_active_camera() -> str:
+    """ アクティブなビューのカメラを返す (見つからない場合は 'persp') """
+    _panel = get_active_panel()
+
+    if _panel:
+        return cmds.modelPanel(_panel, query=True, camera=True)
+
+    return 'persp'
+
+
+def get_active_panel() -> str:
+    """ アクティブなモデルパネルを返す (見つからない場合は表示中の最初のモデルパネル / None) """
+    _panel = cmds.getPanel(withFocus=True)
+
+    if _panel and cmds.getPanel(typeOf=_panel) == 'modelPanel':
+        return _panel
+
+    for _panel in cmds.getPanel(visiblePanels=True) or []:
+        if cmds.getPanel(typeOf=_panel) == 'modelPanel':
+            return _panel
+
+
+def get_abc_job_arg(
+            filepath: str,
+            roots: list[str],
+            framerange: list|tuple=None,
+            options: str=ABC_OPTIONS) -> str:
+    """ AbcExport の -jobArg を作成
+
+    Examples:
+        >>> get_abc_job_arg('/cache/chara.abc', ['|chara'], (1001, 1100))
+        '-frameRange 1001 1100 -stripNamespaces -uvWrite -root |chara -file /cache/chara.abc'
+    """
+    _args = []
+
+    if framerange:
+        _args.append(f'-frameRange {framerange[0]} {framerange[1]}')
+
+    if options:
+        _args.append(options)
+
+    _args.extend(f'-root {_root}' for _root in roots)
+    _args.append(f'-file {pathlib.Path(filepath).as_posix()}')
+
+    return ' '.join(_args)
+
+
+def get_fbx_bake_value():
+    """ FBXExportBakeComplexAnimation の現在値. fbxmaya が読み込まれていない場合は None """
+    if not cmds.pluginInfo('fbxmaya', query=True, loaded=True):
+        return None
+
+    return mel.eval('FBXExportBakeComplexAnimation -q;')
+
+
+def get_playblast_fingerprint(camera: str, size: list|tuple, ext: str) -> str:
+    """ インクリメンタルプレイブラスト用のシーン状態のフィンガープリント
+
+    * シーンファイル, 更新日時, 未保存の変更, カメラ, サイズ, 拡張子
+    * 未保存の変更がある場合は変更の内容がわからないため、毎回違う値にする
+      (インクリメンタルでもすべてのフレームを古いフレームとして描画し直す)
+    """
+    _scene = cmds.file(query=True, sceneName=True)
+    _modified = cmds.file(query=True, modified=True)
+
+    return playblast.make_fingerprint(
+        scene=_scene,
+        mtime=preflight.stat_file(_scene, ttl=0).mtime if _scene else None,
+        modified=time.time_ns() if _modified else False,
+        camera=camera,
+        size=list(size) if size else None,
+        ext=ext,
+    )
+
+
+def get_reference_filepath(node: str) -> str:
+    """ リファレンスノードのファイルパス (コピー番号 '{1}' なし)
+
+    * ファイルのないリファレンスノード (sharedReferenceNode など) は None
+    """
+    try:
+        return cmds.referenceQuery(node, filename=True, withoutCopyNumber=True)
+
+    except RuntimeError:
+        return None
+
+
+def get_texture_filepath(node: str) -> str:
+    """ file ノードのファイルパス
+
+    * UDIM, 連番の場合は fileTextureNamePattern のパターン
+        * '<f>' は fileTextureName のフレーム番号の桁数で変換 ('tex.0001.exr' → '%04d')
+        * 桁数がわからない場合は '%d' (sequence.expand_pattern でディスク上の桁数を使う)
+    """
+    if cmds.getAttr(f'{node}.uvTilingMode') or cmds.getAttr(f'{node}.useFrameExtension'):
+        _pattern = cmds.getAttr(f'{node}.fileTextureNamePattern')
+
+        if _pattern and '<f>' in _pattern:
+            _split = sequence.split_filename(os.path.basename(cmds.getAttr(f'{node}.fileTextureName') or ''))
+            _padding = len(_split[1]) if _split else 0
+
+            return _pattern.replace('<f>', f'%0{_padding}d' if _padding > 1 else '%d')
+
+        if _pattern:
+            return _pattern
+
+    return cmds.getAttr(f'{node}.fileTextureName')
+
+
+def get_usd_export_kwargs(
+            startframe: int=None,
+            endframe: int=None,
+            stride: float=1.0,
+            samples: list[float]=None) -> dict:
+    """ mayaUSDExport の共通オプション
+
+    Args:
+        stride(float): フレームの間隔 (2.0 で2コマ打ち)
+        samples(list[float], optional): 1フレーム内のサンプル ([-0.25, 0.0, 0.25] など)
+    """
+    _kwargs = {'exportInstances': True}
+
+    if (startframe is not None) and (endframe is not None):
+        _kwargs['frameRange'] = [int(startframe), int(endframe)]
+        _kwargs['frameStride'] = float(stride)
+
+        if samples:
+            _kwargs['frameSample'] = [float(_sample) for _sample in samples]
+
+    return _kwargs
+
+
+def get_usd_prim_path(node: str) -> str:
+    """ exportRoots で書き出したノードのプリムパス
+
+    * ネームスペースの ':' は '_' になる
+
+    Examples:
+        >>> get_usd_prim_path('|layout|ns:chair')
+        '/ns_chair'
+    """
+    return '/' + node.rsplit('|', 1)[-1].replace(':', '_')
+
+
+def get_usd_prim_paths(nodes: list[str]) -> list[str]:
+    """ exportRoots で書き出すノードのプリムパス (get_usd_prim_path)
+
+    * プリムパスはノード名のみのため、別の階層の同じ名前のノードは同じプリムパスになる
+
+    Raises:
+        ValueError: 別のノードが同じプリムパスになる場合
+
+    Examples:
+        >>> get_usd_prim_paths(['|setA|chair', '|setB|chair'])
+        ValueError: MDK | USD prim paths collide: {'/chair': ['|setA|chair', '|setB|chair']}
+    """
+    _nodes = {}
+
+    for _node in nodes:
+        _nodes.setdefault(get_usd_prim_path(_node), {})[_node] = None
+
+    _collisions = {_prim_path: list(_names) for _prim_path, _names in _nodes.items() if len(_names) > 1}
+
+    if _collisions:
+        raise ValueError(f'MDK | USD prim paths collide: {_collisions}')
+
+    return [get_usd_prim_path(_node) for _node in nodes]
+
+
+def write_usd_payload_layer(filepath: str, base_layer: str, prim_paths: list[str]) -> str:
+    """ base_layer のプリムをペイロードするレイヤーを書き出し
+
+    * ペイロードのパスは filepath からの相対パス (別ドライブの場合は絶対パス)
+    * 最初のプリムを defaultPrim にする
+    """
+    try:
+        _asset_path = pathlib.Path(os.path.relpath(base_layer, os.path.dirname(os.path.abspath(filepath)))).as_posix()
+    except ValueError:
+        _asset_path = pathlib.Path(base_layer).as_posix()
+
+    if not os.path.isabs(_asset_path) and not _asset_path.startswith('.'):
+        _asset_path = f'./{_asset_path}'
+
+    Sdf = load_module('Sdf')
+    _layer = Sdf.Layer.FindOrOpen(filepath)
+
+    if _layer is None:
+        _layer = Sdf.Layer.CreateNew(filepath)
+    else:
+        _layer.Clear()
+
+    for _prim_path in prim_paths:
+        _prim = Sdf.CreatePrimInLayer(_layer, _prim_path)
+        _prim.specifier = Sdf.SpecifierDef
+        _prim.payloadList.Prepend(Sdf.Payload(_asset_path, _prim_path))
+
+    if prim_paths:
+        _layer.defaultPrim = prim_paths[0].lstrip('/')
+
+    _layer.Save()
+
+    return filepath
+
+
+def install_scene_callbacks() -> bool:
+    """ get_scene_state() のキャッシュを破棄する scriptJob を登録 (1回のみ)
+
+    * バッチモード (mayapy) では scriptJob を使わず、キャッシュを無効にする
+
+    Returns:
+        bool: キャッシュが有効な場合は True
+    """
+    if _scene_state_jobs:
+        return True
+
+    if cmds.about(batch=True):
+        _scene_state_cache.enabled = False
+        return False
+
+    for _event in SCENE_STATE_EVENTS:
+        _scene_state_jobs.append(cmds.scriptJob(event=[_event, _scene_state_cache.invalidate]))
+
+    # 新規シーン・シーンを開くとデフォルトノードが作り直されるので、アトリビュートの scriptJob も作り直す
+    for _event in ('NewSceneOpened', 'SceneOpened'):
+        _scene_state_jobs.append(cmds.scriptJob(event=[_event, _install_attr_jobs]))
+
+    _scene_state_jobs.append(cmds.scriptJob(
+        attributeChange=['defaultRenderGlobals.currentRenderer', _on_renderer_changed],
+    ))
+
+    _install_attr_jobs()
+    _scene_state_cache.invalidate()
+
+    return True
+
+
+def uninstall_scene_callbacks():
+    """ install_scene_callbacks() で登録した scriptJob を削除 """
+    for _job in _scene_state_jobs + _scene_state_attr_jobs:
+        if cmds.scriptJob(exists=_job):
+            cmds.scriptJob(kill=_job, force=True)
+
+    _scene_state_jobs.clear()
+    _scene_state_attr_jobs.clear()
+    _scene_state_cache.invalidate()
+
+
+def _install_attr_jobs():
+    """ SCENE_STATE_ATTRS の scriptJob を作り直す """
+    for _job in _scene_state_attr_jobs:
+        if cmds.scriptJob(exists=_job):
+            cmds.scriptJob(kill=_job, force=True)
+
+    _scene_state_attr_jobs.clear()
+
+    for _attr in SCENE_STATE_ATTRS:
+        if cmds.objExists(_attr):
+            _scene_state_attr_jobs.append(cmds.scriptJob(attributeChange=[_attr, _scene_state_cache.invalidate]))
+
+
+def _on_renderer_changed():
+    """ レンダラー変更時 (vraySettings などが作られるため、アトリビュートの scriptJob を後で作り直す) """
+    _scene_state_cache.invalidate()
+    cmds.evalDeferred(_install_attr_jobs)
+
+
+def iter_range_frames(ranges: list[tuple[int, int]]):
+    """ フレーム範囲リストのフレーム番号を返す """
+    for _start, _end in ranges:
+        yield from range(_start, _end + 1)
+
+
+def run_timed_tasks(tasks: list[tuple]) -> list[tuple[str, float]]:
+    """ 処理を順番に実行して時間を計測
+
+    * 同じ key が複数あってもタスクごとに返す
+
+    Args:
+        tasks(list[tuple[str, Callable]]): [(key, 関数), ...]
+
+    Returns:
+        list[tuple[str, float]]: [(key, 実行時間(秒)), ...] (tasks の順)
+    """
+    _timings = []
+
+    for _key, _func in tasks:
+        _start = time.perf_counter()
+        _func()
+        _timings.append((_key, time.perf_counter() - _start))
+
+    return _timings
+
+
+def save_snapshot(filepath: str) -> str:
+    """ 現在のシーン (未保存の変更を含む) を別ファイルに書き出し
+
+    * シーン名と未保存の状態は変更しない (exportAll)
+    * リファレンスはリファレンスのまま書き出す
+
+    Returns:
+        str: 書き出したファイルパス
+    """
+    _ext = os.path.splitext(filepath)[1].lower()
+    _type = 'mayaAscii' if _ext == '.ma' else 'mayaBinary'
+
+    return cmds.file(
+        filepath,
+        force=True,
+        type=_type,
+        exportAll=True,
+        preserveReferences=True,
+    )
+
+
 def open_in_explorer(filepath: str):
     """
     Explorerでフォルダを開く
     """
-    if os.path.exists(filepath):
+    if preflight.exists(filepath):
         if platform.system() == 'Windows':
             filepath = str(filepath)
             filepath = filepath.replace('/', '\\')
@@ -200,6 +785,90 @@ class AppMain:
     def __init__(self):
         pass
 
+    def apply_fbx_profile(self, name: str, force: bool=False) -> bool:
+        """ FBX 書き出し設定のプロファイルを適用
+
+        * 前回と同じプロファイルの場合は何もしない (FBXResetExport を省略)
+            * 適用済みのプロファイルはモジュールで管理する (すべての AppMain で共有)
+            * FBXExportBakeComplexAnimation が適用時と違う場合, fbxmaya が読み込まれていない場合は再設定
+        * 他のツールでそれ以外の FBX の設定を変更した場合は force=True か clear_fbx_profile()
+
+        Args:
+            name(str): FBX_PROFILES のキー
+            force(bool): True の場合は同じプロファイルでも再設定
+
+        Returns:
+            bool: 設定した場合は True
+        """
+        if name not in FBX_PROFILES:
+            raise ValueError(f'MDK | FBX profile is not found: {name}')
+
+        if not force and _fbx_state['profile'] == name:
+            _bake = get_fbx_bake_value()
+
+            if _bake is not None and _bake == _fbx_state['bake']:
+                return False
+
+        if not cmds.pluginInfo('fbxmaya', query=True, loaded=True):
+            cmds.loadPlugin('fbxmaya', quiet=True)
+
+        mel.eval('FBXResetExport;')
+
+        for _cmd, _value in FBX_PROFILES[name].items():
+            mel.eval(f'{_cmd} -v {_value};')
+
+        _fbx_state.update(profile=name, take=None, bake=get_fbx_bake_value())
+
+        return True
+
+
+    def apply_shot_settings(self, settings: dict) -> dict:
+        """ ショット設定をまとめて適用
+
+        * 現在値を1回だけ取得し、違う値だけを設定する (同じ値の setAttr を省略)
+        * 1つの Undo チャンクにまとめ、画面更新を停止して設定する (batch_edit)
+        * カメラを選択していない場合は aperture_size を設定しない
+
+        Args:
+            settings(dict): {'unit', 'fps', 'framerange', 'render', 'render_framerange', 'render_size', 'aperture_size'}
+
+        Returns:
+            dict: 変更した項目 {key: (変更前, 変更後)}
+
+        Examples:
+            >>> _mdk.apply_shot_settings({'fps': 24, 'framerange': (1001, 1009, 1100, 1108), 'render_size': (2048, 858)})
+            MDK | render_size = (1920, 1080) -> (2048, 858)
+            {'render_size': ((1920, 1080), (2048, 858))}
+        """
+        _current = self.get_shot_settings()
+        _setters = {
+            'fps': self.set_fps,
+            'framerange': lambda values: self.set_framerange(*values),
+            'render': self.set_render,
+            'render_framerange': lambda values: self.set_render_framerange(*values),
+            'render_size': lambda values: self.set_render_size(*values),
+            'unit': self.set_unit,
+        }
+
+        if _current['aperture_size'] is not None:
+            _setters['aperture_size'] = lambda values: self.set_aperture_size(*values)
+
+        _changes = scene.diff_settings(_current, settings, keys=_setters, compare=SHOT_SETTINGS_COMPARE)
+
+        if not _changes:
+            return _changes
+
+        with batch_edit('mdkApplyShotSettings'):
+            scene.apply_settings(_changes, _setters)
+
+        self.invalidate_scene_state()
+
+        for _key, (_before, _after) in _changes.items():
+            print(f'MDK | {_key} = {_before} -> {_after}')
+
+        return _changes
+
+
     def apply_alembic_cache(self, filepath: str):
         # 選択しているオブジェクトを取得
         _selection = cmds.ls(sl=True)
@@ -237,6 +906,65 @@ class AppMain:
 
 
 
+    def clear_fbx_profile(self):
+        """ 適用済みの FBX プロファイルを破棄 (次の書き出しで再設定) """
+        _fbx_state.update(profile=None, take=None, bake=None)
+
+
+    def classify_files(self, filepath_list: list[str]) -> dict[str, list[str]]:
+        """ ファイルをインポート方法ごとに分類
+
+        Returns:
+            dict[str, list[str]]: {'usd', 'image', 'abc', 'maya', 'unsupported', 'missing'}
+        """
+        return filetypes.classify_files(filepath_list, IMPORT_KINDS)
+
+
+    def collect_file_dependencies(
+                self,
+                node_types: list[str] = None,
+                stale_time: float = None) -> dependencies.DependencyReport:
+        """ シーン全体の参照ファイルをまとめて確認
+
+        * FILE_ATTR_DICT のノードタイプごとに1回だけ ls し、リファレンスも含めて集める
+        * file ノードの UDIM, 連番は fileTextureNamePattern のパターンで確認
+        * 同じファイルは1回だけ、すべてのファイルをスレッドプールで stat する
+
+        Args:
+            node_types(list[str], optional): 確認するノードタイプ. None の場合は FILE_ATTR_DICT と 'reference'
+            stale_time(float, optional): この時刻より後に更新されたファイルを stale にする. None の場合はシーンの保存日時
+
+        Returns:
+            dependencies.DependencyReport: missing, empty, stale とノードタイプごとの参照ファイル
+        """
+        if node_types is None:
+            node_types = list(FILE_ATTR_DICT) + ['reference']
+
+        if stale_time is None:
+            stale_time = dependencies.get_scene_time(self.get_filepath())
+
+        _available = set(cmds.allNodeTypes())
+        _entries = []
+
+        for _node_type in node_types:
+            if _node_type not in _available:
+                continue
+
+            for _node in cmds.ls(type=_node_type, long=True):
+                if _node_type == 'reference':
+                    _filepath = get_reference_filepath(_node)
+
+                elif _node_type == 'file':
+                    _filepath = get_texture_filepath(_node)
+
+                else:
+                    _filepath = cmds.getAttr(f'{_node}.{FILE_ATTR_DICT[_node_type]}')
+
+                _entries.append((_node_type, _node, _filepath))
+
+        return dependencies.collect_dependencies(_entries, stale_time=stale_time, kinds=SEQUENCE_KINDS)
+
+
     def clear_plugins(self):
         """ 不要なプラグインデータを削除 """
         print('MDK | [Clear Plugins]')
@@ -275,43 +1003,317 @@ class AppMain:
                 name: str,
                 size: list|tuple=None,
                 framerange: list|tuple=None,
-                ext: str = 'jpg',):
+                ext: str = 'jpg',
+                incremental: bool = False,
+                mp4: bool = False,) -> list[tuple[int, int]]:
         
         """
         * defaultRenderGlobals.imageFormat
+        * incremental=True の場合は存在しない・古いフレームのみ描画 (mdkapps.playblast)
+          (未保存の変更がある場合はすべてのフレーム)
+        * mp4=True の場合は連番を書き出しながら '{filepath}/{name}.mp4' にエンコード (mdkapps.encode)
+
+        Returns:
+            list[tuple[int, int]]: 描画したフレーム範囲
+        """
+
+        _file_format_dict = {
+            'jpg': 8,
+            'png': 32,
+        }
+        
+        print('# --------------------------------- #')
+        print('# Create Playblast')
+        print('# --------------------------------- #')
+
+        print(f'Name: {name}')
+        print(f'Size: {size}')
+        print(f'Ext: {ext}')
+        print(f'Range: {framerange}')
+        print(f'Filepath: {filepath}')
+
+        _prefix = f'{filepath}/{name}'
+        _ranges = [(framerange[0], framerange[1])]
+
+        if incremental:
+            _fingerprint = get_playblast_fingerprint(self.get_active_camera(), size, ext)
+            _ranges = playblast.get_stale_ranges(_prefix, ext, framerange, _fingerprint)
+
+            print(f'Stale: {_ranges}')
+
+            if not _ranges and not mp4:
+                return []
+
+        _encoder = None
+
+        if mp4:
+            _encoder = encode.SequenceEncoder(
+                [
+                    playblast.get_frame_path(_prefix, _frame, ext)
+                    for _frame in range(int(framerange[0]), int(framerange[1]) + 1)
+                ],
+                f'{_prefix}.mp4',
+                fps=self.get_fps() or 24,
+            )
+            _encoder.start()
+
         
+        try:
+            cmds.setAttr(
+                    'defaultRenderGlobals.imageFormat',
+                    _file_format_dict[ext]
+            )
+
+            for _start, _end in _ranges:
+                cmds.playblast( 
+                    f = _prefix,
+                    v = False, 
+                    percent = 100,
+                    format = 'image',
+                    widthHeight = size,
+                    startTime = _start,
+                    endTime = _end,
+                    forceOverwrite = True,
+                )
+
+        except BaseException:
+            if _encoder:
+                _encoder.cancel()
+
+            raise
+
+        if incremental:
+            playblast.update_manifest(_prefix, ext, iter_range_frames(_ranges), _fingerprint)
+
+        if _encoder:
+            print(f'Movie: {_encoder.finish()}')
+
+        return _ranges
+
+
+    def create_playblast_batch(
+                self,
+                filepath: str,
+                name: str,
+                size: list|tuple=None,
+                framerange: list|tuple=None,
+                ext: str = 'jpg',
+                camera: str = None,
+                chunk_size: int = workers.DEFAULT_CHUNK_SIZE,
+                max_workers: int = None,
+                retries: int = workers.DEFAULT_RETRIES,
+                callback = None,
+                launcher = None,
+                incremental: bool = False) -> list[workers.JobResult]:
+        """ フレーム範囲を分割して、ヘッドレスの mayapy で並列にプレイブラスト
+
+        * 保存済みのシーンファイルを各ワーカー (別プロセス) で開いて描画する
+        * すべてのチャンクが終わるまで戻らない (作業中のセッションは待機する)
+        * 出力は create_playblast() と同じ '{filepath}/{name}.####.{ext}' の1つの連番
+        * 失敗したチャンクは retries 回までリトライ
+
+        Args:
+            filepath(str): 出力ディレクトリ
+            name(str): 出力ファイル名
+            size(list | tuple, optional): サイズ. None の場合はレンダーサイズ
+            framerange(list | tuple, optional): フレーム範囲. None の場合はタイムスライダーの範囲
+            ext(str): 'jpg', 'png' (worker.FILE_FORMATS)
+            camera(str, optional): カメラ. None の場合はアクティブなビューのカメラ
+            chunk_size(int): 1ワーカーのフレーム数
+            max_workers(int, optional): 同時実行数
+            retries(int): 失敗時のリトライ回数
+            callback(Callable, optional): callback(done, total, JobResult) で進捗を通知
+            launcher(Callable, optional): launcher(job) -> returncode. None の場合は mayapy + worker.py
+            incremental(bool): True の場合は存在しない・古いフレームのみ描画 (mdkapps.playblast)
+
+        Raises:
+            ValueError: worker.FILE_FORMATS にない ext の場合
+
+        Returns:
+            list[workers.JobResult]: チャンクごとの実行結果
         """
+        if ext not in worker.FILE_FORMATS:
+            raise ValueError(f'MDK | Not supported ext: {ext} {tuple(worker.FILE_FORMATS)}')
+
+        _scene = cmds.file(query=True, sceneName=True)
+
+        if not _scene or cmds.file(query=True, modified=True):
+            raise RuntimeError('MDK | Save the scene before batch playblast')
+
+        if size is None:
+            size = self.get_render_size()
+
+        if framerange is None:
+            framerange = (
+                int(cmds.playbackOptions(query=True, minTime=True)),
+                int(cmds.playbackOptions(query=True, maxTime=True)),
+            )
+
+        if camera is None:
+            camera = self.get_active_camera()
+
+        if launcher is None:
+            launcher = workers.SubprocessLauncher(
+                find_mayapy(),
+                pathlib.Path(__file__).with_name('worker.py'),
+            )
+
+        _prefix = f'{filepath}/{name}'
+        _ranges = [(int(framerange[0]), int(framerange[-1]))]
+
+        if incremental:
+            _fingerprint = get_playblast_fingerprint(camera, size, ext)
+            _ranges = playblast.get_stale_ranges(_prefix, ext, _ranges[0], _fingerprint)
+
+        _jobs = [
+            {
+                'scene': _scene,
+                'filepath': _prefix,
+                'start': _start,
+                'end': _end,
+                'size': list(size),
+                'ext': ext,
+                'camera': camera,
+            }
+            for _range in _ranges
+            for _start, _end in workers.split_range(*_range, chunk_size)
+        ]
+
+        _results = workers.run_jobs(
+            _jobs,
+            launcher,
+            max_workers=max_workers,
+            retries=retries,
+            callback=callback,
+        )
+
+        if incremental:
+            _done = [(_result.job['start'], _result.job['end']) for _result in _results if _result.ok]
+            playblast.update_manifest(_prefix, ext, iter_range_frames(_done), _fingerprint)
+
+        return _results
+
+
+    def create_playblasts(
+                self,
+                shots: list[dict],
+                filepath: str,
+                size: list|tuple=None,
+                ext: str = 'jpg',
+                callback = None) -> list[playblast.ShotResult]:
+        """ 複数ショットのプレイブラストを1つのセッションで作成
+
+        * imageFormat は変わるときだけ設定
+        * ショットごとにアクティブなビューのカメラとフレーム範囲を切り替える (シーンの再読み込みなし)
+        * 終了後にカメラ, 現在のフレーム, imageFormat を元に戻す
+        * 出力は '{filepath}/{name}.####.{ext}'
+
+        Args:
+            shots(list[dict]): [{'name', 'camera', 'framerange', 'size', 'ext'}, ...]
+            filepath(str): 出力ディレクトリ
+            size(list | tuple, optional): ショットに 'size' がない場合のサイズ. None の場合はレンダーサイズ
+            ext(str): ショットに 'ext' がない場合の拡張子
+            callback(Callable, optional): callback(done, total, ShotResult)
+
+        Returns:
+            list[playblast.ShotResult]: ショットごとの出力と時間
+        """
+        _file_format_dict = {
+            'jpg': 8,
+            'png': 32,
+        }
+
+        _shots = playblast.normalize_shots(shots, size or self.get_render_size(), ext)
+        _panel = get_active_panel()
+
+        if _panel is None:
+            raise RuntimeError('MDK | Model panel is not found')
+
+        _camera = cmds.modelPanel(_panel, query=True, camera=True)
+        _image_format = cmds.getAttr('defaultRenderGlobals.imageFormat')
+        _current_time = cmds.currentTime(query=True)
+        _state = {'image_format': _image_format}
+
+        def _render_shot(shot: dict) -> str:
+            if shot['camera']:
+                cmds.modelPanel(_panel, edit=True, camera=shot['camera'])
+
+            _format = _file_format_dict[shot['ext']]
+
+            if _format != _state['image_format']:
+                cmds.setAttr('defaultRenderGlobals.imageFormat', _format)
+                _state['image_format'] = _format
+
+            _prefix = f'{filepath}/{shot["name"]}'
+
+            cmds.playblast(
+                f = _prefix,
+                v = False,
+                percent = 100,
+                format = 'image',
+                widthHeight = shot['size'],
+                startTime = shot['framerange'][0],
+                endTime = shot['framerange'][1],
+                forceOverwrite = True,
+                editorPanelName = _panel,
+            )
+
+            return f'{_prefix}.####.{shot["ext"]}'
+
+        try:
+            return playblast.run_shots(_shots, _render_shot, callback=callback)
+
+        finally:
+            cmds.modelPanel(_panel, edit=True, camera=_camera)
+            cmds.setAttr('defaultRenderGlobals.imageFormat', _image_format)
+            cmds.currentTime(_current_time, edit=True)
+
+
+    def iter_playblast(
+                self,
+                filepath: str,
+                name: str,
+                size: list|tuple=None,
+                framerange: list|tuple=None,
+                ext: str = 'jpg',
+                cancel_event = None):
+        """ 1フレームずつプレイブラストして結果を返すジェネレータ
+
+        * create_playblast() と同じ '{filepath}/{name}.####.{ext}' に書き出す
+        * ループを抜ける (close()) か cancel_event をセットするとキャンセル
+
+        Examples:
+            >>> for _result in app.iter_playblast('/pb', 'shot', (1920, 1080), (1001, 1100)):
+            ...     print(f'{_result.frame}: {_result.seconds:.3f} sec, {_result.size} bytes')
 
+        Yields:
+            playblast.FrameResult: (frame, path, seconds, size)
+        """
         _file_format_dict = {
             'jpg': 8,
             'png': 32,
         }
-        
-        print('# --------------------------------- #')
-        print('# Create Playblast')
-        print('# --------------------------------- #')
-
-        print(f'Name: {name}')
-        print(f'Size: {size}')
-        print(f'Ext: {ext}')
-        print(f'Range: {framerange}')
-        print(f'Filepath: {filepath}')
 
-        
-        cmds.setAttr(
-                'defaultRenderGlobals.imageFormat',
-                _file_format_dict[ext]
-        )
+        _prefix = f'{filepath}/{name}'
+        cmds.setAttr('defaultRenderGlobals.imageFormat', _file_format_dict[ext])
+
+        def _render_frame(frame: int):
+            cmds.playblast(
+                f = _prefix,
+                v = False,
+                percent = 100,
+                format = 'image',
+                widthHeight = size,
+                startTime = frame,
+                endTime = frame,
+                forceOverwrite = True,
+            )
 
-        cmds.playblast( 
-            f = f'{filepath}/{name}',
-            v = False, 
-            percent = 100,
-            format = 'image',
-            widthHeight = size,
-            startTime = framerange[0],
-            endTime = framerange[1],
-            forceOverwrite = True,
+        yield from playblast.iter_frames(
+            _render_frame,
+            range(int(framerange[0]), int(framerange[1]) + 1),
+            lambda frame: playblast.get_frame_path(_prefix, frame, ext),
+            cancel_event=cancel_event,
         )
 
 
@@ -344,7 +1346,7 @@ class AppMain:
                 name = name.rsplit("|",1)[1]
 
             nodes = "".join([" -root "+x for x in nodes])
-            mel_cmd = f'AbcExport -j "{frames} -stripNamespaces -uvWrite{nodes} -file {filepath}"'
+            mel_cmd = f'AbcExport -j "{frames} {ABC_OPTIONS}{nodes} -file {filepath}"'
 
             # Make directory
             dirname = os.path.dirname(filepath)
@@ -357,18 +1359,78 @@ class AppMain:
                 raise ValueError (ex)
 
 
+    def export_abc_batch(self, jobs: list[tuple], options: str=ABC_OPTIONS) -> list[str]:
+        """ 複数の Alembic を1回の AbcExport で書き出し
+
+        * AbcExport に複数の -jobArg を渡し、タイムラインの評価を1回にまとめる
+        * 出力ディレクトリは書き出し前にまとめて作成
+        * 選択は変更しない (ルートはロングネームで指定)
+
+        Args:
+            jobs(list[tuple]): [(filepath, roots, framerange), ...] framerange は None で現在のフレームのみ
+            options(str): すべてのジョブに共通の AbcExport オプション
+
+        Returns:
+            list[str]: 書き出したファイルパス
+
+        Examples:
+            >>> _app.export_abc_batch([
+            ...     ('/cache/charaA.abc', ['charaA:root'], (1001, 1100)),
+            ...     ('/cache/charaB.abc', ['charaB:root'], (1001, 1100)),
+            ... ])
+        """
+        _job_args = []
+        _filepath_list = []
+
+        for _filepath, _roots, _framerange in jobs:
+            if not _roots:
+                raise ValueError(f'MDK | Roots are empty: {_filepath}')
+
+            _missing = [_root for _root in _roots if not cmds.objExists(_root)]
+
+            if _missing:
+                raise ValueError(f'MDK | Nodes are not found: {_missing}')
+
+            _job_args.append(get_abc_job_arg(_filepath, cmds.ls(_roots, long=True), _framerange, options))
+            _filepath_list.append(_filepath)
+
+        if len(set(_filepath_list)) != len(_filepath_list):
+            raise ValueError('MDK | Duplicate Alembic output path')
+
+        if not _job_args:
+            return []
+
+        for _dirpath in {os.path.dirname(_filepath) for _filepath in _filepath_list}:
+            if _dirpath:
+                os.makedirs(_dirpath, exist_ok=True)
+
+        if not cmds.pluginInfo('AbcExport', query=True, loaded=True):
+            cmds.loadPlugin('AbcExport', quiet=True)
+
+        with batch_edit('mdkExportAbcBatch'):
+            cmds.AbcExport(jobArg=_job_args)
+
+        return _filepath_list
+
+
     def export_fbx(
                 self,
                 filepath: str,
                 nodes: list[str],
                 startframe=None,
-                endframe=None):
+                endframe=None,
+                profile: str=None):
         
         """
         Reference From:
 
             - https://forums.autodesk.com/t5/maya-animation-and-rigging/export-animation-with-specific-frame-range-in-python/td-p/8945591
 
+        * FBX の設定は apply_fbx_profile() / set_fbx_take() で前回と同じ場合は再設定しない
+
+        Args:
+            profile(str, optional): FBX_PROFILES のキー. None の場合はフレーム範囲があれば 'animation', なければ 'default'
+
         Examples:
             >>> mel.eval('FBXResetExport;')
             >>> mel.eval('FBXExportBakeComplexAnimation -v true;')
@@ -384,32 +1446,123 @@ class AppMain:
 
         if not nodes:
             raise ValueError('Select any nodes')
-            
-        mel.eval('FBXResetExport;')
-        # mel.eval('FBXExportEmbeddedTextures -v false;')
 
-        if (startframe is not None) and (endframe is not None):
-            mel.eval('FBXExportBakeComplexAnimation -v true;')    
-            mel.eval("FBXExportSplitAnimationIntoTakes -clear;")
-            mel.eval(f'FBXExportSplitAnimationIntoTakes -v \"tata\" {startframe} {endframe}')
+        _animated = (startframe is not None) and (endframe is not None)
 
+        self.apply_fbx_profile(profile or ('animation' if _animated else 'default'))
+        self.set_fbx_take(startframe, endframe)
 
-        mel_cmd = f'FBXExport -f "{filepath}" -s'
+        cmds.select(nodes, replace=True)
+
+        mel_cmd = f'FBXExport -f "{pathlib.Path(filepath).as_posix()}" -s'
         mel.eval(mel_cmd)
 
+
+    def export_fbx_batch(
+                self,
+                jobs: list[tuple],
+                profile: str=None,
+                prebake: bool=True) -> list[str]:
+        """ 複数の FBX をまとめて書き出し
+
+        * フレーム範囲ごとにまとめ、FBX の設定 (プロファイル, テイク) は範囲ごとに1回だけ行う
+        * prebake=True の場合は、範囲内のすべてのノードを bakeResults で1回ベイクしてから書き出し、
+          書き出し後に Undo で元に戻す (FBX プラグインの書き出しごとのベイクを省略)
+        * 出力ディレクトリは書き出し前にまとめて作成し、終了後に選択を元に戻す
+
+        Args:
+            jobs(list[tuple]): [(filepath, nodes, startframe, endframe), ...]
+            profile(str, optional): FBX_PROFILES のキー (prebake しない場合)
+            prebake(bool): True の場合は範囲ごとに1回だけベイク (Undo が無効な場合は使用しない)
+
+        Returns:
+            list[str]: 書き出したファイルパス
+        """
+        _groups = {}
+
+        for _filepath, _nodes, _startframe, _endframe in jobs:
+            if not _nodes:
+                raise ValueError(f'MDK | Nodes are empty: {_filepath}')
+
+            _range = (_startframe, _endframe) if (_startframe is not None) and (_endframe is not None) else None
+            _groups.setdefault(_range, []).append((str(_filepath), cmds.ls(_nodes, long=True)))
+
+        _filepath_list = [_filepath for _group in _groups.values() for _filepath, _ in _group]
+
+        for _dirpath in {os.path.dirname(_filepath) for _filepath in _filepath_list}:
+            if _dirpath:
+                os.makedirs(_dirpath, exist_ok=True)
+
+        _selection = cmds.ls(selection=True, long=True)
+        _prebake = prebake and cmds.undoInfo(query=True, state=True)
+
+        try:
+            for _range, _group in _groups.items():
+                if _range is None or not _prebake:
+                    for _filepath, _nodes in _group:
+                        self.export_fbx(_filepath, _nodes, *(_range or (None, None)), profile=profile)
+
+                    continue
+
+                # ベイクに失敗した場合はチャンクに何も入っていないため Undo しない (前の操作を戻さない)
+                _baked = False
+
+                try:
+                    with batch_edit('mdkExportFbxBatch'):
+                        cmds.bakeResults(
+                            [_node for _, _nodes in _group for _node in _nodes],
+                            hierarchy='below',
+                            time=_range,
+                            simulation=True,
+                            disableImplicitControl=True,
+                            preserveOutsideKeys=True,
+                        )
+                        _baked = True
+
+                        for _filepath, _nodes in _group:
+                            self.export_fbx(_filepath, _nodes, *_range, profile='baked')
+
+                finally:
+                    if _baked:
+                        cmds.undo()
+
+        finally:
+            if _selection:
+                cmds.select(_selection, replace=True)
+            else:
+                cmds.select(clear=True)
+
+        return _filepath_list
+
             
     def export_nodes(
                     self,
                     filepath: str,
                     nodes: list[str],
                     startframe=None,
-                    endframe=None):
-        
+                    endframe=None,
+                    background: bool=False,
+                    launcher=None):
+        """ ノードを書き出し (.abc, .fbx, .ma, .mb, .usd)
+
+        Args:
+            background(bool): True の場合は export_nodes_async() で書き出して JobHandle を返す
+            launcher(Callable, optional): background=True の場合のランチャー
+
+        Returns:
+            workers.JobHandle: background=True の場合
+        """
+        if background:
+            return self.export_nodes_async([(filepath, nodes, startframe, endframe)], launcher=launcher)
+
         if self.is_abc(filepath):
             self.export_abc(filepath, nodes, startframe, endframe)
         
         elif self.is_fbx(filepath):
             self.export_fbx(filepath, nodes, startframe, endframe)
+
+        elif self.is_usd(filepath):
+            self.export_usd(filepath, nodes, startframe, endframe)
         # elif self.is_obj(filepath):
         #     # self.save_selection(filepath, nodes, startframe, endframe)
         #     self.save_selection(filepath, nodes)
@@ -420,38 +1573,290 @@ class AppMain:
             raise TypeError('MDK | Not supported file type')
 
 
+    def export_nodes_cached(
+                self,
+                jobs: list[tuple],
+                force: bool = False,
+                callback = None) -> manifest.ExportReport:
+        """ マニフェストを確認して、入力が変わったファイルだけ書き出し
+
+        * 入力 : ノード, フレーム範囲, 書き出しオプション, シーンの更新日時とハッシュ, リファレンスの更新日時
+        * 出力ファイルごとに '{filepath}.export.json' を保存する
+        * 未保存のシーンは入力を確定できないため、すべて書き出す (マニフェストは更新しない)
+
+        Args:
+            jobs(list[tuple]): [(filepath, nodes, startframe, endframe), ...]
+            force(bool): True の場合はすべて書き出し
+            callback(Callable, optional): callback(done, total, ExportResult) で進捗を通知
+
+        Returns:
+            manifest.ExportReport: hits, misses, summary()
+
+        Examples:
+            >>> _report = _app.export_nodes_cached([('/cache/chara.abc', ['|chara'], 1001, 1100)])
+            >>> _report.summary()
+            {'total': 1, 'hits': 1, 'misses': 0, 'seconds': 0.01}
+        """
+        _scene = cmds.file(query=True, sceneName=True)
+        _source = None
+
+        if _scene and not cmds.file(query=True, modified=True):
+            _references = [
+                re.sub(r'\{\d+\}$', '', _path)
+                for _path in cmds.file(query=True, reference=True) or []
+            ]
+            _source = manifest.get_source_inputs(_scene, _references)
+
+        _jobs = []
+
+        for _filepath, _nodes, _startframe, _endframe in jobs:
+            _nodes = cmds.ls(_nodes, long=True)
+            _inputs = None
+
+            if _source is not None:
+                _inputs = dict(
+                    _source,
+                    nodes=_nodes,
+                    framerange=[_startframe, _endframe],
+                    options=self.get_export_options(_filepath),
+                )
+
+            _jobs.append({
+                'filepath': str(_filepath),
+                'nodes': _nodes,
+                'start': _startframe,
+                'end': _endframe,
+                'inputs': _inputs,
+            })
+
+        def _export(job: dict):
+            self.export_nodes(job['filepath'], job['nodes'], job['start'], job['end'])
+
+        return manifest.run_exports(_jobs, _export, force=force, callback=callback)
+
+
+    def export_nodes_async(
+                self,
+                jobs: list[tuple],
+                max_workers: int = None,
+                retries: int = workers.DEFAULT_RETRIES,
+                callback = None,
+                launcher = None) -> workers.JobHandle:
+        """ 一時シーンを書き出して、ヘッドレスの mayapy で並列にエクスポート
+
+        * 現在のシーン (未保存の変更を含む) を一時ファイルに書き出し、各ワーカーで開いて書き出す
+        * すぐに戻り、作業中のセッションはブロックしない
+        * 一時ファイルはすべてのジョブの終了後に削除する
+
+        Args:
+            jobs(list[tuple]): [(filepath, nodes, startframe, endframe), ...] (.abc, .fbx, .ma, .mb, .usd)
+            max_workers(int, optional): 同時実行数
+            retries(int): 失敗時のリトライ回数
+            callback(Callable, optional): callback(done, total, JobResult). バックグラウンドスレッドから呼ばれる
+            launcher(Callable, optional): launcher(job) -> returncode. None の場合は mayapy + worker.py
+
+        Returns:
+            workers.JobHandle: status, logs, timings, result()
+
+        Examples:
+            >>> _handle = _app.export_nodes_async([('/cache/chara.abc', ['|chara'], 1001, 1100)])
+            >>> _handle.status
+            'running'
+            >>> _handle.result()
+        """
+        _jobs = []
+
+        for _filepath, _nodes, _startframe, _endframe in jobs:
+            if not _nodes:
+                raise ValueError(f'MDK | Nodes are empty: {_filepath}')
+
+            if not (self.is_abc(_filepath) or self.is_fbx(_filepath) or self.is_maya(_filepath) or self.is_usd(_filepath)):
+                raise TypeError(f'MDK | Not supported file type: {_filepath}')
+
+            _jobs.append({
+                'task': 'export',
+                'filepath': str(_filepath),
+                'nodes': cmds.ls(_nodes, long=True),
+                'start': _startframe,
+                'end': _endframe,
+            })
+
+        if launcher is None:
+            launcher = workers.SubprocessLauncher(
+                find_mayapy(),
+                pathlib.Path(__file__).with_name('worker.py'),
+            )
+
+        _dirpath = tempfile.mkdtemp(prefix='mdk_export_')
+
+        try:
+            _start = time.perf_counter()
+            _scene = save_snapshot(f'{_dirpath}/snapshot.mb')
+            _snapshot_time = time.perf_counter() - _start
+
+        except BaseException:
+            shutil.rmtree(_dirpath, ignore_errors=True)
+            raise
+
+        for _job in _jobs:
+            _job['scene'] = _scene
+
+        _handle = workers.submit_jobs(
+            _jobs,
+            launcher,
+            max_workers=max_workers,
+            retries=retries,
+            callback=callback,
+            name='export',
+            timings={'snapshot': _snapshot_time},
+        )
+        _handle.add_done_callback(lambda handle: shutil.rmtree(_dirpath, ignore_errors=True))
+
+        return _handle
+
+
 
     def export_usd(
                 self,
                 filepath: str,
                 nodes: list[str],
                 startframe=None,
-                endframe=None):
+                endframe=None,
+                stride: float=1.0,
+                samples: list[float]=None):
         
         """ Export USD Selection
 
         * Reference from:
             - https://zenn.dev/remiria/articles/9ac3e31df4da98ba2f0b
             - https://github.com/Autodesk/maya-usd/blob/dev/lib/mayaUsd/commands/Readme.md
+
+        Args:
+            stride(float): フレームの間隔 (2.0 で2コマ打ち)
+            samples(list[float], optional): 1フレーム内のサンプル (モーションブラー用 [-0.25, 0.0, 0.25] など)
         
         """
         if not nodes:
             raise ValueError('Select any nodes')
 
+        load_usd()
 
         cmds.select(nodes)
-        if (startframe is None) or (endframe is None):
-            cmds.mayaUSDExport(file=filepath, selection=True, exportInstances=True)
+        cmds.mayaUSDExport(
+            file=filepath,
+            selection=True,
+            **get_usd_export_kwargs(startframe, endframe, stride, samples),
+        )
+
+
+    def export_usd_batch(
+                self,
+                jobs: list[tuple],
+                stride: float=1.0,
+                samples: list[float]=None,
+                shared_layer: str=None) -> list[str]:
+        """ 複数の USD をまとめて書き出し
+
+        * 選択は変更しない (exportRoots でルートを指定)
+        * shared_layer を指定した場合
+            * すべてのアセットを1回の mayaUSDExport で shared_layer に書き出す
+              (exportInstances でアセット間のインスタンスも1つのプロトタイプにまとまる)
+            * 各アセットのファイルは shared_layer のプリムをペイロードする小さなレイヤーになる
+            * フレーム範囲はすべてのジョブの範囲を合わせた範囲
+        * shared_layer を指定しない場合は、アセットごとに mayaUSDExport (画面更新は停止)
+        * プリムパスはノード名のため、同じレイヤーに同じ名前のノードがある場合は書き出し前にエラー
+            * shared_layer を指定した場合はすべてのジョブ, 指定しない場合はジョブごとに確認
+
+        Args:
+            jobs(list[tuple]): [(filepath, nodes, startframe, endframe), ...]
+            stride(float): フレームの間隔 (群衆は 2.0 で2コマ打ち)
+            samples(list[float], optional): 1フレーム内のサンプル
+            shared_layer(str, optional): 共有するベースレイヤーのパス
+
+        Raises:
+            ValueError: 別のノードが同じプリムパスになる場合 (get_usd_prim_paths)
+
+        Returns:
+            list[str]: 書き出したファイルパス (shared_layer を含む)
+
+        Examples:
+            >>> _app.export_usd_batch(
+            ...     [(f'/layout/{_name}.usd', [_name], 1001, 1100) for _name in _crowd],
+            ...     stride=2.0,
+            ...     shared_layer='/layout/crowd_base.usd',
+            ... )
+        """
+        _jobs = []
+
+        for _filepath, _nodes, _startframe, _endframe in jobs:
+            if not _nodes:
+                raise ValueError(f'MDK | Nodes are empty: {_filepath}')
 
+            _jobs.append((str(_filepath), cmds.ls(_nodes, long=True), _startframe, _endframe))
+
+        if not _jobs:
+            return []
+
+        # プリムパスの重複を確認 (書き出し前)
+        if shared_layer:
+            get_usd_prim_paths([_node for _, _nodes, _, _ in _jobs for _node in _nodes])
         else:
+            for _, _nodes, _, _ in _jobs:
+                get_usd_prim_paths(_nodes)
+
+        _filepath_list = [_job[0] for _job in _jobs] + ([str(shared_layer)] if shared_layer else [])
+
+        for _dirpath in {os.path.dirname(_filepath) for _filepath in _filepath_list}:
+            if _dirpath:
+                os.makedirs(_dirpath, exist_ok=True)
+
+        load_usd()
+
+        if not cmds.pluginInfo('mayaUsdPlugin', query=True, loaded=True):
+            cmds.loadPlugin('mayaUsdPlugin', quiet=True)
+
+        with batch_edit('mdkExportUsdBatch'):
+            if not shared_layer:
+                for _filepath, _nodes, _startframe, _endframe in _jobs:
+                    cmds.mayaUSDExport(
+                        file=_filepath,
+                        exportRoots=_nodes,
+                        **get_usd_export_kwargs(_startframe, _endframe, stride, samples),
+                    )
+
+                return _filepath_list
+
+            _ranges = [(_start, _end) for _, _, _start, _end in _jobs if _start is not None and _end is not None]
+            _startframe = min(_start for _start, _ in _ranges) if _ranges else None
+            _endframe = max(_end for _, _end in _ranges) if _ranges else None
+
             cmds.mayaUSDExport(
-                file=filepath,
-                selection=True,
-                exportInstances=True,
-                frameRange=[int(startframe), int(endframe)],
-                frameStride=1.0,
+                file=str(shared_layer),
+                exportRoots=[_node for _, _nodes, _, _ in _jobs for _node in _nodes],
+                **get_usd_export_kwargs(_startframe, _endframe, stride, samples),
             )
 
+        for _filepath, _nodes, _, _ in _jobs:
+            write_usd_payload_layer(_filepath, shared_layer, get_usd_prim_paths(_nodes))
+
+        return _filepath_list
+
+
+    def get_export_options(self, filepath: str) -> dict:
+        """ export_nodes() の書き出しオプション (マニフェストの入力) """
+        _options = {'version': VERSION, 'ext': filetypes.find_suffix(filepath)}
+
+        if self.is_abc(filepath):
+            _options['abc'] = ABC_OPTIONS
+
+        elif self.is_fbx(filepath):
+            _options['fbx'] = FBX_PROFILES
+
+        elif self.is_usd(filepath):
+            _options['usd'] = {'exportInstances': True, 'frameStride': 1.0}
+
+        return _options
+
 
     def get_all_lights(self) -> list[str]:
         """
@@ -470,16 +1875,21 @@ class AppMain:
         return cmds.ls(type=_type_list)
     
 
+    def get_active_camera(self) -> str:
+        """ アクティブなビューのカメラを返す (見つからない場合は 'persp') """
+        return get_active_camera()
+
+
     def get_camera_shape(self, node: str) -> str:
         """ カメラのシェイプノードを取得 """
         if cmds.objectType(node, isType='camera'):
             return node
 
         elif cmds.objectType(node, isType='transform'):
-            camera_shape = cmds.listRelatives(node, shapes=True, type='camera')[0]
+            camera_shapes = cmds.listRelatives(node, shapes=True, type='camera')
 
-            if camera_shape:
-                return camera_shape
+            if camera_shapes:
+                return camera_shapes[0]
             else:
                 return None
 
@@ -573,13 +1983,59 @@ class AppMain:
             
         return _plane
 
+    def get_import_tasks(self, filepath_list: list[str], namespace=None) -> list[tuple]:
+        """ import_files のインポート処理リストを返す
+
+        * 存在しない・未対応のファイルがあればエラー
+        * UDIMタイルの番号 (sequence.is_udim_tiles) の画像は UDIM のテクスチャにする
+
+        Returns:
+            list[tuple[str, Callable]]: [(filepath, インポート関数), ...]
+        """
+        _groups = self.classify_files(sequence.collapse(filepath_list, kinds=SEQUENCE_KINDS, udim=True))
+
+        if _groups['missing']:
+            raise FileNotFoundError(f'MDK | File is not found: {[str(_item) for _item in _groups["missing"]]}')
+
+        if _groups['unsupported']:
+            raise TypeError(f'MDK | Not supported file type: {_groups["unsupported"]}')
+
+        _tasks = []
+
+        for _item in _groups['image']:
+            _tasks.append((str(_item), functools.partial(self.import_texture, _item)))
+
+        if namespace is not None:
+            for _kind in ('usd', 'abc', 'maya'):
+                for _filepath in _groups[_kind]:
+                    _tasks.append((_filepath, functools.partial(self.import_file, _filepath, namespace=namespace)))
+
+            return _tasks
+
+        if _groups['usd']:
+            load_usd()
+
+        for _filepath in _groups['usd']:
+            _tasks.append((_filepath, functools.partial(
+                    cmds.file, _filepath, i=True, type='USD Import', preserveReferences=True)))
+
+        for _filepath in _groups['abc'] + _groups['maya']:
+            _tasks.append((_filepath, functools.partial(cmds.file, _filepath, i=True)))
+
+        return _tasks
+
+
     def get_main_window(self):
         """ Mayaのメインウィンドウを取得 
         
         """
+        omui = load_module('omui')
         ptr = omui.MQtUtil.mainWindow()
 
         if ptr is not None:
+            wrapInstance = load_module('wrapInstance')
+            QtWidgets = load_module('QtWidgets')
+
             return wrapInstance(int(ptr), QtWidgets.QWidget)
         
 
@@ -606,6 +2062,36 @@ class AppMain:
 
         
 
+    def get_scene_state(self) -> scene.SceneState:
+        """ シーン状態 (ファイルパス, FPS, フレーム範囲, レンダーサイズ, レンダラー, 選択) をまとめて返す
+
+        * キャッシュを返し、scriptJob (シーンを開く, 保存, 選択, フレーム範囲, FPS, レンダー設定の変更) で破棄する
+        * バッチモードでは毎回問い合わせる
+
+        Returns:
+            scene.SceneState: 不変のスナップショット
+        """
+        install_scene_callbacks()
+        return _scene_state_cache.get(self.query_scene_state)
+
+
+    def invalidate_scene_state(self):
+        """ get_scene_state() のキャッシュを破棄 """
+        _scene_state_cache.invalidate()
+
+
+    def query_scene_state(self) -> scene.SceneState:
+        """ シーン状態を問い合わせ (キャッシュしない) """
+        return scene.SceneState(
+            filepath=self.get_filepath(),
+            fps=self.get_fps(),
+            framerange=tuple(self.get_framerange()),
+            render_size=tuple(self.get_render_size()),
+            render=self.get_render(),
+            selection=tuple(self.get_selected_nodes()),
+        )
+
+
     def get_selected_nodes(self, long=True) -> list[str]:
         """ 選択しているノードを返す
 
@@ -618,13 +2104,44 @@ class AppMain:
         return cmds.ls(sl=True, long=long)
 
 
+    def get_shot_settings(self) -> dict:
+        """ ショット設定の現在値 (apply_shot_settings 用)
+
+        * aperture_size は選択しているカメラ (mm). カメラがない場合は None
+        """
+        _camera_shape = self.get_camera_shape_from_selection()
+        _aperture_size = None
+
+        if _camera_shape:
+            _aperture_size = (
+                cmds.getAttr(f'{_camera_shape}.horizontalFilmAperture') * 25.4,
+                cmds.getAttr(f'{_camera_shape}.verticalFilmAperture') * 25.4,
+            )
+
+        _linear = cmds.currentUnit(query=True, linear=True)
+
+        return {
+            'unit': next((_name for _name, _unit in UNIT_DICT.items() if _unit == _linear), _linear),
+            'fps': self.get_fps(),
+            'framerange': tuple(self.get_framerange()),
+            'render': self.get_render(),
+            'render_framerange': (
+                cmds.getAttr('defaultRenderGlobals.startFrame'),
+                cmds.getAttr('defaultRenderGlobals.endFrame'),
+            ),
+            'render_size': tuple(self.get_render_size()),
+            'aperture_size': _aperture_size,
+        }
+
+
 
     def import_file(self, filepath, namespace=None):    
-        if os.path.exists(filepath):
+        if preflight.exists(filepath):
             file, ext = os.path.splitext(filepath)
 
             if namespace is None:
                 if self.is_usd(filepath):
+                    load_usd()
                     # pm.importFile(filepath, type='USD Import',preserveReferences=True)
                     return cmds.file(filepath, i=True, type='USD Import', preserveReferences=True)
                 
@@ -651,18 +2168,61 @@ class AppMain:
             raise FileNotFoundError()
         
 
-    def import_files(self, filepath_list: list[str], namespace=None):
-        for _filepath in filepath_list:
-            self.import_file(_filepath, namespace=namespace)
+    def import_files(self, filepath_list: list[str], namespace=None) -> list:
+        """ 複数ファイルをインポート
+
+        * classify_files で分類してから、ファイルタイプごとにまとめてインポート
+        * 存在しない・未対応のファイルがあればインポート前にエラー
+        * 連番のイメージは1つのfileノードにまとめる
+        """
+        return [_func() for _, _func in self.get_import_tasks(filepath_list, namespace=namespace)]
+
 
+    def import_files_batch(self, filepath_list: list[str], namespace=None) -> list[tuple[str, float]]:
+        """ 複数ファイルをまとめてインポート
+
+        * batch_edit() 内で実行 (1つのUndo, 画面更新停止)
+
+        Returns:
+            list[tuple[str, float]]: [(filepath, インポート時間(秒)), ...]
+        """
+        _tasks = self.get_import_tasks(filepath_list, namespace=namespace)
+
+        with batch_edit('mdkImportFiles'):
+            return run_timed_tasks(_tasks)
+
+
+    def import_texture(self, filepath: str|sequence.FileSequence, colorspace=None):
+        """ テクスチャをfileノードとして読み込み
+
+        * FileSequence の場合
+            * UDIM: '<UDIM>' のパスで uvTilingMode を UDIM に設定
+            * 連番: 最初のフレームのパスで useFrameExtension を有効化
+
+        Args:
+            filepath(str | sequence.FileSequence): ファイルパス, または連番
+            colorspace(str, optional): カラースペース
+        """
+        _sequence = filepath if isinstance(filepath, sequence.FileSequence) else None
+
+        if _sequence is not None:
+            if _sequence.udim:
+                filepath = _sequence.pattern(sequence.STYLE_UDIM)
+            else:
+                filepath = _sequence.get_path(_sequence.first)
 
-    def import_texture(self, filepath, colorspace=None):
-        node_name = pathlib.Path(filepath).stem
         # file_node = cmds.shadingNode('file', asShader=True, name=node_name)
         file_node = cmds.shadingNode('file', asShader=True)
 
         cmds.setAttr(file_node + '.fileTextureName', filepath, type='string')
 
+        if _sequence is not None:
+            if _sequence.udim:
+                cmds.setAttr(f'{file_node}.uvTilingMode', 3)
+            else:
+                cmds.setAttr(f'{file_node}.useFrameExtension', 1)
+                cmds.expression(s=f'{file_node}.frameExtension=frame', object=file_node, alwaysEvaluate=True)
+
         # place2d_node = cmds.shadingNode('place2dTexture', asUtility=True, name=place2d_name)
         place2d_node = cmds.shadingNode('place2dTexture', asUtility=True)
 
@@ -679,32 +2239,32 @@ class AppMain:
 
         
 
-    def is_abc(self, filepath: str) -> tuple:
+    def is_abc(self, filepath: str) -> bool:
         """ Alembicファイル判定 """
-        return FILE_FILTER_ABC.match(filepath)
+        return filetypes.is_type(filepath, 'abc')
         
-    def is_fbx(self, filepath: str) -> tuple:
-        """ Alembicファイル判定 """
-        return FILE_FILTER_FBX.match(filepath)
+    def is_fbx(self, filepath: str) -> bool:
+        """ FBXファイル判定 """
+        return filetypes.is_type(filepath, 'fbx')
         
 
-    def is_image(self, filepath: str) -> tuple:
+    def is_image(self, filepath: str) -> bool:
         """ イメージファイル判定 """
-        return FILE_FILTER_IMAGE.match(filepath)
+        return filetypes.is_type(filepath, 'image')
        
-    def is_maya(self, filepath: str) -> tuple:
+    def is_maya(self, filepath: str) -> bool:
         """ Mayaファイル判定 """
-        return FILE_FILTER_MAYA.match(filepath)
+        return filetypes.is_type(filepath, 'maya')
 
        
-    def is_obj(self, filepath: str) -> tuple:
+    def is_obj(self, filepath: str) -> bool:
         """ Objファイル判定 """
-        return FILE_FILTER_OBJ.match(filepath)
+        return filetypes.is_type(filepath, 'obj')
 
     
-    def is_usd(self, filepath: str) -> tuple:
+    def is_usd(self, filepath: str) -> bool:
         """ USDファイル判定 """
-        return FILE_FILTER_USD.match(filepath)
+        return filetypes.is_type(filepath, 'usd')
     
 
     def open_dir(self):
@@ -741,7 +2301,7 @@ class AppMain:
         cmds.file(filepath, open=True, force=True)
         
 
-    def reference_file(self, filepath: str, namespace: str=None):
+    def reference_file(self, filepath: str, namespace: str=None, deferred: bool=False):
         """ ファイルをリファレンス
 
         Updated 2024/02/14 Yamagishi
@@ -751,24 +2311,113 @@ class AppMain:
             plugin(object): パイプライン用Mayaプラグインクラス
             filepath(str): リファレンスするファイル
             namespace(:obj:`str`, optional): namespace=None
+            deferred(bool): True の場合はアンロード状態でリファレンス (load_references() で後からロード)
         """
         # cmds.createReference(filepath, ns=namespace)
         
         if (namespace is None) or (namespace ==''):
             namespace = ':'
 
-        return cmds.file(filepath, reference=True, mergeNamespacesOnClash=True, namespace=namespace)
+        return cmds.file(
+            filepath,
+            reference=True,
+            mergeNamespacesOnClash=True,
+            namespace=namespace,
+            deferReference=deferred,
+        )
 
 
-    def reference_files(self, filepath_list: list[str], namespace: str=None):
+    def reference_files(self, filepath_list: list[str], namespace: str=None, deferred: bool=False) -> list[str]:
         """ 複数ファイルをリファレンス
 
+        * deferred=True の場合はすべてアンロード状態で作成し、
+          必要なものだけ load_references() でロードする
+
         Args:
             filepaths(list[str]): リファレンスするファイルリスト
             namespace(:obj:`str`, optional): namespace=None
+            deferred(bool): True の場合はアンロード状態でリファレンス
+
+        Returns:
+            list[str]: リファレンスノード名のリスト
         """
+        preflight.require_files(filepath_list)
+
+        _result = []
+
         for _filepath in filepath_list:
-            self.reference_file(_filepath, namespace=namespace)
+            _ref_path = self.reference_file(_filepath, namespace=namespace, deferred=deferred)
+            _result.append(cmds.referenceQuery(_ref_path, referenceNode=True))
+
+        return _result
+
+
+    def get_unloaded_references(self) -> list[str]:
+        """ アンロード状態のリファレンスノードを返す """
+        _result = []
+
+        for _ref_node in cmds.ls(type='reference'):
+            try:
+                if not cmds.referenceQuery(_ref_node, isLoaded=True):
+                    _result.append(_ref_node)
+
+            # sharedReferenceNode, ファイルのないリファレンスノード
+            except RuntimeError:
+                continue
+
+        return _result
+
+
+    def load_references(self, references: list[str]=None, callback=None) -> list[str]:
+        """ アンロード状態のリファレンスをまとめてロード
+
+        * batch_edit() 内で実行 (画面更新停止)
+        * ロード済みのリファレンスはスキップ
+
+        Args:
+            references(list[str], optional): リファレンスノード名のリスト. None の場合はすべて
+            callback(Callable, optional): callback(index, total, ref_node) で進捗を通知
+
+        Returns:
+            list[str]: ロードしたリファレンスノード名のリスト
+        """
+        if references is None:
+            references = self.get_unloaded_references()
+
+        _total = len(references)
+        _result = []
+
+        with batch_edit('mdkLoadReferences'):
+            for _index, _ref_node in enumerate(references):
+                if not cmds.referenceQuery(_ref_node, isLoaded=True):
+                    cmds.file(loadReference=_ref_node)
+                    _result.append(_ref_node)
+
+                if callback:
+                    callback(_index + 1, _total, _ref_node)
+
+        return _result
+
+
+    def reference_files_batch(self, filepath_list: list[str], namespace: str=None) -> list[tuple[str, float]]:
+        """ 複数ファイルをまとめてリファレンス
+
+        * batch_edit() 内で実行 (1つのUndo, 画面更新停止)
+        * 存在しないファイルがあればリファレンス前にエラー
+        * 同じファイルを複数回リファレンスした場合もそれぞれの時間を返す
+
+        Returns:
+            list[tuple[str, float]]: [(filepath, リファレンス時間(秒)), ...] (filepath_list の順)
+        """
+        preflight.require_files(filepath_list)
+
+        _tasks = [
+            (_filepath, functools.partial(self.reference_file, _filepath, namespace=namespace))
+            for _filepath in filepath_list
+        ]
+
+        with batch_edit('mdkReferenceFiles'):
+            return run_timed_tasks(_tasks)
 
 
     def select_nodes(self, nodes: list[str]):
@@ -806,6 +2455,31 @@ class AppMain:
         cmds.setAttr(f'{_plane}.colorSpace', 'sRGB - Texture', type='string')
 
 
+    def set_fbx_take(self, startframe: int=None, endframe: int=None) -> bool:
+        """ FBX のテイク (フレーム範囲) を設定
+
+        * 前回と同じ範囲の場合は何もしない
+
+        Returns:
+            bool: 設定した場合は True
+        """
+        _take = (startframe, endframe) if (startframe is not None) and (endframe is not None) else ()
+
+        if _fbx_state['take'] == _take:
+            return False
+
+        mel.eval('FBXExportSplitAnimationIntoTakes -clear;')
+
+        if _take:
+            mel.eval(f'FBXExportSplitAnimationIntoTakes -v \"tata\" {startframe} {endframe}')
+            mel.eval(f'FBXExportBakeComplexStart -v {startframe};')
+            mel.eval(f'FBXExportBakeComplexEnd -v {endframe};')
+
+        _fbx_state['take'] = _take
+
+        return True
+
+
     def set_fps(self, value: int):
         fps_dict = {
             15: "game",
@@ -835,6 +2509,7 @@ class AppMain:
         Args:
             value(bool): True: 有効, False: 無効
         """
+        renderSetup = load_module('renderSetup')
         _rs = renderSetup.instance()
         _rs._defaultRenderLayer.setRenderable(value)
 
@@ -930,15 +2605,8 @@ class AppMain:
         """ 単位を設定
         
         """
-        unit_dict = {
-            'centimeter': 'cm',
-            'millimeter': 'mm',
-            'meter': 'm',
-            'kilometer': 'km',
-        }
-
-        if unit in unit_dict:
-            cmds.currentUnit(linear=unit_dict[unit])
+        if unit in UNIT_DICT:
+            cmds.currentUnit(linear=UNIT_DICT[unit])
         else:
             raise ValueError(f'Invalid unit: {unit}')
 
@@ -0,0 +1,162 @@
+""" mdk_maya.worker
+
+* mayapy で実行するプレイブラスト・エクスポート用ワーカー
+
+* job['task'] で処理を切り替える
+    * 'playblast' (デフォルト) : AppMain.create_playblast_batch() から1チャンクごとに起動される
+    * 'export' : AppMain.export_nodes_async() から1ファイルごとに起動される (一時シーンを開いて書き出す)
+* mdkapps に依存しない (mayapy の環境に mdkapps がなくても実行できる)
+* ヘッドレスで実行するため、cmds.playblast ではなく VP2 の cmds.ogsRender で1フレームずつ描画し、
+  '{filepath}.{frame:04d}.{ext}' (プレイブラストと同じ名前) に移動する
+    * 並列のワーカーが同じ出力先に描画しないように、ジョブごとの一時ディレクトリに描画する
+
+Usage:
+    mayapy worker.py '{"scene": "...", "filepath": ".../name", "start": 1001, "end": 1100,
+                       "size": [1920, 1080], "ext": "jpg", "camera": "shotCam"}'
+    mayapy worker.py '{"task": "export", "scene": ".../snapshot.mb", "filepath": ".../chara.abc",
+                       "nodes": ["|chara"], "start": 1001, "end": 1100}'
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+        * added: export
+        * fixed: playblast で ogsRender の出力先をジョブごとの一時ディレクトリにする
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+
+FILE_FORMATS = {
+    'jpg': 8,
+    'png': 32,
+}
+
+MAYA_FILE_TYPES = {
+    '.ma': 'mayaAscii',
+    '.mb': 'mayaBinary',
+}
+
+ABC_OPTIONS = '-stripNamespaces -uvWrite'
+
+
+def export(job: dict):
+    """ ジョブのノードを書き出し (.abc, .fbx, .ma, .mb, .usd) """
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+
+    import maya.cmds as cmds
+    import maya.mel as mel
+
+    try:
+        cmds.file(job['scene'], open=True, force=True)
+
+        _filepath = job['filepath']
+        _nodes = job['nodes']
+        _ext = os.path.splitext(_filepath)[1].lower()
+        _start, _end = job.get('start'), job.get('end')
+        _has_range = _start is not None and _end is not None
+        _dirpath = os.path.dirname(_filepath)
+
+        if _dirpath:
+            os.makedirs(_dirpath, exist_ok=True)
+
+        if _ext == '.abc':
+            cmds.loadPlugin('AbcExport', quiet=True)
+
+            _args = [f'-frameRange {_start} {_end}'] if _has_range else []
+            _args.append(ABC_OPTIONS)
+            _args.extend(f'-root {_node}' for _node in _nodes)
+            _args.append(f'-file {_filepath}')
+
+            cmds.AbcExport(jobArg=' '.join(_args))
+
+        elif _ext == '.fbx':
+            cmds.loadPlugin('fbxmaya', quiet=True)
+            cmds.select(_nodes, replace=True)
+
+            mel.eval('FBXResetExport;')
+
+            if _has_range:
+                mel.eval('FBXExportBakeComplexAnimation -v true;')
+                mel.eval('FBXExportSplitAnimationIntoTakes -clear;')
+                mel.eval(f'FBXExportSplitAnimationIntoTakes -v \"tata\" {_start} {_end}')
+
+            mel.eval(f'FBXExport -f "{_filepath}" -s')
+
+        elif _ext in MAYA_FILE_TYPES:
+            cmds.select(_nodes, replace=True)
+            cmds.file(_filepath, force=True, type=MAYA_FILE_TYPES[_ext], exportSelected=True)
+
+        elif _ext in ('.usd', '.usda', '.usdc'):
+            cmds.loadPlugin('mayaUsdPlugin', quiet=True)
+            cmds.select(_nodes, replace=True)
+
+            _kwargs = {'frameRange': [int(_start), int(_end)], 'frameStride': 1.0} if _has_range else {}
+            cmds.mayaUSDExport(file=_filepath, selection=True, exportInstances=True, **_kwargs)
+
+        else:
+            raise TypeError(f'MDK | Not supported file type: {_filepath}')
+
+        print(f'MDK | Exported: {_filepath}')
+
+    finally:
+        maya.standalone.uninitialize()
+
+
+def playblast(job: dict):
+    """ ジョブのフレーム範囲を描画 """
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+
+    import maya.cmds as cmds
+
+    # ogsRender の出力先 (ジョブごと)
+    _tmp_dirpath = tempfile.mkdtemp(prefix='mdk_playblast_')
+
+    try:
+        cmds.file(job['scene'], open=True, force=True)
+
+        cmds.workspace(fileRule=['images', _tmp_dirpath])
+        cmds.setAttr('defaultRenderGlobals.imageFilePrefix', f'mdk_{job["start"]}_{job["end"]}', type='string')
+        cmds.setAttr('defaultRenderGlobals.imageFormat', FILE_FORMATS[job['ext']])
+        _width, _height = job['size']
+        _dirpath = os.path.dirname(job['filepath'])
+
+        if _dirpath:
+            os.makedirs(_dirpath, exist_ok=True)
+
+        for _frame in range(job['start'], job['end'] + 1):
+            cmds.currentTime(_frame, edit=True)
+
+            _rendered = cmds.ogsRender(
+                camera=job['camera'],
+                width=_width,
+                height=_height,
+                currentFrame=True,
+            )
+
+            shutil.move(_rendered, f'{job["filepath"]}.{_frame:04d}.{job["ext"]}')
+
+    finally:
+        maya.standalone.uninitialize()
+        shutil.rmtree(_tmp_dirpath, ignore_errors=True)
+
+
+TASKS = {
+    'export': export,
+    'playblast': playblast,
+}
+
+
+if __name__ == '__main__':
+    _job = json.loads(sys.argv[1])
+    TASKS[_job.get('task', 'playblast')](_job)
@@ -8,11 +8,22 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.2 2026-10-18 Tatsuya Yamagishi
+        * added: is_script()
+        * added: classify_files()
+        * updated: import_files() をファイルタイプごとにまとめて読み込み
+        * added: import_sequence()
+        * updated: ファイルの存在確認を preflight に変更
+        * added: get_scene_state() でシーン状態をまとめて取得 (コールバックで破棄するキャッシュ)
+        * added: apply_shot_settings() で違う値だけを1つの Undo で設定, get_shot_settings()
+        * added: collect_file_dependencies() でシーン全体の参照ファイルをまとめて確認 (mdkapps.dependencies)
+        * fixed: 連番にまとめるのを静止画だけにする ('sh010_v001.mov', 'sh010_v002.mov' をまとめない)
+
     * v0.0.1 2025-06-16 Tatsuya Yamagishi
         * added: new
 """
 
-VERSION = 'v0.0.1'
+VERSION = 'v0.0.2'
 NAME = 'mdk_nuke'
 
 import os
@@ -26,6 +37,12 @@ import nuke
 
 import nukescripts
 
+from .. import dependencies
+from .. import filetypes
+from .. import preflight
+from .. import scene
+from .. import sequence
+
 try: 
     from PySide6 import QtWidgets
 except:
@@ -56,8 +73,22 @@ EXT_DICT = {
 
 FILE_NODES_LIST = ['Read', 'Write', 'ReadGeo2', ]
 
+# import_files の分類 (優先順)
+IMPORT_KINDS = ('image', 'media', 'abc', 'usd', 'fbx', 'obj', 'nuke')
+
+# import_files, collect_file_dependencies で連番にまとめるファイルタイプ (静止画のみ)
+SEQUENCE_KINDS = ('still',)
+
 FILE_FILTER_SCRIPT = re.compile(r'.+\.(py)')
 
+# apply_shot_settings で比較する前の変換 (Root は first_frame, last_frame のみ)
+SHOT_SETTINGS_COMPARE = {
+    'framerange': scene.get_outer_range,
+}
+
+_scene_state_cache = scene.SceneStateCache()
+_scene_state_installed = False
+
 # ======================================= #
 # Functins
 # ======================================= #
@@ -73,6 +104,31 @@ def create_playblast(filepath: str, size: list|tuple=None, range: list|tuple=Non
     raise RuntimeError('未実装')
 
 
+def install_scene_callbacks():
+    """ get_scene_state() のキャッシュを破棄するコールバックを登録 (1回のみ)
+
+    * スクリプトを開く・保存・閉じる, Root のノブ (fps, フレーム範囲, format) の変更, ノードの選択
+    """
+    global _scene_state_installed
+
+    if _scene_state_installed:
+        return
+
+    nuke.addOnScriptLoad(_scene_state_cache.invalidate)
+    nuke.addOnScriptSave(_scene_state_cache.invalidate)
+    nuke.addOnScriptClose(_scene_state_cache.invalidate)
+    nuke.addKnobChanged(_scene_state_cache.invalidate, nodeClass='Root')
+    nuke.addKnobChanged(_on_knob_changed)
+
+    _scene_state_installed = True
+
+
+def _on_knob_changed():
+    """ ノードの選択が変わったらキャッシュを破棄 """
+    if nuke.thisKnob().name() == 'selected':
+        _scene_state_cache.invalidate()
+
+
 def open_dir(filepath) -> None:
     """
     フォルダを開く
@@ -81,10 +137,11 @@ def open_dir(filepath) -> None:
 
 
     _filepath = pathlib.Path(filepath)
+    _stat = preflight.stat_file(filepath)
     OS_NAME = platform.system()
 
-    if _filepath.exists():
-        if _filepath.is_file():
+    if _stat.exists:
+        if _stat.is_file:
             _filepath = _filepath.parent
 
         if OS_NAME == 'Windows':
@@ -102,7 +159,7 @@ def open_in_explorer(filepath: str):
     """
     Explorerでフォルダを開く
     """
-    if os.path.exists(filepath):
+    if preflight.exists(filepath):
         if platform.system() == 'Windows':
             filepath = str(filepath)
             filepath = filepath.replace('/', '\\')
@@ -128,6 +185,87 @@ class AppMain:
     # --------------------------------- #
     # Get / Set
     # --------------------------------- #
+    def apply_shot_settings(self, settings: dict) -> dict:
+        """ Plugin Builtin Function
+        * ショット設定をまとめて適用
+
+        * 現在値を1回だけ取得し、違う値だけを1つの Undo で設定する
+        * Nuke で設定できる項目 (fps, framerange) 以外は無視
+
+        Args:
+            settings(dict): {'fps', 'framerange', ...}
+
+        Returns:
+            dict: 変更した項目 {key: (変更前, 変更後)}
+        """
+        _setters = {
+            'fps': self.set_fps,
+            'framerange': lambda values: self.set_framerange(*values),
+        }
+
+        _changes = scene.diff_settings(
+                self.get_shot_settings(), settings, keys=_setters, compare=SHOT_SETTINGS_COMPARE)
+
+        if not _changes:
+            return _changes
+
+        nuke.Undo.begin('MDK | Apply Shot Settings')
+
+        try:
+            scene.apply_settings(_changes, _setters)
+
+        finally:
+            nuke.Undo.end()
+
+        self.invalidate_scene_state()
+
+        for _key, (_before, _after) in _changes.items():
+            print(f'MDK | {_key} = {_before} -> {_after}')
+
+        return _changes
+
+
+    def classify_files(self, filepath_list: list[str]) -> dict[str, list[str]]:
+        """ ファイルをインポート方法ごとに分類
+
+        Returns:
+            dict[str, list[str]]: {'image', 'media', 'abc', 'usd', 'fbx', 'obj', 'nuke', 'unsupported', 'missing'}
+        """
+        return filetypes.classify_files(filepath_list, IMPORT_KINDS)
+
+
+    def collect_file_dependencies(
+                self,
+                node_types: list[str] = None,
+                stale_time: float = None) -> dependencies.DependencyReport:
+        """ Plugin Builtin Function
+        * スクリプト全体の参照ファイルをまとめて確認
+
+        * グループ内も含めて allNodes で1回だけ走査する (選択に関係なくスクリプト全体)
+        * '%04d', '####' のファイルパスは連番のパターンとして確認
+        * 同じファイルは1回だけ、すべてのファイルをスレッドプールで stat する
+
+        Args:
+            node_types(list[str], optional): 確認するノードクラス. None の場合は FILE_NODES_LIST
+            stale_time(float, optional): この時刻より後に更新されたファイルを stale にする. None の場合はスクリプトの保存日時
+
+        Returns:
+            dependencies.DependencyReport: missing, empty, stale とノードクラスごとの参照ファイル
+        """
+        _classes = set(FILE_NODES_LIST if node_types is None else node_types)
+
+        if stale_time is None:
+            stale_time = dependencies.get_scene_time(self.get_filepath())
+
+        _entries = [
+            (_node.Class(), _node.fullName(), nuke.filename(_node))
+            for _node in nuke.allNodes(recurseGroups=True)
+            if _node.Class() in _classes
+        ]
+
+        return dependencies.collect_dependencies(_entries, stale_time=stale_time, kinds=SEQUENCE_KINDS)
+
+
     def get_ext(self, key: str = None) -> str:
         """ 拡張子を返す 
         
@@ -144,6 +282,50 @@ class AppMain:
         return nuke.root().name()
     
 
+    def get_scene_state(self) -> scene.SceneState:
+        """ シーン状態 (ファイルパス, FPS, フレーム範囲, フォーマットのサイズ, 選択) をまとめて返す
+
+        * キャッシュを返し、スクリプトの読み込み・保存・Root の変更・選択のコールバックで破棄する
+        * レンダラーは None
+
+        Returns:
+            scene.SceneState: 不変のスナップショット
+        """
+        install_scene_callbacks()
+        return _scene_state_cache.get(self.query_scene_state)
+
+
+    def invalidate_scene_state(self):
+        """ get_scene_state() のキャッシュを破棄 """
+        _scene_state_cache.invalidate()
+
+
+    def query_scene_state(self) -> scene.SceneState:
+        """ シーン状態を問い合わせ (キャッシュしない) """
+        _root = nuke.root()
+        _format = _root.format()
+        _first = int(_root['first_frame'].value())
+        _last = int(_root['last_frame'].value())
+
+        return scene.SceneState(
+            filepath=_root.name(),
+            fps=_root['fps'].value(),
+            framerange=(_first, _first, _last, _last),
+            render_size=(_format.width(), _format.height()),
+            selection=tuple(_node.fullName() for _node in nuke.selectedNodes()),
+        )
+
+
+    def get_shot_settings(self) -> dict:
+        """ ショット設定の現在値 (apply_shot_settings 用) """
+        _state = self.query_scene_state()
+
+        return {
+            'fps': _state.fps,
+            'framerange': _state.framerange,
+        }
+
+
     def get_main_window(self):
         """ Get the Nuke main window.
 
@@ -188,9 +370,57 @@ class AppMain:
             raise TypeError('"Filepath" type is not str')
 
 
-    def import_files(self, filepath_list: list[str]):
-        for _filepath in filepath_list:
-            self.import_file(_filepath)
+    def import_files(self, filepath_list: list[str]) -> list:
+        """ 複数ファイルの読み込み
+
+        * classify_files で分類してから、ファイルタイプごとにまとめて読み込み
+        * 存在しないファイルがあれば読み込み前にエラー
+        * 未対応のファイルは従来通り drop に渡す
+        * 連番のイメージは1つのReadノードにまとめる
+        """
+        _groups = self.classify_files(sequence.collapse(filepath_list, kinds=SEQUENCE_KINDS))
+
+        if _groups['missing']:
+            raise FileNotFoundError(f'MDK | File is not found: {[str(_item) for _item in _groups["missing"]]}')
+
+        _result = []
+
+        for _kind in IMPORT_KINDS + ('unsupported',):
+            for _item in _groups[_kind]:
+                if isinstance(_item, sequence.FileSequence):
+                    _result.append(self.import_sequence(_item))
+                else:
+                    _result.extend(self.import_file(_item))
+
+        return _result
+
+
+    def import_sequence(self, file_sequence: sequence.FileSequence):
+        """ 連番をReadノードとして読み込み
+
+        Args:
+            file_sequence(sequence.FileSequence): 連番
+
+        Returns:
+            nuke.Node: Readノード
+        """
+        _filepath = file_sequence.pattern(sequence.STYLE_HASH).replace('\\', '/')
+
+        _node = nuke.nodes.Read(
+            file=_filepath,
+            first=file_sequence.first,
+            last=file_sequence.last,
+            origfirst=file_sequence.first,
+            origlast=file_sequence.last,
+        )
+        _node.autoplace()
+
+        return _node
+
+
+    def is_script(self, filepath: str) -> bool:
+        """ Pythonスクリプト判定 """
+        return filetypes.is_type(filepath, 'script')
 
 
     def open_dir(self):
@@ -203,7 +433,7 @@ class AppMain:
             filepath = nuke.root().name()
             print(f'file = {filepath}')
 
-            if os.path.exists(filepath):
+            if preflight.exists(filepath):
                 open_in_explorer(filepath)
 
         else:
@@ -8,13 +8,23 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.2 2026-10-18 Tatsuya Yamagishi
+        * added: is_script()
+        * added: classify_files()
+        * updated: import_files() で連番をまとめる
+        * updated: ファイルの存在確認を preflight に変更
+        * updated: create_playblast(mp4=True) で連番を動画にエンコード
+        * added: get_scene_state()
+        * added: apply_shot_settings() で違う値だけをまとめて設定, get_shot_settings()
+
     * v0.0.1 2025-01-31 Tatsuya Yamagishi
         * New
 """
 
-VERSION = 'v0.0.1'
+VERSION = 'v0.0.2'
 NAME = 'mdk_standalone'
 
+import builtins
 import os
 import pathlib
 import platform
@@ -22,6 +32,11 @@ import re
 import subprocess
 import sys
 
+from .. import encode
+from .. import filetypes
+from .. import preflight
+from .. import scene
+from .. import sequence
 
 if os.environ.get('MDK_DEBUG'):
     print('MDK | ---------------------------')
@@ -48,6 +63,12 @@ EXT_DICT = {
 }
 
 FILE_FILTER_SCRIPT = re.compile(r'.+\.(py)')
+
+# import_files の分類 (優先順)
+IMPORT_KINDS = filetypes.IMPORT_KINDS
+
+# import_files で連番にまとめるファイルタイプ
+SEQUENCE_KINDS = ('image',)
 # ======================================= #
 # Functions
 # ======================================= #
@@ -61,6 +82,15 @@ class AppMain:
     # --------------------------------- #
     # Get / Set
     # --------------------------------- #
+    def classify_files(self, filepath_list: list[str]) -> dict[str, list[str]]:
+        """ ファイルをインポート方法ごとに分類
+
+        Returns:
+            dict[str, list[str]]: {'usd', 'image', 'abc', 'vdb', 'hip', 'maya', 'unsupported', 'missing'}
+        """
+        return filetypes.classify_files(filepath_list, IMPORT_KINDS)
+
+
     def get_ext(self, key: str = None) -> str:
         """ 拡張子を返す 
         
@@ -107,9 +137,67 @@ class AppMain:
         """ レンダーサイズを取得 """
         return (1920, 1080)
 
+    def get_scene_state(self) -> scene.SceneState:
+        """ シーン状態 (ファイルパス, FPS, フレーム範囲, レンダーサイズ, 選択) をまとめて返す
+
+        * スタンドアロンは変更がないため、キャッシュせずにそのまま返す
+        """
+        return self.query_scene_state()
+
+    def invalidate_scene_state(self):
+        """ get_scene_state() のキャッシュを破棄 (キャッシュなし) """
+
+    def query_scene_state(self) -> scene.SceneState:
+        """ シーン状態を問い合わせ """
+        return scene.SceneState(
+            filepath=self.get_filepath(),
+            fps=self.get_fps(),
+            framerange=tuple(self.get_framerange()),
+            render_size=tuple(self.get_render_size()),
+            selection=tuple(self.get_selected_nodes()),
+        )
+
     def get_selected_nodes(self) -> list[str]:
         """ 選択しているノードを取得 """
         return ['root', 'root/geo']
+
+    def get_shot_settings(self) -> dict:
+        """ ショット設定の現在値 (apply_shot_settings 用, 取得できない項目は None) """
+        return {
+            'fps': self.get_fps(),
+            'framerange': tuple(self.get_framerange()),
+            'render_size': tuple(self.get_render_size()),
+        }
+
+    def apply_shot_settings(self, settings: dict) -> dict:
+        """ ショット設定をまとめて適用 (リファレンス実装)
+
+        * 現在値を1回だけ取得し、違う値だけを設定する
+        * 値が None の項目は設定しない
+
+        Args:
+            settings(dict): {'unit', 'fps', 'framerange', 'render', 'render_framerange', 'render_size', 'aperture_size'}
+
+        Returns:
+            dict: 変更した項目 {key: (変更前, 変更後)}
+
+        Examples:
+            >>> _mdk.apply_shot_settings({'fps': 24, 'framerange': (1001, 1009, 1100, 1108), 'render': 'arnold'})
+            MDK | framerange = (1001, 1009, 1100, 1108)
+            MDK | render = arnold
+            {'framerange': ((1001, 1001, 1200, 1200), (1001, 1009, 1100, 1108)), 'render': (None, 'arnold')}
+        """
+        _changes = scene.diff_settings(self.get_shot_settings(), settings)
+
+        return scene.apply_settings(_changes, {
+            'aperture_size': self.set_aperture_size,
+            'fps': self.set_fps,
+            'framerange': self.set_framerange,
+            'render': self.set_render,
+            'render_framerange': lambda values: self.set_render_framerange(*values),
+            'render_size': self.set_render_size,
+            'unit': self.set_unit,
+        })
     
     def set_aperture_size(self, values: tuple[int]):
         print(f'MDK | aperture_size = {values}')
@@ -152,6 +240,21 @@ class AppMain:
         print(f'Mp4: {mp4}')
         print(f'Filepath: {filepath}')
 
+        # Standalone では描画しないため、書き出し済みの連番をエンコード
+        if mp4:
+            _pattern = filepath
+
+            if not sequence.is_pattern(filepath):
+                _pattern = f'{filepath}.####.{ext.lstrip(".")}'
+
+            _first, _last = range or self.get_framerange()[1:3]
+
+            return encode.encode_sequence(
+                encode.get_frame_paths(_pattern, builtins.range(_first, _last + 1)),
+                encode.get_movie_path(_pattern),
+                fps=self.get_fps(),
+            )
+
 
     def select_nodes(self, nodes: list[str]):
         """ ノードを選択 """
@@ -171,17 +274,25 @@ class AppMain:
 
 
     def import_files(self, filepath_list: list[str]):
-        for _filepath in filepath_list:
-            self.import_file(_filepath)
+        _groups = self.classify_files(sequence.collapse(filepath_list, kinds=SEQUENCE_KINDS))
+
+        for _kind, _filepath_list in _groups.items():
+            for _filepath in _filepath_list:
+                print(f'MDK | Standard | {_kind} = {_filepath}')
 
     def import_usd(self, filepath: str):
         print(f'MDK | USD | import = {filepath}')
 
 
+    def is_script(self, filepath: str) -> bool:
+        """ Pythonスクリプト判定 """
+        return filetypes.is_type(filepath, 'script')
+
+
     def open_file(self, filepath: str):
         print(f'MDK | open = {filepath}')
 
-        if os.path.isfile(filepath):
+        if preflight.stat_file(filepath).is_file:
             if platform.system() == 'Windows':
                 cmd = 'explorer {}'.format(filepath.replace('/', '\\'))
                 subprocess.Popen(cmd)
@@ -202,6 +313,8 @@ class AppMain:
 
 
     def reference_files(self, filepath_list: list[str], namespace=None):
+        preflight.require_files(filepath_list)
+
         for _filepath in filepath_list:
             self.reference_file(_filepath, namespace=namespace)
 
@@ -0,0 +1,493 @@
+""" mdkapps.playblast
+
+* プレイブラストの共通モジュール
+
+* フレームごとの進捗
+    * iter_frames() は1フレーム描画するごとに FrameResult (パス, 時間, サイズ) を返すジェネレータ
+    * run_frames() はコールバックで進捗を通知 (False を返すとキャンセル)
+    * ジェネレータの close() か cancel_event でキャンセルできる
+
+* キャプチャパイプライン
+    * capture_frames() はメインスレッドでキャプチャし、エンコードと書き出しをスレッドプールで行う
+    * 書き出し待ちのフレーム数に上限を設けてメモリ使用量を抑える
+
+* 複数ショットのプレイブラスト
+    * run_shots() はショットごとに描画して、出力と時間のマニフェストを返す
+    * ショットは dict {'name', 'camera', 'framerange', 'size', 'ext'}
+
+* インクリメンタルプレイブラスト
+    * 連番ごとにマニフェスト ('{prefix}.playblast.json') を保存する
+    * フレームごとに出力サイズとシーン状態のフィンガープリントを記録し、
+      存在しない・サイズが違う・フィンガープリントが違うフレームだけを再描画する
+
+Examples:
+    >>> from mdkapps import playblast
+    >>> _fingerprint = playblast.make_fingerprint(scene='shot.ma', mtime=1700000000.0, camera='shotCam')
+    >>> playblast.get_stale_ranges('/pb/shot', 'jpg', (1001, 3000), _fingerprint)
+    [(1201, 1250)]
+    >>> # ... (1201, 1250) を描画 ...
+    >>> playblast.update_manifest('/pb/shot', 'jpg', range(1201, 1251), _fingerprint)
+
+    >>> for _result in app.iter_playblast('/pb', 'shot', (1920, 1080), (1001, 1100)):
+    ...     print(_result.frame, _result.seconds, _result.size)
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * added: iter_frames(), run_frames(), summarize_frames()
+        * added: capture_frames()
+        * added: run_shots(), normalize_shots(), write_shot_manifest()
+        * New
+"""
+
+import collections
+import concurrent.futures
+import hashlib
+import json
+import os
+import threading
+import time
+import typing
+
+from . import preflight
+from . import sequence
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+MANIFEST_SUFFIX = '.playblast.json'
+MANIFEST_VERSION = 1
+PADDING = 4
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class FrameResult(typing.NamedTuple):
+    """ 1フレームの描画結果 """
+    frame: int
+    path: str
+    seconds: float
+    size: int
+
+
+class ShotResult(typing.NamedTuple):
+    """ 1ショットの描画結果 """
+    name: str
+    camera: str
+    framerange: tuple[int, int]
+    size: tuple[int, int]
+    output: str
+    frames: int
+    seconds: float
+    error: str = ''
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+class PlayblastManifest:
+    """ 連番プレイブラストのマニフェスト
+
+    * frames = {frame: {'size': int, 'fingerprint': str}}
+
+    Args:
+        prefix(str): 出力パス ('{dirpath}/{name}')
+        ext(str): 拡張子 ('jpg', 'png')
+    """
+    def __init__(self, prefix: str, ext: str, frames: dict = None):
+        self.prefix = str(prefix)
+        self.ext = ext
+        self.frames = frames or {}
+
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.prefix!r}, {self.ext!r}, frames={len(self.frames)})'
+
+
+    @property
+    def filepath(self) -> str:
+        return get_manifest_path(self.prefix)
+
+
+    @classmethod
+    def load(cls, prefix: str, ext: str) -> 'PlayblastManifest':
+        """ マニフェストを読み込み
+
+        * ファイルがない・壊れている・拡張子が違う場合は空のマニフェスト
+        """
+        _manifest = cls(prefix, ext)
+
+        try:
+            with open(_manifest.filepath, encoding='utf-8') as _file:
+                _data = json.load(_file)
+
+        except (OSError, ValueError):
+            return _manifest
+
+        if _data.get('version') != MANIFEST_VERSION or _data.get('ext') != ext:
+            return _manifest
+
+        _manifest.frames = {int(_frame): _value for _frame, _value in _data.get('frames', {}).items()}
+        return _manifest
+
+
+    def save(self):
+        """ マニフェストを保存 (一時ファイルに書いてから置き換え) """
+        _data = {
+            'version': MANIFEST_VERSION,
+            'ext': self.ext,
+            'frames': {str(_frame): self.frames[_frame] for _frame in sorted(self.frames)},
+        }
+
+        _filepath = self.filepath
+        _tmp_filepath = f'{_filepath}.tmp'
+
+        with open(_tmp_filepath, 'w', encoding='utf-8') as _file:
+            json.dump(_data, _file, indent=1)
+
+        os.replace(_tmp_filepath, _filepath)
+
+
+    def get_frame_path(self, frame: int) -> str:
+        return get_frame_path(self.prefix, frame, self.ext)
+
+
+    def get_stale_frames(self, frames: typing.Iterable[int], fingerprint: str) -> list[int]:
+        """ 再描画が必要なフレームを返す
+
+        * マニフェストにない、フィンガープリントが違う、ファイルがない、サイズが違うフレーム
+        """
+        _frames = sorted(set(frames))
+        _stats = preflight.stat_files([self.get_frame_path(_frame) for _frame in _frames], ttl=0)
+        _result = []
+
+        for _frame, _stat in zip(_frames, _stats.values()):
+            _entry = self.frames.get(_frame)
+
+            if (
+                    _entry is None
+                    or _entry.get('fingerprint') != fingerprint
+                    or not _stat.exists
+                    or not _stat.size
+                    or _stat.size != _entry.get('size')):
+                _result.append(_frame)
+
+        return _result
+
+
+    def update(self, frames: typing.Iterable[int], fingerprint: str) -> list[int]:
+        """ 描画したフレームを記録
+
+        * ファイルが存在するフレームのみ記録し、存在しないフレームは削除
+
+        Returns:
+            list[int]: 記録したフレーム
+        """
+        _frames = sorted(set(frames))
+        _stats = preflight.stat_files([self.get_frame_path(_frame) for _frame in _frames], ttl=0)
+        _result = []
+
+        for _frame, _stat in zip(_frames, _stats.values()):
+            if _stat.exists and _stat.size:
+                self.frames[_frame] = {'size': _stat.size, 'fingerprint': fingerprint}
+                _result.append(_frame)
+            else:
+                self.frames.pop(_frame, None)
+
+        return _result
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def capture_frames(
+            frames: typing.Iterable[int],
+            capture: typing.Callable[[int], typing.Any],
+            write: typing.Callable[[int, typing.Any], str],
+            max_workers: int = None,
+            max_pending: int = None,
+            callback = None,
+            cancel_event: threading.Event = None) -> list[FrameResult]:
+    """ キャプチャとエンコード・書き出しを分けて実行
+
+    * capture(frame) は呼び出し元のスレッド (App のメインスレッド) で実行
+    * write(frame, buffer) はスレッドプールで実行し、書き出したパスを返す
+    * 書き出し待ちが max_pending を超えたら古いフレームの完了を待つ
+
+    Args:
+        frames(Iterable[int]): フレーム
+        capture(Callable): capture(frame) -> ピクセルバッファ
+        write(Callable): write(frame, buffer) -> パス
+        max_workers(int, optional): 書き出しスレッド数. None の場合は CPU数 (最大8)
+        max_pending(int, optional): 書き出し待ちの上限. None の場合は max_workers * 2
+        callback(Callable, optional): callback(FrameResult). False を返すとキャンセル
+        cancel_event(threading.Event, optional): セットすると次のフレームの前で終了
+
+    Returns:
+        list[FrameResult]: 書き出したフレーム (seconds はキャプチャから書き出し完了まで)
+    """
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    if max_pending is None:
+        max_pending = max_workers * 2
+
+    _results = []
+    _pending = collections.deque()
+    _cancelled = False
+
+    def _write(frame: int, buffer, start: float) -> FrameResult:
+        _path = write(frame, buffer)
+        return FrameResult(frame, _path, time.perf_counter() - start, preflight.stat_file(_path, ttl=0).size)
+
+    def _collect():
+        nonlocal _cancelled
+        _result = _pending.popleft().result()
+        _results.append(_result)
+
+        if callback and callback(_result) is False:
+            _cancelled = True
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix='mdk_capture') as _executor:
+        try:
+            for _frame in frames:
+                if _cancelled or (cancel_event is not None and cancel_event.is_set()):
+                    break
+
+                _start = time.perf_counter()
+                _buffer = capture(_frame)
+                _pending.append(_executor.submit(_write, _frame, _buffer, _start))
+
+                while len(_pending) >= max_pending or (_pending and _pending[0].done()):
+                    _collect()
+
+            while _pending:
+                _collect()
+
+        finally:
+            for _future in _pending:
+                _future.cancel()
+
+    return _results
+
+
+def get_frame_path(prefix: str, frame: int, ext: str, padding: int = PADDING) -> str:
+    """ プレイブラストのフレームのパス ('{prefix}.1001.jpg') """
+    return f'{prefix}.{frame:0{padding}d}.{ext}'
+
+
+def get_manifest_path(prefix: str) -> str:
+    """ マニフェストのパス ('{prefix}.playblast.json') """
+    return f'{prefix}{MANIFEST_SUFFIX}'
+
+
+def iter_frames(
+            render_frame: typing.Callable[[int], typing.Any],
+            frames: typing.Iterable[int],
+            get_path: typing.Callable[[int], str],
+            cancel_event: threading.Event = None) -> typing.Iterator[FrameResult]:
+    """ 1フレームずつ描画して結果を返すジェネレータ
+
+    Args:
+        render_frame(Callable): render_frame(frame) で1フレーム描画
+        frames(Iterable[int]): フレーム
+        get_path(Callable): get_path(frame) で出力パスを返す
+        cancel_event(threading.Event, optional): セットすると次のフレームの前で終了
+
+    Yields:
+        FrameResult: (frame, path, seconds, size)
+    """
+    for _frame in frames:
+        if cancel_event is not None and cancel_event.is_set():
+            return
+
+        _start = time.perf_counter()
+        render_frame(_frame)
+        _seconds = time.perf_counter() - _start
+
+        _path = get_path(_frame)
+        yield FrameResult(_frame, _path, _seconds, preflight.stat_file(_path, ttl=0).size)
+
+
+def run_frames(frame_iterator: typing.Iterator[FrameResult], callback=None) -> list[FrameResult]:
+    """ iter_frames() を実行してコールバックで進捗を通知
+
+    Args:
+        frame_iterator(Iterator[FrameResult]): iter_frames() / AppMain.iter_playblast()
+        callback(Callable, optional): callback(FrameResult). False を返すとキャンセル
+
+    Returns:
+        list[FrameResult]: 描画したフレーム
+    """
+    _results = []
+
+    for _result in frame_iterator:
+        _results.append(_result)
+
+        if callback and callback(_result) is False:
+            frame_iterator.close()
+            break
+
+    return _results
+
+
+def normalize_shots(shots: list[dict], size: tuple[int, int] = None, ext: str = 'jpg') -> list[dict]:
+    """ ショットのリストを正規化
+
+    * 'name', 'framerange' は必須. 'size', 'ext' は省略時に引数の値を使用
+
+    Raises:
+        ValueError: 必須のキーがない, 名前が重複している場合
+    """
+    _result = []
+    _names = set()
+
+    for _shot in shots:
+        if 'name' not in _shot or 'framerange' not in _shot:
+            raise ValueError(f'MDK | Shot requires "name" and "framerange": {_shot}')
+
+        if _shot['name'] in _names:
+            raise ValueError(f'MDK | Duplicate shot name: {_shot["name"]}')
+
+        _names.add(_shot['name'])
+        _framerange = _shot['framerange']
+        _size = _shot.get('size') or size
+
+        _result.append(dict(
+            _shot,
+            camera=_shot.get('camera'),
+            framerange=(int(_framerange[0]), int(_framerange[-1])),
+            size=tuple(_size) if _size else None,
+            ext=_shot.get('ext') or ext,
+        ))
+
+    return _result
+
+
+def run_shots(shots: list[dict], render_shot, callback=None) -> list[ShotResult]:
+    """ ショットごとに描画して結果を返す
+
+    * 1ショットが失敗しても残りのショットは描画する
+
+    Args:
+        shots(list[dict]): normalize_shots() のショット
+        render_shot(Callable): render_shot(shot) -> 出力パス (パターン)
+        callback(Callable, optional): callback(done, total, ShotResult)
+
+    Returns:
+        list[ShotResult]: ショット順の結果
+    """
+    _results = []
+
+    for _index, _shot in enumerate(shots):
+        _start = time.perf_counter()
+        _output = ''
+        _error = ''
+
+        try:
+            _output = render_shot(_shot)
+
+        except Exception as ex:
+            _error = f'{type(ex).__name__}: {ex}'
+
+        _framerange = _shot['framerange']
+        _result = ShotResult(
+            _shot['name'],
+            _shot.get('camera'),
+            _framerange,
+            _shot.get('size'),
+            _output,
+            _framerange[1] - _framerange[0] + 1,
+            time.perf_counter() - _start,
+            _error,
+        )
+        _results.append(_result)
+
+        if callback:
+            callback(_index + 1, len(shots), _result)
+
+    return _results
+
+
+def write_shot_manifest(filepath: str, results: list[ShotResult]) -> str:
+    """ ショットの結果を JSON で書き出し """
+    _data = [dict(_result._asdict(), ok=_result.ok) for _result in results]
+
+    with open(filepath, 'w', encoding='utf-8') as _file:
+        json.dump(_data, _file, indent=2)
+
+    return filepath
+
+
+def summarize_frames(results: list[FrameResult], slowest: int = 5) -> dict:
+    """ フレームごとの描画時間を集計
+
+    Returns:
+        dict: {'frames', 'seconds', 'mean', 'bytes', 'slowest': [FrameResult, ...]}
+    """
+    _seconds = sum(_result.seconds for _result in results)
+
+    return {
+        'frames': len(results),
+        'seconds': _seconds,
+        'mean': _seconds / len(results) if results else 0.0,
+        'bytes': sum(_result.size for _result in results),
+        'slowest': sorted(results, key=lambda _result: _result.seconds, reverse=True)[:slowest],
+    }
+
+
+def get_stale_ranges(
+            prefix: str,
+            ext: str,
+            framerange: tuple[int, int],
+            fingerprint: str) -> list[tuple[int, int]]:
+    """ 再描画が必要なフレーム範囲を返す
+
+    Args:
+        prefix(str): 出力パス ('{dirpath}/{name}')
+        ext(str): 拡張子
+        framerange(tuple[int, int]): フレーム範囲
+        fingerprint(str): make_fingerprint() の値
+
+    Returns:
+        list[tuple[int, int]]: [(start, end), ...]
+    """
+    _manifest = PlayblastManifest.load(prefix, ext)
+    _frames = _manifest.get_stale_frames(range(framerange[0], framerange[-1] + 1), fingerprint)
+
+    return sequence.frames_to_ranges(_frames)
+
+
+def make_fingerprint(**values) -> str:
+    """ シーン状態のフィンガープリント
+
+    Examples:
+        >>> make_fingerprint(scene='shot.ma', mtime=1700000000.0, camera='shotCam', size=(1920, 1080))
+        'c3b5...'
+    """
+    _data = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha1(_data.encode('utf-8')).hexdigest()
+
+
+def update_manifest(
+            prefix: str,
+            ext: str,
+            frames: typing.Iterable[int],
+            fingerprint: str) -> list[int]:
+    """ 描画したフレームをマニフェストに記録
+
+    Returns:
+        list[int]: 記録したフレーム
+    """
+    _manifest = PlayblastManifest.load(prefix, ext)
+    _result = _manifest.update(frames, fingerprint)
+    _manifest.save()
+
+    return _result
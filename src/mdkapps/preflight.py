@@ -0,0 +1,212 @@
+""" mdkapps.preflight
+
+* ファイルの事前確認モジュール
+
+* 複数パスの stat をスレッドプールでまとめて実行する (NFS などの遅いストレージ向け)
+* 存在・サイズ・更新日時を返す
+* 結果は短時間 (DEFAULT_TTL 秒) キャッシュする (存在しないパスはキャッシュしない)
+* キャッシュは追加時に期限切れを削除し、MAX_CACHE_SIZE 件までにする
+
+Examples:
+    >>> from mdkapps import preflight
+    >>> _stats = preflight.stat_files(['/cache/a.abc', '/cache/b.abc'])
+    >>> _stats['/cache/a.abc'].exists
+    True
+    >>> preflight.require_files(['/cache/a.abc', '/cache/c.abc'])
+    FileNotFoundError: MDK | File is not found: ['/cache/c.abc']
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+        * fixed: stat_files() で存在しないパスをキャッシュしない (直後に書き出したファイルを missing にしない)
+        * fixed: キャッシュの追加時に期限切れを削除, MAX_CACHE_SIZE で上限 (長時間のセッションで増え続けない)
+"""
+
+import concurrent.futures
+import os
+import stat
+import threading
+import time
+from typing import NamedTuple
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+DEFAULT_TTL = 5.0
+MAX_WORKERS = 16
+
+# この数より少ない場合はスレッドを使わない
+MIN_PARALLEL = 4
+
+# キャッシュの上限 (古い順に削除)
+MAX_CACHE_SIZE = 100000
+
+# {filepath: (time.monotonic(), FileStat)} (古い順)
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class FileStat(NamedTuple):
+    """ stat 結果 """
+    path: str
+    exists: bool
+    is_file: bool = False
+    is_dir: bool = False
+    size: int = 0
+    mtime: float = 0.0
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def clear_cache(filepath_list: list[str] = None):
+    """ キャッシュを削除
+
+    Args:
+        filepath_list(list[str], optional): 削除するパス. None の場合はすべて
+    """
+    with _CACHE_LOCK:
+        if filepath_list is None:
+            _CACHE.clear()
+        else:
+            for _filepath in filepath_list:
+                _CACHE.pop(str(_filepath), None)
+
+
+def exists(filepath: str, ttl: float = DEFAULT_TTL) -> bool:
+    """ 存在確認 (キャッシュ付き) """
+    return stat_file(filepath, ttl=ttl).exists
+
+
+def find_existing_files(filepath_list: list[str], ttl: float = DEFAULT_TTL) -> set[str]:
+    """ 存在するファイルパスを返す """
+    return {
+        _filepath for _filepath, _stat in stat_files(filepath_list, ttl=ttl).items()
+        if _stat.exists
+    }
+
+
+def find_missing_files(filepath_list: list[str], ttl: float = DEFAULT_TTL) -> list[str]:
+    """ 存在しないファイルパスを返す (入力順) """
+    _stats = stat_files(filepath_list, ttl=ttl)
+
+    return [_filepath for _filepath, _stat in _stats.items() if not _stat.exists]
+
+
+def require_files(filepath_list: list[str], ttl: float = DEFAULT_TTL) -> dict[str, FileStat]:
+    """ すべてのファイルが存在するか確認
+
+    Raises:
+        FileNotFoundError: 存在しないファイルがある場合
+
+    Returns:
+        dict[str, FileStat]: {filepath: FileStat}
+    """
+    _stats = stat_files(filepath_list, ttl=ttl)
+    _missing = [_filepath for _filepath, _stat in _stats.items() if not _stat.exists]
+
+    if _missing:
+        raise FileNotFoundError(f'MDK | File is not found: {_missing}')
+
+    return _stats
+
+
+def stat_file(filepath: str, ttl: float = DEFAULT_TTL) -> FileStat:
+    """ 1ファイルの stat (キャッシュ付き) """
+    return stat_files([filepath], ttl=ttl)[str(filepath)]
+
+
+def stat_files(
+            filepath_list: list[str],
+            ttl: float = DEFAULT_TTL,
+            max_workers: int = MAX_WORKERS) -> dict[str, FileStat]:
+    """ 複数パスをまとめて stat
+
+    * キャッシュにないパスのみスレッドプールで stat する
+    * 重複したパスは1回だけ stat する
+    * 存在しないパスはキャッシュしない (毎回 stat する)
+    * キャッシュの追加時に期限切れ (ttl) と MAX_CACHE_SIZE を超えた古いパスを削除する
+
+    Args:
+        filepath_list(list[str]): ファイルパスリスト
+        ttl(float): キャッシュの有効時間 (秒). 0 の場合はキャッシュを使わない
+        max_workers(int): スレッド数
+
+    Returns:
+        dict[str, FileStat]: {filepath: FileStat} (入力順)
+    """
+    _paths = list(dict.fromkeys(str(_filepath) for _filepath in filepath_list))
+    _now = time.monotonic()
+    _result = {}
+    _pending = []
+
+    with _CACHE_LOCK:
+        for _filepath in _paths:
+            _cached = _CACHE.get(_filepath) if ttl > 0 else None
+
+            if _cached and _now - _cached[0] < ttl:
+                _result[_filepath] = _cached[1]
+            else:
+                _pending.append(_filepath)
+
+    if len(_pending) < MIN_PARALLEL or max_workers <= 1:
+        _stats = [_stat_path(_filepath) for _filepath in _pending]
+
+    else:
+        _workers = min(max_workers, len(_pending))
+
+        with concurrent.futures.ThreadPoolExecutor(_workers, thread_name_prefix='mdk_preflight') as _executor:
+            _stats = list(_executor.map(_stat_path, _pending))
+
+    with _CACHE_LOCK:
+        for _stat in _stats:
+            _result[_stat.path] = _stat
+
+            # 挿入順を古い順にするため、入れ直す
+            _CACHE.pop(_stat.path, None)
+
+            if _stat.exists:
+                _CACHE[_stat.path] = (_now, _stat)
+
+        if _stats:
+            _purge_cache(_now, ttl)
+
+    return {_filepath: _result[_filepath] for _filepath in _paths}
+
+
+def _purge_cache(now: float, ttl: float):
+    """ 期限切れと MAX_CACHE_SIZE を超えたキャッシュを古い順に削除 (_CACHE_LOCK 内で呼ぶ) """
+    while _CACHE:
+        _filepath = next(iter(_CACHE))
+        _time = _CACHE[_filepath][0]
+
+        if len(_CACHE) > MAX_CACHE_SIZE or (ttl > 0 and now - _time >= ttl):
+            del _CACHE[_filepath]
+        else:
+            break
+
+
+def _stat_path(filepath: str) -> FileStat:
+    try:
+        _stat = os.stat(filepath)
+
+    except (OSError, ValueError):
+        return FileStat(filepath, False)
+
+    return FileStat(
+        filepath,
+        True,
+        is_file=stat.S_ISREG(_stat.st_mode),
+        is_dir=stat.S_ISDIR(_stat.st_mode),
+        size=_stat.st_size,
+        mtime=_stat.st_mtime,
+    )
@@ -0,0 +1,321 @@
+""" mdkapps.registry
+
+* Appバックエンドの登録モジュール
+
+* 各バックエンドは判定用プローブと AppMain の遅延ファクトリを登録する
+* 外部バックエンドは importlib.metadata のエントリポイント
+  (group='mdkapps.backends') から登録できる
+
+Examples:
+    >>> # pyproject.toml
+    >>> # [project.entry-points."mdkapps.backends"]
+    >>> # katana = "mdk_katana:BACKEND"
+    >>> from mdkapps import registry
+    >>> registry.register_backend('katana', probe=('Katana',), module='mdk_katana')
+    >>> app = registry.get_app()
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * updated : importlib.metadata を load_entry_points() で遅延読み込み
+        * fixed : 自動判定したバックエンドが import できない場合は次の候補, standalone を使う (detect_backend)
+        * fixed : 組み込みのバックエンドが見つからない場合はエントリポイントも判定 (detect_backend)
+        * New
+"""
+
+import importlib
+import os
+import sys
+import threading
+import typing
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+ENTRY_POINT_GROUP = 'mdkapps.backends'
+
+_BACKENDS = {}
+_APPS = {}
+_LOCK = threading.RLock()
+_ENTRY_POINTS_LOADED = False
+
+# 自動判定したバックエンド (detect_backend)
+_DETECTED_BACKEND = None
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class Backend:
+    """ Appバックエンド定義
+
+    Args:
+        name(str): バックエンド名
+        probe(tuple[str] | Callable | None): 判定用モジュール名 or 判定関数
+            * None の場合は自動判定しない (名前指定のみ)
+        module(str): バックエンドモジュール名
+        factory(Callable, optional): AppMain を返す関数
+        priority(int): 判定順 (小さい順)
+    """
+    def __init__(
+            self,
+            name: str,
+            probe: tuple[str]|typing.Callable|None,
+            module: str,
+            factory: typing.Callable = None,
+            priority: int = 100):
+
+        if isinstance(probe, str):
+            probe = (probe,)
+
+        self.name = name
+        self.probe = probe
+        self.module = module
+        self.factory = factory
+        self.priority = priority
+
+
+    def __repr__(self):
+        return f'Backend({self.name!r}, module={self.module!r})'
+
+
+    def create_app(self):
+        """ AppMainを生成 """
+        if self.factory is not None:
+            return self.factory()
+
+        return self.load_module().AppMain()
+
+
+    def load_module(self):
+        """ バックエンドモジュールを読み込み """
+        _loaded = self.module in sys.modules
+        _module = importlib.import_module(self.module)
+
+        if not _loaded and os.environ.get('MDK_DEBUG'):
+            print(f'MDK | Successfully imported backend {self.name} ({self.module})')
+
+        return _module
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def register_backend(
+            name: str|Backend,
+            probe: tuple[str]|typing.Callable|None = None,
+            module: str = None,
+            factory: typing.Callable = None,
+            priority: int = 100) -> Backend:
+    """ バックエンドを登録
+
+    * 同名のバックエンドは上書きする
+    * name に Backend を渡した場合はそのまま登録する
+
+    Returns:
+        Backend: 登録したバックエンド
+    """
+    if isinstance(name, Backend):
+        _backend = name
+    else:
+        if module is None and factory is None:
+            raise ValueError('module or factory is required.')
+
+        _backend = Backend(name, probe, module, factory=factory, priority=priority)
+
+    with _LOCK:
+        _BACKENDS[_backend.name] = _backend
+        _APPS.pop(_backend.name, None)
+
+    from . import detect
+    detect.clear_cache()
+
+    return _backend
+
+
+def unregister_backend(name: str):
+    """ バックエンドの登録を解除 """
+    with _LOCK:
+        _BACKENDS.pop(name, None)
+        _APPS.pop(name, None)
+
+    from . import detect
+    detect.clear_cache()
+
+
+def load_entry_points(group: str = ENTRY_POINT_GROUP) -> list[Backend]:
+    """ エントリポイントからバックエンドを登録
+
+    * エントリポイントは Backend か、Backend を返す関数を指す
+    * importlib.metadata は import が遅いため、呼ばれたときに読み込む
+
+    Returns:
+        list[Backend]: 登録したバックエンド
+    """
+    import importlib.metadata
+
+    _result = []
+
+    for _entry_point in importlib.metadata.entry_points(group=group):
+        try:
+            _value = _entry_point.load()
+
+            if not isinstance(_value, Backend) and callable(_value):
+                _value = _value()
+
+            if isinstance(_value, Backend):
+                _result.append(register_backend(_value))
+            else:
+                print(f'MDK | Invalid backend entry point: {_entry_point.name}')
+
+        except Exception as ex:
+            print(f'MDK | Failed to load backend entry point: {_entry_point.name} ({ex})')
+
+    return _result
+
+
+def get_backends(entry_points: bool = True) -> list[Backend]:
+    """ 登録済みバックエンドを判定順に返す
+
+    Args:
+        entry_points(bool): True の場合はエントリポイントを読み込む
+    """
+    global _ENTRY_POINTS_LOADED
+
+    with _LOCK:
+        if entry_points and not _ENTRY_POINTS_LOADED:
+            _ENTRY_POINTS_LOADED = True
+            load_entry_points()
+
+        return sorted(_BACKENDS.values(), key=lambda _backend: _backend.priority)
+
+
+def get_backend(name: str = None) -> Backend:
+    """ バックエンドを取得
+
+    Args:
+        name(str, optional): バックエンド名. None の場合は自動判定 (detect_backend)
+    """
+    from . import detect
+
+    if name is None:
+        if os.environ.get(detect.ENV_APP):
+            name = detect.detect_app()
+        else:
+            return detect_backend()
+
+    name = detect.normalize_app_name(name)
+
+    with _LOCK:
+        if name not in _BACKENDS:
+            get_backends()
+
+        if name not in _BACKENDS:
+            raise KeyError(f'MDK | Backend is not registered: {name}')
+
+        return _BACKENDS[name]
+
+
+def detect_backend() -> Backend:
+    """ 起動中のAppのバックエンドを自動判定
+
+    * detect.detect_apps() の候補を順に import し、import できないバックエンドは次の候補にする
+      (App 外の Python で PYTHONPATH に hou, maya がある場合など)
+    * 組み込みのバックエンドで見つからない場合のみエントリポイントを読み込んで判定
+      (importlib.metadata は組み込みで判定できない場合のみ読み込む)
+    * どの候補も import できなければ standalone
+    * 結果はキャッシュする (register_backend, detect.clear_cache で破棄)
+    """
+    global _DETECTED_BACKEND
+
+    from . import detect
+
+    with _LOCK:
+        if _DETECTED_BACKEND is not None:
+            return _DETECTED_BACKEND
+
+        _names = detect.detect_apps()
+        _backend = _import_backend(_names)
+
+        if _backend is None:
+            _names = [_name for _name in detect.detect_apps(entry_points=True) if _name not in _names]
+            _backend = _import_backend(_names)
+
+        _DETECTED_BACKEND = _backend or _BACKENDS[detect.STANDALONE]
+        return _DETECTED_BACKEND
+
+
+def _import_backend(names: typing.Iterable[str]) -> Backend | None:
+    """ 候補のバックエンドを順に import し、最初に import できたバックエンドを返す """
+    for _name in names:
+        _backend = _BACKENDS.get(_name)
+
+        if _backend is None:
+            continue
+
+        try:
+            if _backend.module is not None:
+                _backend.load_module()
+
+        except ImportError as ex:
+            print(f'MDK | Failed to import backend {_name}, try next ({ex})')
+            continue
+
+        return _backend
+
+    return None
+
+
+def clear_detected_backend():
+    """ detect_backend() のキャッシュを削除 """
+    global _DETECTED_BACKEND
+
+    with _LOCK:
+        _DETECTED_BACKEND = None
+
+
+def get_module(name: str = None):
+    """ バックエンドモジュールを取得 """
+    return get_backend(name).load_module()
+
+
+def get_app(name: str = None, reload: bool = False):
+    """ AppMainのシングルトンを取得
+
+    Args:
+        name(str, optional): バックエンド名. None の場合は自動判定
+        reload(bool): True の場合は AppMain を作り直す
+    """
+    _backend = get_backend(name)
+
+    with _LOCK:
+        if reload or _backend.name not in _APPS:
+            _APPS[_backend.name] = _backend.create_app()
+
+        return _APPS[_backend.name]
+
+
+def reset_app(name: str = None):
+    """ AppMainのシングルトンを破棄 """
+    with _LOCK:
+        if name is None:
+            _APPS.clear()
+        else:
+            _APPS.pop(name, None)
+
+
+# ======================================= #
+# Builtin Backends
+# ======================================= #
+register_backend('b3d', probe=('bpy',), module='mdkapps.mdk_b3d', priority=10)
+register_backend('c4d', probe=('c4d',), module='mdkapps.mdk_c4d', priority=20)
+register_backend('houdini', probe=('hou',), module='mdkapps.mdk_houdini', priority=30)
+register_backend('max', probe=('pymxs',), module='mdkapps.mdk_max', priority=40)
+register_backend('maya', probe=('maya.cmds',), module='mdkapps.mdk_maya', priority=50)
+register_backend('nuke', probe=('nuke',), module='mdkapps.mdk_nuke', priority=60)
+register_backend('standalone', probe=None, module='mdkapps.mdk_standalone', priority=1000)
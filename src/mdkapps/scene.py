@@ -0,0 +1,243 @@
+""" mdkapps.scene
+
+* シーン状態のスナップショットとキャッシュの共通モジュール
+
+* SceneState はファイルパス, FPS, フレーム範囲, レンダーサイズ, レンダラー, 選択をまとめた不変のスナップショット
+* SceneStateCache は1回だけ問い合わせてキャッシュし、DCC のコールバック (シーンを開く, 保存,
+  選択変更, フレーム範囲変更など) で invalidate() する
+* コールバックで検知できない値がある場合は ttl (秒) で期限切れにする
+* diff_settings() / apply_settings() はショット設定 (FPS, フレーム範囲, レンダー設定など) の
+  現在値と比較して、違う値だけを設定する
+
+Examples:
+    >>> from mdkapps import scene
+    >>> _cache = scene.SceneStateCache()
+    >>> _state = _cache.get(lambda: scene.SceneState(filepath='/shot/shot.ma', fps=24))
+    >>> _state.fps
+    24
+    >>> _cache.invalidate()  # コールバックから呼ぶ
+    >>> scene.diff_settings({'fps': 24.0, 'render_size': (1920, 1080)}, {'fps': 24, 'render_size': (2048, 858)})
+    {'render_size': ((1920, 1080), (2048, 858))}
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+"""
+
+import math
+import threading
+import time
+import typing
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+# apply_settings() で設定する順番
+SHOT_SETTINGS = (
+    'unit',
+    'fps',
+    'framerange',
+    'render',
+    'render_framerange',
+    'render_size',
+    'aperture_size',
+)
+
+# 右の項目が変わった場合は、左の項目も同じ値でも設定し直す
+SHOT_SETTINGS_DEPENDS = {
+    'framerange': 'fps',
+    'render_framerange': 'render',
+    'render_size': 'render',
+}
+
+SETTING_TOLERANCE = 1e-3
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class SceneState(typing.NamedTuple):
+    """ シーン状態のスナップショット (不変)
+
+    * framerange : (headin, cutin, cutout, tailout)
+    * 取得できない値は None
+    """
+    filepath: str = None
+    fps: float = None
+    framerange: tuple = None
+    render_size: tuple = None
+    render: str = None
+    selection: tuple = ()
+
+
+class SceneStateCache:
+    """ シーン状態のキャッシュ
+
+    * invalidate() は引数を無視するので、そのまま DCC のコールバックに登録できる
+    * 問い合わせ中に invalidate() された場合、その結果はキャッシュしない
+
+    Args:
+        ttl(float, optional): キャッシュの有効時間 (秒). None の場合はコールバックで invalidate() されるまで有効
+    """
+    def __init__(self, ttl: float = None):
+        self.ttl = ttl
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+
+        self._state = None
+        self._time = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+
+    def __repr__(self):
+        return f'{type(self).__name__}(valid={self.is_valid}, hits={self.hits}, misses={self.misses})'
+
+
+    @property
+    def is_valid(self) -> bool:
+        if self._state is None:
+            return False
+
+        return self.ttl is None or time.monotonic() - self._time < self.ttl
+
+
+    def get(self, query) -> SceneState:
+        """ キャッシュしたシーン状態を返す (無効な場合は query() で取得)
+
+        Args:
+            query(Callable): query() -> SceneState
+        """
+        if self.enabled and self.is_valid:
+            self.hits += 1
+            return self._state
+
+        with self._lock:
+            _generation = self._generation
+
+        _state = query()
+        self.misses += 1
+
+        with self._lock:
+            if self.enabled and _generation == self._generation:
+                self._state = _state
+                self._time = time.monotonic()
+
+        return _state
+
+
+    def invalidate(self, *args, **kwargs):
+        """ キャッシュを破棄 (コールバック用に引数は無視する) """
+        with self._lock:
+            self._generation += 1
+            self._state = None
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def apply_settings(changes: dict, setters: dict) -> dict:
+    """ diff_settings() の変更を設定
+
+    Args:
+        changes(dict): diff_settings() の結果
+        setters(dict): {key: setter(value)}
+
+    Returns:
+        dict: changes
+    """
+    for _key, (_current, _value) in changes.items():
+        setters[_key](_value)
+
+    return changes
+
+
+def check_settings(settings: dict):
+    """ ショット設定の項目を確認
+
+    Raises:
+        ValueError: SHOT_SETTINGS にない項目がある場合
+    """
+    _unknown = sorted(set(settings) - set(SHOT_SETTINGS))
+
+    if _unknown:
+        raise ValueError(f'MDK | Unknown shot settings: {_unknown}')
+
+
+def diff_settings(current: dict, settings: dict, keys=None, compare: dict = None) -> dict:
+    """ ショット設定の現在値と比較して、違う項目を返す
+
+    * SHOT_SETTINGS の順番で返す
+    * 値が None の項目は設定しない
+    * 現在値が None (取得できない) の項目は常に設定する
+    * 依存する項目 (SHOT_SETTINGS_DEPENDS) が変わった場合は同じ値でも設定する
+
+    Args:
+        current(dict): 現在値 {key: value}
+        settings(dict): 設定する値 {key: value}
+        keys(Iterable[str], optional): 設定できる項目. None の場合はすべて
+        compare(dict, optional): {key: func(value)} 比較する前に両方の値を変換 (DCC の設定の精度に合わせる)
+
+    Returns:
+        dict: {key: (current, value)}
+
+    Raises:
+        ValueError: SHOT_SETTINGS にない項目がある場合
+    """
+    check_settings(settings)
+
+    _keys = set(SHOT_SETTINGS if keys is None else keys)
+    compare = compare or {}
+    _changes = {}
+
+    for _key in SHOT_SETTINGS:
+        _value = settings.get(_key)
+
+        if _key not in _keys or _value is None:
+            continue
+
+        _current = current.get(_key)
+
+        if SHOT_SETTINGS_DEPENDS.get(_key) in _changes or not is_same_setting(_current, _value, compare.get(_key)):
+            _changes[_key] = (_current, _value)
+
+    return _changes
+
+
+def get_outer_range(framerange) -> tuple:
+    """ フレーム範囲 (headin, cutin, cutout, tailout) の (headin, tailout)
+
+    * ハンドルを持たない DCC の比較用 (diff_settings の compare)
+    """
+    return (framerange[0], framerange[-1])
+
+
+def is_same_setting(current, value, key=None) -> bool:
+    """ 設定値が同じか判定
+
+    * 数値は SETTING_TOLERANCE の誤差を許容, 文字列は大文字小文字を区別しない
+    * list と tuple は同じとして比較
+    """
+    if current is None:
+        return False
+
+    if key is not None:
+        current, value = key(current), key(value)
+
+    if isinstance(current, (list, tuple)) and isinstance(value, (list, tuple)):
+        return len(current) == len(value) and all(map(is_same_setting, current, value))
+
+    if isinstance(current, str) and isinstance(value, str):
+        return current.lower() == value.lower()
+
+    if isinstance(current, (int, float)) and isinstance(value, (int, float)):
+        return math.isclose(current, value, abs_tol=SETTING_TOLERANCE)
+
+    return current == value
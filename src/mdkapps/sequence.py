@@ -0,0 +1,501 @@
+""" mdkapps.sequence
+
+* 連番ファイル判定モジュール
+
+* 'name.1001.exr' などの連番ファイルを FileSequence にまとめる
+* 'name.####.exr', 'name.%04d.exr', 'name.<UDIM>.exr', 'name.$F4.exr'
+  のパターンからフレームを検索する
+* ディレクトリは os.scandir で1回だけ走査する
+
+Examples:
+    >>> from mdkapps import sequence
+    >>> for _item in sequence.scan_sequences('/shot/render'):
+    ...     print(_item)
+    /shot/render/beauty.####.exr
+    >>> _seq = sequence.expand_pattern('/shot/render/beauty.%04d.exr')
+    >>> _seq.first, _seq.last, _seq.missing_frames
+    (1001, 1200, [1100])
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+        * fixed: collapse() で入力のファイルパスの文字列のまま連番を対応付ける ('C:/shot/tex/a.1001.exr')
+        * added: collapse_dict()
+        * fixed: expand_pattern() で桁数指定なしのパターン ('%d', '$F') はディスク上の桁数を使う
+        * added: is_udim_tiles(), group_filenames(), collapse() の udim (UDIMタイルの番号の連番を UDIM にする)
+"""
+
+import os
+import re
+import typing
+
+from . import filetypes
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+DIGITS = '0123456789'
+
+# パターン ('####', '@@@@', '%04d', '<UDIM>', '$F4')
+TOKEN_PATTERN = re.compile(
+    r'(?P<hash>#+)$|(?P<at>@+)$|%0?(?P<printf>\d*)d$|(?P<udim><UDIM>|<udim>)$|\$F(?P<houdini>\d*)$'
+)
+
+STYLE_HASH = '#'
+STYLE_PRINTF = '%'
+STYLE_HOUDINI = '$F'
+STYLE_UDIM = '<UDIM>'
+
+# UDIMタイルの番号 (4桁, 1001 - 1999)
+UDIM_PADDING = 4
+UDIM_FIRST = 1001
+UDIM_LAST = 1999
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class FileSequence:
+    """ 連番ファイル
+
+    Args:
+        dirpath(str): ディレクトリ
+        head(str): フレーム番号より前のファイル名 ('beauty.')
+        tail(str): フレーム番号より後のファイル名 ('.exr')
+        padding(int): フレーム番号の桁数. 0 の場合は桁数指定なし
+        frames(list[int]): フレーム番号リスト
+        udim(bool): UDIMタイルの場合はTrue
+    """
+    def __init__(
+            self,
+            dirpath: str,
+            head: str,
+            tail: str,
+            padding: int,
+            frames: typing.Iterable[int],
+            udim: bool = False):
+
+        self.dirpath = dirpath
+        self.head = head
+        self.tail = tail
+        self.padding = padding
+        self.frames = sorted(set(frames))
+        self.udim = udim
+
+
+    def __eq__(self, other):
+        if not isinstance(other, FileSequence):
+            return NotImplemented
+
+        return (
+            (self.dirpath, self.head, self.tail, self.padding, self.frames, self.udim)
+            == (other.dirpath, other.head, other.tail, other.padding, other.frames, other.udim)
+        )
+
+
+    def __hash__(self):
+        return hash((self.dirpath, self.head, self.tail, self.padding))
+
+
+    def __iter__(self):
+        return iter(self.paths())
+
+
+    def __len__(self):
+        return len(self.frames)
+
+
+    def __repr__(self):
+        return f'FileSequence({self.pattern()!r}, {self.format_ranges()!r})'
+
+
+    def __str__(self):
+        return self.pattern()
+
+
+    @property
+    def first(self) -> int:
+        return self.frames[0] if self.frames else None
+
+
+    @property
+    def last(self) -> int:
+        return self.frames[-1] if self.frames else None
+
+
+    @property
+    def missing_frames(self) -> list[int]:
+        """ 抜けているフレーム番号 """
+        if self.udim or not self.frames:
+            return []
+
+        _frames = set(self.frames)
+        return [_frame for _frame in range(self.first, self.last + 1) if _frame not in _frames]
+
+
+    def format_frame(self, frame: int) -> str:
+        return f'{frame:0{self.padding}d}'
+
+
+    def format_ranges(self) -> str:
+        """ フレーム範囲を文字列で返す ('1001-1099,1101-1200') """
+        return ','.join(
+            f'{_first}-{_last}' if _first != _last else str(_first)
+            for _first, _last in self.frame_ranges()
+        )
+
+
+    def frame_ranges(self) -> list[tuple[int, int]]:
+        """ 連続するフレーム範囲のリストを返す """
+        return frames_to_ranges(self.frames)
+
+
+    def get_path(self, frame: int) -> str:
+        """ フレームのファイルパスを返す """
+        return os.path.join(self.dirpath, f'{self.head}{self.format_frame(frame)}{self.tail}')
+
+
+    def paths(self) -> list[str]:
+        """ 全フレームのファイルパスを返す """
+        return [self.get_path(_frame) for _frame in self.frames]
+
+
+    def pattern(self, style: str = None) -> str:
+        """ パターンのファイルパスを返す
+
+        Args:
+            style(str, optional): '#', '%', '$F', '<UDIM>'
+                * None の場合、UDIMなら '<UDIM>', それ以外は '#'
+        """
+        if style is None:
+            style = STYLE_UDIM if self.udim else STYLE_HASH
+
+        _padding = max(self.padding, 1)
+
+        if style == STYLE_HASH:
+            _token = '#' * _padding
+        elif style == STYLE_PRINTF:
+            _token = f'%0{_padding}d' if self.padding else '%d'
+        elif style == STYLE_HOUDINI:
+            _token = f'$F{_padding}' if self.padding else '$F'
+        elif style == STYLE_UDIM:
+            _token = '<UDIM>'
+        else:
+            raise ValueError(f'MDK | Invalid style: {style}')
+
+        return os.path.join(self.dirpath, f'{self.head}{_token}{self.tail}')
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def frames_to_ranges(frames: typing.Iterable[int]) -> list[tuple[int, int]]:
+    """ フレーム番号リストを連続する範囲のリストに変換
+
+    Examples:
+        >>> frames_to_ranges([1, 2, 3, 5, 7, 8])
+        [(1, 3), (5, 5), (7, 8)]
+    """
+    _ranges = []
+
+    for _frame in sorted(set(frames)):
+        if _ranges and _ranges[-1][1] + 1 == _frame:
+            _ranges[-1][1] = _frame
+        else:
+            _ranges.append([_frame, _frame])
+
+    return [tuple(_range) for _range in _ranges]
+
+
+def split_tail(filename: str) -> tuple[str, str]:
+    """ ファイル名を本体と拡張子に分割
+
+    * '.bgeo.sc' などの複数拡張子に対応
+    """
+    _suffix = filetypes.find_suffix(filename)
+
+    if _suffix:
+        _index = len(filename) - len(_suffix)
+    else:
+        _index = filename.rfind('.')
+
+        if _index <= 0:
+            return filename, ''
+
+    return filename[:_index], filename[_index:]
+
+
+def split_filename(filename: str) -> tuple[str, str, str]:
+    """ ファイル名を head, frame, tail に分割
+
+    Examples:
+        >>> split_filename('beauty.1001.exr')
+        ('beauty.', '1001', '.exr')
+
+    Returns:
+        tuple[str, str, str]: フレーム番号がなければ None
+    """
+    _body, _tail = split_tail(filename)
+    _head = _body.rstrip(DIGITS)
+
+    if len(_head) == len(_body):
+        return None
+
+    return _head, _body[len(_head):], _tail
+
+
+def split_pattern(filename: str) -> tuple[str, int, str, bool]:
+    """ パターンのファイル名を head, padding, tail, udim に分割
+
+    Examples:
+        >>> split_pattern('beauty.%04d.exr')
+        ('beauty.', 4, '.exr', False)
+
+    Returns:
+        tuple[str, int, str, bool]: パターンでなければ None
+    """
+    _body, _tail = split_tail(filename)
+    _match = TOKEN_PATTERN.search(_body)
+
+    if not _match:
+        return None
+
+    _head = _body[:_match.start()]
+
+    if _match.group('hash'):
+        _padding = len(_match.group('hash'))
+    elif _match.group('at'):
+        _padding = len(_match.group('at'))
+    elif _match.group('udim'):
+        return _head, 4, _tail, True
+    else:
+        _digits = _match.group('printf') or _match.group('houdini') or ''
+        _padding = int(_digits) if _digits else 0
+
+    return _head, _padding, _tail, False
+
+
+def is_udim_tiles(frames: typing.Iterable[int], padding: int) -> bool:
+    """ UDIMタイルの番号か判定 (4桁, すべて 1001 - 1999)
+
+    * 'tex.1001.exr' ~ 'tex.1010.exr' のような番号はフレームと区別できないため、
+      group_filenames(), collapse() では udim=True の場合のみ使う
+    """
+    _frames = list(frames)
+
+    return (
+        padding == UDIM_PADDING
+        and bool(_frames)
+        and all(UDIM_FIRST <= _frame <= UDIM_LAST for _frame in _frames)
+    )
+
+
+def is_pattern(filepath: str) -> bool:
+    """ パターンのファイルパスか判定 """
+    return split_pattern(os.path.basename(str(filepath))) is not None
+
+
+def iter_files(dirpath: str) -> typing.Iterator[str]:
+    """ ディレクトリ内のファイル名を返す (os.scandir) """
+    try:
+        with os.scandir(dirpath or '.') as _entries:
+            for _entry in _entries:
+                try:
+                    if _entry.is_file():
+                        yield _entry.name
+                except OSError:
+                    pass
+
+    except OSError:
+        return
+
+
+def group_filenames(
+            dirpath: str,
+            filenames: typing.Iterable[str],
+            min_frames: int = 2,
+            udim: bool = False) -> list[FileSequence|str]:
+    """ ファイル名リストを連番ごとにまとめる
+
+    Args:
+        dirpath(str): ディレクトリ
+        filenames(Iterable[str]): ファイル名
+        min_frames(int): この数未満のフレームは連番にしない
+        udim(bool): True の場合は UDIMタイルの番号 (is_udim_tiles) の連番を UDIM にする
+
+    Returns:
+        list[FileSequence | str]: 連番, または単体のファイルパス
+    """
+    _groups = {}
+    _singles = []
+
+    for _filename in filenames:
+        _split = split_filename(_filename)
+
+        if _split is None:
+            _singles.append(_filename)
+            continue
+
+        _head, _frame, _tail = _split
+        _groups.setdefault((_head, _tail, len(_frame)), []).append(int(_frame))
+
+    _result = []
+
+    for (_head, _tail, _padding), _frames in _groups.items():
+        if len(_frames) < min_frames:
+            _result.extend(
+                os.path.join(dirpath, f'{_head}{_frame:0{_padding}d}{_tail}') for _frame in _frames
+            )
+        else:
+            _udim = udim and is_udim_tiles(_frames, _padding)
+            _result.append(FileSequence(dirpath, _head, _tail, _padding, _frames, udim=_udim))
+
+    _result.extend(os.path.join(dirpath, _filename) for _filename in _singles)
+    _result.sort(key=str)
+
+    return _result
+
+
+def scan_sequences(dirpath: str, min_frames: int = 2, udim: bool = False) -> list[FileSequence|str]:
+    """ ディレクトリ内の連番を検索
+
+    * os.scandir で1回だけ走査する
+
+    Returns:
+        list[FileSequence | str]: 連番, または単体のファイルパス
+    """
+    return group_filenames(dirpath, iter_files(dirpath), min_frames=min_frames, udim=udim)
+
+
+def expand_pattern(filepath: str, filenames: typing.Iterable[str] = None) -> FileSequence:
+    """ パターンのファイルパスから連番を検索
+
+    Args:
+        filepath(str): 'beauty.####.exr', 'beauty.%04d.exr', 'tex.<UDIM>.exr', 'geo.$F4.bgeo.sc'
+        filenames(Iterable[str], optional): ディレクトリ内のファイル名 (省略時は os.scandir)
+
+    * 桁数指定なしのパターン ('%d', '$F') はディスク上のファイルの桁数を使う
+      ('tex.%d.exr' → 'tex.0001.exr' の場合は padding=4)
+
+    Returns:
+        FileSequence: フレームが見つからない場合も空の FileSequence を返す
+    """
+    _dirpath, _filename = os.path.split(str(filepath))
+    _split = split_pattern(_filename)
+
+    if _split is None:
+        raise ValueError(f'MDK | Not sequence pattern: {filepath}')
+
+    _head, _padding, _tail, _udim = _split
+
+    if filenames is None:
+        filenames = iter_files(_dirpath)
+
+    _frames = []
+    _min_length = 0
+
+    for _name in filenames:
+        if not (_name.startswith(_head) and _name.endswith(_tail)):
+            continue
+
+        _frame = _name[len(_head):len(_name) - len(_tail)]
+
+        if not _frame.isdigit():
+            continue
+
+        if _padding and len(_frame) != _padding and not (_frame[0] != '0' and len(_frame) > _padding):
+            continue
+
+        _frames.append(int(_frame))
+        _min_length = min(_min_length, len(_frame)) if _min_length else len(_frame)
+
+    # 桁数指定なしのパターンは一番短いフレーム番号の桁数 (1桁は桁数指定なしのまま)
+    if not _padding and not _udim and _min_length > 1:
+        _padding = _min_length
+
+    return FileSequence(_dirpath, _head, _tail, _padding, _frames, udim=_udim)
+
+
+def collapse(
+            filepath_list: typing.Iterable[str],
+            kinds: tuple[str] = None,
+            min_frames: int = 2,
+            udim: bool = False) -> list[FileSequence|str]:
+    """ ファイルパスリストの連番をまとめる
+
+    * 同じディレクトリのファイルは1つのグループとしてまとめる
+    * パターンのファイルパスは expand_pattern でフレームを検索
+      (フレームが見つからなければパスのまま返す)
+
+    Args:
+        filepath_list(Iterable[str]): ファイルパスリスト
+        kinds(tuple[str], optional): 連番にまとめるファイルタイプ (filetypes.FILE_TYPES のキー)
+            * None の場合は全てのファイル
+        min_frames(int): この数未満のフレームは連番にしない
+        udim(bool): True の場合は UDIMタイルの番号 (is_udim_tiles) の連番を UDIM にする
+            ('tex.1001.exr' ~ 'tex.1010.exr' → 'tex.<UDIM>.exr')
+
+    Returns:
+        list[FileSequence | str]: 連番, または単体のファイルパス (入力順)
+    """
+    _items = []
+    _added = set()
+
+    for _item in collapse_dict(filepath_list, kinds=kinds, min_frames=min_frames, udim=udim).values():
+        _key = _item if isinstance(_item, str) else id(_item)
+
+        if _key not in _added:
+            _added.add(_key)
+            _items.append(_item)
+
+    return _items
+
+
+def collapse_dict(
+            filepath_list: typing.Iterable[str],
+            kinds: tuple[str] = None,
+            min_frames: int = 2,
+            udim: bool = False) -> dict[str, FileSequence|str]:
+    """ ファイルパスごとの連番を返す (collapse の対応表)
+
+    * キーは入力のファイルパスの文字列のまま ('C:/shot/tex/a.1001.exr' の区切り文字も変えない)
+    * 連番にならないファイルは入力のファイルパスをそのまま返す
+
+    Returns:
+        dict[str, FileSequence | str]: {入力のファイルパス: 連番, または単体のファイルパス} (入力順)
+    """
+    _filepath_list = list(dict.fromkeys(str(_filepath) for _filepath in filepath_list))
+    _dir_dict = {}
+    _result = {}
+
+    for _filepath in _filepath_list:
+        if is_pattern(_filepath):
+            _sequence = expand_pattern(_filepath)
+            _result[_filepath] = _sequence if _sequence.frames else _filepath
+            continue
+
+        if kinds is not None and filetypes.get_kinds(_filepath).isdisjoint(kinds):
+            continue
+
+        _dirpath, _filename = os.path.split(_filepath)
+        _dir_dict.setdefault(_dirpath, []).append(_filename)
+
+    # (ディレクトリ, ファイル名) → 連番
+    _sequences = {}
+
+    for _dirpath, _filenames in _dir_dict.items():
+        for _item in group_filenames(_dirpath, _filenames, min_frames=min_frames, udim=udim):
+            if isinstance(_item, FileSequence):
+                for _frame in _item.frames:
+                    _sequences[(_dirpath, f'{_item.head}{_item.format_frame(_frame)}{_item.tail}')] = _item
+
+    return {
+        _filepath: _result.get(_filepath) or _sequences.get(os.path.split(_filepath), _filepath)
+        for _filepath in _filepath_list
+    }
@@ -0,0 +1,284 @@
+""" mdkapps.thumbnail
+
+* プレイブラストのサムネイルとコンタクトシートを作成するモジュール
+
+* フレームを書き出すときのピクセルバッファから作成する (書き出したフレームを読み直さない)
+* NumPy のブロック平均で縮小する
+* 書き出しスレッドから add() を呼んで並列に処理できる
+* NumPy はオプション (未インストールの場合は使用時に ImportError)
+
+Examples:
+    >>> from mdkapps import thumbnail
+    >>> _thumbnails = thumbnail.PlayblastThumbnails(
+    ...     range(1001, 1101), sheet_path='/pb/shot_sheet.png', thumbnail_path='/pb/shot_thumb.png')
+    >>> _thumbnails.add(1001, 1920, 1080, _pixels, mode='BGRX')
+    >>> _thumbnails.save()
+    {'contact_sheet': '/pb/shot_sheet.png', 'thumbnail': '/pb/shot_thumb.png'}
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+        * fixed: PlayblastThumbnails.add() でサムネイルをコピーして保持 (縮小しない場合はピクセルバッファのビューのため)
+"""
+
+import math
+import threading
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import images
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+TILE_SIZE = (320, 180)
+THUMBNAIL_SIZE = (480, 270)
+MARGIN = 4
+BACKGROUND = 32
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class ContactSheet:
+    """ N×M のコンタクトシート
+
+    * frames から columns * rows 枚を等間隔に選んでタイルに配置する
+
+    Args:
+        frames(Iterable[int]): プレイブラストのフレーム
+        columns(int): 列数
+        rows(int): 行数
+        tile_size(tuple[int, int]): タイルの最大サイズ
+    """
+    def __init__(
+                self,
+                frames,
+                columns: int = 4,
+                rows: int = 4,
+                tile_size: tuple[int, int] = TILE_SIZE,
+                margin: int = MARGIN,
+                background: int = BACKGROUND):
+        require_numpy()
+
+        self.columns = columns
+        self.rows = rows
+        self.tile_size = tuple(tile_size)
+        self.margin = margin
+        self.frames = select_frames(list(frames), columns * rows)
+
+        self._slots = {_frame: _index for _index, _frame in enumerate(self.frames)}
+        self._lock = threading.Lock()
+
+        _width = columns * (self.tile_size[0] + margin) + margin
+        _height = rows * (self.tile_size[1] + margin) + margin
+        self.image = np.full((_height, _width, 3), background, dtype=np.uint8)
+
+
+    def __contains__(self, frame: int) -> bool:
+        return frame in self._slots
+
+
+    def add(self, frame: int, array) -> bool:
+        """ フレームを配置
+
+        Args:
+            frame(int): フレーム
+            array(numpy.ndarray): (height, width, 3) の RGB
+
+        Returns:
+            bool: 配置した場合は True
+        """
+        _index = self._slots.get(frame)
+
+        if _index is None:
+            return False
+
+        _tile = downsample(array, self.tile_size)
+        _tile_height, _tile_width = _tile.shape[:2]
+
+        _column, _row = _index % self.columns, _index // self.columns
+        _x = self.margin + _column * (self.tile_size[0] + self.margin) + (self.tile_size[0] - _tile_width) // 2
+        _y = self.margin + _row * (self.tile_size[1] + self.margin) + (self.tile_size[1] - _tile_height) // 2
+
+        with self._lock:
+            self.image[_y:_y + _tile_height, _x:_x + _tile_width] = _tile
+
+        return True
+
+
+    def save(self, filepath: str) -> str:
+        """ PNG で書き出し """
+        write_array(filepath, self.image)
+        return filepath
+
+
+class PlayblastThumbnails:
+    """ プレイブラストの後処理 (サムネイル, コンタクトシート)
+
+    * add() はフレームを書き出すスレッドから呼ぶ
+    * 必要なフレームだけ NumPy の配列に変換する
+
+    Args:
+        frames(Iterable[int]): プレイブラストのフレーム
+        sheet_path(str, optional): コンタクトシートの出力パス
+        thumbnail_path(str, optional): サムネイルの出力パス
+        columns(int): コンタクトシートの列数
+        rows(int): コンタクトシートの行数
+        tile_size(tuple[int, int]): コンタクトシートのタイルの最大サイズ
+        thumbnail_size(tuple[int, int]): サムネイルの最大サイズ
+        thumbnail_frame(int, optional): サムネイルのフレーム. None の場合は中間のフレーム
+    """
+    def __init__(
+                self,
+                frames,
+                sheet_path: str = None,
+                thumbnail_path: str = None,
+                columns: int = 4,
+                rows: int = 4,
+                tile_size: tuple[int, int] = TILE_SIZE,
+                thumbnail_size: tuple[int, int] = THUMBNAIL_SIZE,
+                thumbnail_frame: int = None):
+        require_numpy()
+
+        _frames = list(frames)
+
+        self.sheet_path = sheet_path
+        self.thumbnail_path = thumbnail_path
+        self.thumbnail_size = tuple(thumbnail_size)
+        self.thumbnail_frame = thumbnail_frame if thumbnail_frame is not None else _frames[len(_frames) // 2]
+
+        self.contact_sheet = ContactSheet(_frames, columns, rows, tile_size) if sheet_path else None
+        self._thumbnail = None
+
+
+    def wants(self, frame: int) -> bool:
+        """ 後処理に使うフレームか判定 """
+        return (
+            (self.contact_sheet is not None and frame in self.contact_sheet)
+            or (self.thumbnail_path is not None and frame == self.thumbnail_frame)
+        )
+
+
+    def add(self, frame: int, width: int, height: int, pixels: bytes, mode: str = 'RGB', stride: int = None) -> bool:
+        """ フレームのピクセルバッファを追加
+
+        Args:
+            pixels(bytes): ピクセルバッファ ('RGB', 'RGBA', 'BGR', 'BGRA', 'BGRX')
+
+        Returns:
+            bool: 使用した場合は True
+        """
+        if not self.wants(frame):
+            return False
+
+        _array = to_array(width, height, pixels, mode=mode, stride=stride)
+
+        if self.contact_sheet is not None:
+            self.contact_sheet.add(frame, _array)
+
+        # 縮小しない場合はピクセルバッファ (QImage.constBits() など) のビューのためコピーする
+        if frame == self.thumbnail_frame:
+            self._thumbnail = np.array(downsample(_array, self.thumbnail_size))
+
+        return True
+
+
+    def save(self) -> dict:
+        """ サムネイルとコンタクトシートを書き出し
+
+        Returns:
+            dict: {'contact_sheet': str, 'thumbnail': str}
+        """
+        _result = {}
+
+        if self.contact_sheet is not None:
+            _result['contact_sheet'] = self.contact_sheet.save(self.sheet_path)
+
+        if self.thumbnail_path is not None and self._thumbnail is not None:
+            write_array(self.thumbnail_path, self._thumbnail)
+            _result['thumbnail'] = self.thumbnail_path
+
+        return _result
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def block_mean(array, factor: int):
+    """ factor × factor のブロック平均で縮小
+
+    * 端の factor で割り切れない部分は切り捨てる
+    """
+    if factor <= 1:
+        return array
+
+    _height = array.shape[0] // factor * factor
+    _width = array.shape[1] // factor * factor
+
+    _blocks = array[:_height, :_width].reshape(
+        _height // factor, factor, _width // factor, factor, array.shape[2]
+    )
+
+    return _blocks.mean(axis=(1, 3), dtype=np.float32).round().astype(np.uint8)
+
+
+def downsample(array, max_size: tuple[int, int]):
+    """ max_size (width, height) に収まるようにブロック平均で縮小 """
+    _height, _width = array.shape[:2]
+    _factor = max(math.ceil(_width / max_size[0]), math.ceil(_height / max_size[1]), 1)
+
+    return block_mean(array, _factor)
+
+
+def require_numpy():
+    """ NumPy がない場合は ImportError """
+    if np is None:
+        raise ImportError('MDK | numpy is required for mdkapps.thumbnail')
+
+
+def select_frames(frames: list[int], count: int) -> list[int]:
+    """ フレームを等間隔に count 枚選ぶ
+
+    Examples:
+        >>> select_frames(list(range(1001, 1101)), 4)
+        [1001, 1034, 1067, 1100]
+    """
+    if len(frames) <= count:
+        return list(frames)
+
+    if count == 1:
+        return [frames[len(frames) // 2]]
+
+    return [frames[round(_index * (len(frames) - 1) / (count - 1))] for _index in range(count)]
+
+
+def to_array(width: int, height: int, pixels: bytes, mode: str = 'RGB', stride: int = None):
+    """ ピクセルバッファを (height, width, 3) の RGB 配列に変換 (コピーなしのビュー) """
+    require_numpy()
+
+    _bpp = images.PIXEL_MODES[mode][0]
+    stride = stride or width * _bpp
+
+    _array = np.frombuffer(pixels, dtype=np.uint8, count=stride * height)
+    _array = _array.reshape(height, stride)[:, :width * _bpp].reshape(height, width, _bpp)
+
+    if mode.startswith('BGR'):
+        return _array[:, :, 2::-1]
+
+    return _array[:, :, :3]
+
+
+def write_array(filepath: str, array) -> int:
+    """ (height, width, 3) の RGB 配列を PNG で書き出し """
+    _height, _width = array.shape[:2]
+    return images.write_png(filepath, _width, _height, np.ascontiguousarray(array).tobytes(), mode='RGB')
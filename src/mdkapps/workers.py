@@ -0,0 +1,357 @@
+""" mdkapps.workers
+
+* フレーム範囲を分割して、複数のワーカープロセスで実行するモジュール
+
+* ワーカーの起動方法 (ランチャー) は差し替え可能
+    * SubprocessLauncher : 外部プロセス (mayapy など) で実行
+    * LocalLauncher : 同じプロセス内で関数を実行 (テスト用)
+* 失敗したチャンクはリトライする
+* 進捗は callback(done, total, result) で通知する
+* submit_jobs() はバックグラウンドで実行し、JobHandle (状態, ログ, 時間) を返す
+
+Examples:
+    >>> from mdkapps import workers
+    >>> _jobs = [{'start': _start, 'end': _end} for _start, _end in workers.split_range(1001, 1240, 100)]
+    >>> _launcher = workers.SubprocessLauncher('/usr/autodesk/maya/bin/mayapy', 'worker.py')
+    >>> _results = workers.run_jobs(_jobs, _launcher, max_workers=3, retries=1)
+    >>> _handle = workers.submit_jobs(_jobs, _launcher)
+    >>> _handle.status
+    'running'
+
+Info:
+    * Created : v0.0.4 2026-10-18 Tatsuya YAMAGISHI
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.4 2026-10-18 Tatsuya Yamagishi
+        * New
+        * added: JobHandle, submit_jobs(), JobResult.log
+"""
+
+import concurrent.futures
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from typing import NamedTuple
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_RETRIES = 1
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class JobResult(NamedTuple):
+    """ ジョブの実行結果 """
+    job: dict
+    returncode: int
+    attempts: int
+    seconds: float
+    error: str = ''
+    log: str = ''
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+class JobHandle:
+    """ バックグラウンドで実行中のジョブのハンドル (submit_jobs() が返す)
+
+    * status : 'running', 'done', 'failed', 'cancelled'
+    * logs : ジョブごとのワーカーの出力
+    * timings : 準備などの時間とジョブごとの時間
+    """
+    def __init__(self, jobs: list[dict], name: str = '', timings: dict = None):
+        self.jobs = list(jobs)
+        self.name = name
+        self.results = [None] * len(self.jobs)
+        self.cancel_event = threading.Event()
+        self.future = concurrent.futures.Future()
+        self.started = time.perf_counter()
+        self.finished = None
+
+        self._timings = dict(timings or {})
+
+
+    def __repr__(self) -> str:
+        return f'JobHandle({self.name!r}, status={self.status!r}, jobs={len(self.jobs)})'
+
+
+    @property
+    def elapsed(self) -> float:
+        """ 開始からの時間 (終了後は実行時間) """
+        return (self.finished or time.perf_counter()) - self.started
+
+
+    @property
+    def logs(self) -> list[str]:
+        """ 終了したジョブのログ (ジョブ順) """
+        return [_result.log for _result in self.results if _result is not None]
+
+
+    @property
+    def status(self) -> str:
+        if not self.future.done():
+            return 'running'
+
+        if self.future.exception() is not None:
+            return 'failed'
+
+        if self.cancel_event.is_set() and not all(_result and _result.ok for _result in self.results):
+            return 'cancelled'
+
+        return 'done' if all(_result.ok for _result in self.results) else 'failed'
+
+
+    @property
+    def timings(self) -> dict:
+        """ {key: 秒, 'jobs': [ジョブごとの秒], 'total': 秒} """
+        return dict(
+            self._timings,
+            jobs=[_result.seconds if _result else None for _result in self.results],
+            total=self.elapsed,
+        )
+
+
+    def add_done_callback(self, func):
+        """ 終了時に func(handle) を呼ぶ (終了済みの場合はすぐに呼ぶ) """
+        self.future.add_done_callback(lambda future: func(self))
+
+
+    def cancel(self):
+        """ 未実行のジョブをキャンセル (実行中のワーカーは終了を待つ) """
+        self.cancel_event.set()
+
+
+    def done(self) -> bool:
+        return self.future.done()
+
+
+    def result(self, timeout: float = None) -> list[JobResult]:
+        """ 終了を待ってジョブ順の実行結果を返す """
+        return self.future.result(timeout)
+
+
+class LocalLauncher:
+    """ 同じプロセス内で関数を実行するランチャー (テスト・デバッグ用)
+
+    * func(job) が None か 0 を返せば成功
+    """
+    def __init__(self, func):
+        self.func = func
+
+
+    def __call__(self, job: dict) -> int:
+        _result = self.func(job)
+        return 0 if _result is None else int(_result)
+
+
+class SubprocessLauncher:
+    """ 外部プロセスでスクリプトを実行するランチャー
+
+    * '{executable} {script} {job(JSON)}' を実行する
+    * 失敗時の出力は logger に出力する
+    * (returncode, 出力) を返す (出力は JobResult.log に保存される)
+
+    Args:
+        executable(str): 実行ファイル (mayapy, hython など)
+        script(str): ワーカースクリプト
+        env(dict, optional): 環境変数
+        timeout(float, optional): タイムアウト (秒)
+    """
+    def __init__(self, executable: str, script: str, env: dict = None, timeout: float = None):
+        self.executable = str(executable)
+        self.script = str(script)
+        self.env = env
+        self.timeout = timeout
+
+
+    def __call__(self, job: dict) -> tuple[int, str]:
+        _cmd = [self.executable, self.script, json.dumps(job)]
+        _env = dict(os.environ, **self.env) if self.env else None
+
+        _proc = subprocess.run(
+            _cmd,
+            env=_env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=self.timeout,
+        )
+
+        if _proc.returncode:
+            logger.warning('worker failed (%s): %s\n%s', _proc.returncode, job, _proc.stdout)
+
+        return _proc.returncode, _proc.stdout
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def split_range(start: int, end: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """ フレーム範囲を分割
+
+    Examples:
+        >>> split_range(1001, 1250, 100)
+        [(1001, 1100), (1101, 1200), (1201, 1250)]
+    """
+    if chunk_size < 1:
+        raise ValueError(f'MDK | chunk_size must be 1 or more: {chunk_size}')
+
+    return [
+        (_start, min(_start + chunk_size - 1, end))
+        for _start in range(start, end + 1, chunk_size)
+    ]
+
+
+def run_job(job: dict, launcher, retries: int = DEFAULT_RETRIES, cancel_event: threading.Event = None) -> JobResult:
+    """ ジョブを実行 (失敗したら retries 回までリトライ)
+
+    * launcher(job) は returncode か (returncode, ログ) を返す
+    """
+    _start = time.perf_counter()
+    _returncode = -1
+    _error = ''
+    _attempts = 0
+    _logs = []
+
+    for _attempts in range(1, retries + 2):
+        if cancel_event is not None and cancel_event.is_set():
+            _error = 'cancelled'
+            break
+
+        try:
+            _returncode = launcher(job)
+
+            if isinstance(_returncode, tuple):
+                _returncode, _log = _returncode
+                _logs.append(_log or '')
+
+            _error = '' if _returncode == 0 else f'returncode = {_returncode}'
+
+        except Exception as ex:
+            _returncode = -1
+            _error = f'{type(ex).__name__}: {ex}'
+
+        if _returncode == 0:
+            break
+
+        logger.info('retry job (%d/%d): %s %s', _attempts, retries + 1, job, _error)
+
+    return JobResult(job, _returncode, _attempts, time.perf_counter() - _start, _error, ''.join(_logs))
+
+
+def run_jobs(
+            jobs: list[dict],
+            launcher,
+            max_workers: int = None,
+            retries: int = DEFAULT_RETRIES,
+            callback=None,
+            cancel_event: threading.Event = None) -> list[JobResult]:
+    """ 複数ジョブを並列に実行
+
+    * ワーカーの待機はスレッドで行い、各ジョブはランチャーで実行する
+    * callback は呼び出し元のスレッドから呼ばれる
+
+    Args:
+        jobs(list[dict]): ジョブリスト
+        launcher(Callable): launcher(job) -> returncode
+        max_workers(int, optional): 同時実行数. None の場合は CPU数 (最大4)
+        retries(int): 失敗時のリトライ回数
+        callback(Callable, optional): callback(done, total, JobResult) で進捗を通知
+        cancel_event(threading.Event, optional): セットすると未実行のジョブをキャンセル
+
+    Returns:
+        list[JobResult]: ジョブ順の実行結果
+    """
+    if max_workers is None:
+        max_workers = min(4, os.cpu_count() or 1)
+
+    _total = len(jobs)
+    _results = [None] * _total
+
+    if not jobs:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix='mdk_worker') as _executor:
+        _futures = {
+            _executor.submit(run_job, _job, launcher, retries, cancel_event): _index
+            for _index, _job in enumerate(jobs)
+        }
+
+        for _done, _future in enumerate(concurrent.futures.as_completed(_futures), 1):
+            _result = _future.result()
+            _results[_futures[_future]] = _result
+
+            if callback:
+                callback(_done, _total, _result)
+
+    return _results
+
+
+def submit_jobs(
+            jobs: list[dict],
+            launcher,
+            max_workers: int = None,
+            retries: int = DEFAULT_RETRIES,
+            callback=None,
+            name: str = '',
+            timings: dict = None) -> JobHandle:
+    """ 複数ジョブをバックグラウンドで実行してすぐに戻る
+
+    * run_jobs() をバックグラウンドスレッドで実行する
+    * callback はバックグラウンドスレッドから呼ばれる (DCC の API は呼ばない)
+
+    Args:
+        jobs(list[dict]): ジョブリスト
+        launcher(Callable): launcher(job) -> returncode | (returncode, ログ)
+        name(str): ハンドルの名前 (表示用)
+        timings(dict, optional): ハンドルの timings に追加する時間 ({'snapshot': 秒} など)
+
+    Returns:
+        JobHandle: 状態, ログ, 時間を持つハンドル
+    """
+    _handle = JobHandle(jobs, name=name, timings=timings)
+    _handle.future.set_running_or_notify_cancel()
+    _indices = {id(_job): _index for _index, _job in enumerate(_handle.jobs)}
+
+    def _callback(done: int, total: int, result: JobResult):
+        _handle.results[_indices[id(result.job)]] = result
+
+        if callback:
+            callback(done, total, result)
+
+    def _run():
+        try:
+            _results = run_jobs(
+                _handle.jobs,
+                launcher,
+                max_workers=max_workers,
+                retries=retries,
+                callback=_callback,
+                cancel_event=_handle.cancel_event,
+            )
+
+        except BaseException as ex:
+            _handle.finished = time.perf_counter()
+            _handle.future.set_exception(ex)
+            return
+
+        _handle.results = _results
+        _handle.finished = time.perf_counter()
+        _handle.future.set_result(_results)
+
+    threading.Thread(target=_run, name=f'mdk_jobs_{name}', daemon=True).start()
+
+    return _handle